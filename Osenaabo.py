@@ -11,10 +11,9 @@ import base64
 from io import BytesIO
 import threading
 import time
-import tempfile
 import traceback
 from tkinter import messagebox
-from datetime import datetime, time as dt_time, timezone, date, timedelta
+from datetime import datetime, time as dt_time, timezone, timedelta
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 import customtkinter as ctk
@@ -71,6 +70,15 @@ except ImportError as e:
             return [0] * (args[0] if args else 1)
         uint8 = int
 
+# Global input listeners for click-drag calibration
+try:
+    from pynput import mouse as pynput_mouse, keyboard as pynput_keyboard
+    PYNPUT_AVAILABLE = True
+except Exception as e:
+    pynput_mouse = pynput_keyboard = None
+    PYNPUT_AVAILABLE = False
+    print(f"⚠️ pynput not available - calibration uses countdown capture: {e}")
+
 # Platform detection
 IS_MAC = platform.system() == 'Darwin'
 IS_WINDOWS = platform.system() == 'Windows'
@@ -134,21 +142,8 @@ def get_hardware_fingerprint():
 # ---------------------------
 # Data Directory Management
 # ---------------------------
-def get_data_directory():
-    """Get a writable data directory - ALWAYS use AppData for installed apps"""
-    try:
-        # Always use AppData for installed applications
-        appdata_dir = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~')), 'Osenaabo')
-        os.makedirs(appdata_dir, exist_ok=True)
-        print(f"Using AppData directory: {appdata_dir}")
-        return appdata_dir
-    except Exception as e:
-        print(f"Error getting data directory: {e}")
-        # Emergency fallback to temp directory
-        temp_dir = os.path.join(tempfile.gettempdir(), 'Osenaabo')
-        os.makedirs(temp_dir, exist_ok=True)
-        print(f"Using temp directory as fallback: {temp_dir}")
-        return temp_dir
+# One data directory and session store, shared with the headless engine
+from osenaabo_core import get_data_directory, load_today_session
 
 # ---------------------------
 # Resource Extraction
@@ -159,6 +154,17 @@ def get_resource_path(relative_path):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.dirname(__file__), relative_path)
 
+from osenaabo_logging import (LogSink, LOG_DRAIN_INTERVAL_MS, LOG_DRAIN_BATCH, MAX_LOG_VIEW_LINES,
+                              setup_file_logging, search_log_files)
+from osenaabo_viewmodel import StatusViewModel
+from osenaabo_assets import AssetCache
+from osenaabo_audio import AudioService
+from osenaabo_telegram import TelegramNotifier, TelegramDigest, DEFAULT_DIGEST_WINDOW
+from osenaabo_metrics import (REGISTRY, MetricsExporter, status_collector, QUEUE_DEPTH, SKIPPED_FRAMES,
+                              PERSIST_SECONDS)
+from osenaabo_diagnostics import MemoryDiagnostics
+from osenaabo_engine import BotEngine
+
 # Import the core wrapper
 try:
     import osenaabo_core 
@@ -166,6 +172,41 @@ except ImportError:
     print("osenaabo_core not found - core functionality disabled")
     osenaabo_core = None
 
+# Import the Monte Carlo risk simulator
+try:
+    import osenaabo_simulator
+except ImportError:
+    print("osenaabo_simulator not found - risk simulation disabled")
+    osenaabo_simulator = None
+
+# Import calibration drift detection (needs OpenCV)
+try:
+    from osenaabo_anchor import make_anchor
+except ImportError:
+    print("osenaabo_anchor not available - drift detection disabled")
+    make_anchor = None
+
+# Import the pooled capture frame buffers
+try:
+    from osenaabo_buffers import FramePool
+except ImportError:
+    print("osenaabo_buffers not found - capture frames allocated per grab")
+    FramePool = None
+
+# Import the calibration profile store
+try:
+    from osenaabo_profiles import ProfileStore
+except ImportError:
+    print("osenaabo_profiles not found - single global calibration")
+    ProfileStore = None
+
+# Import template-matching auto-calibration (needs OpenCV)
+try:
+    import osenaabo_autocalib
+except ImportError:
+    print("osenaabo_autocalib not available - auto calibration disabled")
+    osenaabo_autocalib = None
+
 # ======== FIXED LICENSE MANAGER IMPORT ========
 import sys
 import os
@@ -367,6 +408,12 @@ ASSETS_DIR = os.path.join(get_data_directory(), "assets")
 CLAP_SOUND = os.path.join(ASSETS_DIR, "clap.wav")
 FOUND_SOUND = os.path.join(ASSETS_DIR, "found.wav")
 SESSIONS_DIR = os.path.join(get_data_directory(), "sessions")
+PROFILES_DIR = os.path.join(get_data_directory(), "profiles")
+LOGS_DIR = os.path.join(get_data_directory(), "logs")
+
+# Decoded and pre-resized images, persisted under assets/cache
+ASSET_CACHE = AssetCache(os.path.join(ASSETS_DIR, "cache"))
+ASSET_CACHE.register_base64("logo", BASE64_LOGO)
 
 # Platform URL configuration
 PLATFORM_URLS = {
@@ -396,7 +443,7 @@ def save_license_json(data):
         return False
 
 def save_config_json(data):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+    with PERSIST_SECONDS.time(kind="config"), open(CONFIG_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
 
 def load_config_json():
@@ -472,7 +519,7 @@ def format_betting_hours(hours_str):
         
         if hours_str.startswith("Today: "):
             hours_str = hours_str[len("Today: "):]
-        ranges = hours_str.split("; ")
+        ranges = re.split(r"\s*[|;,]\s*", hours_str.strip())
         if not ranges or ranges == [""]:
             return "Not available"
         
@@ -480,7 +527,7 @@ def format_betting_hours(hours_str):
         for time_range in ranges:
             if not time_range or "-" not in time_range:
                 continue
-            start, end = time_range.split(" - ")
+            start, end = re.split(r"\s*-\s*", time_range, maxsplit=1)
             def to_am_pm(time_str):
                 try:
                     dt = datetime.strptime(time_str.strip(), "%H:%M")
@@ -502,51 +549,6 @@ def format_betting_hours(hours_str):
     except Exception:
         return "Not available"
 
-def get_today_session_file():
-    """Get today's session file path"""
-    today = date.today().isoformat()
-    sessions_dir = os.path.join(get_data_directory(), "sessions")
-    os.makedirs(sessions_dir, exist_ok=True)
-    return os.path.join(sessions_dir, f"session_{today}.json")
-
-def load_today_session():
-    """Load today's session data"""
-    session_file = get_today_session_file()
-    if not os.path.exists(session_file):
-        return {"sessions": [], "target_reached": False}
-    
-    try:
-        with open(session_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {"sessions": [], "target_reached": False}
-
-def save_today_session(session_data):
-    """Save today's session data"""
-    session_file = get_today_session_file()
-    try:
-        with open(session_file, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, indent=2)
-    except Exception:
-        pass
-
-def add_session_record(profit, capital_after, target_reached=False):
-    """Add a session record to today's sessions"""
-    session_data = load_today_session()
-    session_record = {
-        "timestamp": datetime.now().isoformat(),
-        "profit": profit,
-        "capital_after": capital_after,
-        "target_reached": target_reached
-    }
-    session_data["sessions"].append(session_record)
-    
-    if target_reached:
-        session_data["target_reached"] = True
-    
-    save_today_session(session_data)
-    return session_data
-
 def check_session_continuation():
     """Check if we should continue from previous session or start fresh"""
     session_data = load_today_session()
@@ -571,30 +573,11 @@ def check_session_continuation():
     return "fresh"
 
 def is_within_betting_hours():
-    """Check if current time is within betting hours"""
+    """Check if current time is within betting hours (compiled schedule in osenaabo_core)"""
     try:
         if osenaabo_core:
-            hours_str = osenaabo_core.get_betting_hours()
-        else:
-            hours_str = "09:00-12:00, 14:00-17:00, 19:00-22:00"
-            
-        if not hours_str or hours_str == "Not available":
-            return True
-            
-        current_time = datetime.now().time()
-        time_ranges = hours_str.split(', ')
-        
-        for time_range in time_ranges:
-            start_str, end_str = time_range.split('-')
-            start_hour, start_min = map(int, start_str.split(':'))
-            end_hour, end_min = map(int, end_str.split(':'))
-            
-            start_time = dt_time(start_hour, start_min)
-            end_time = dt_time(end_hour, end_min)
-            
-            if start_time <= current_time <= end_time:
-                return True
-        return False
+            return osenaabo_core.is_within_betting_hours()
+        return True
     except Exception:
         return True
 
@@ -872,6 +855,10 @@ class LicenseUpdateDialog(ctk.CTkToplevel):
 class CalibrationWizard(ctk.CTkToplevel):
     """GUI-driven calibration wizard."""
 
+    POINTER_POLL_MS = 16  # ~display refresh rate
+    MIN_DRAG_PIXELS = 4
+    MARK_KEY = "f8"
+
     REQUIRED_REGIONS = [
         "Block1_AutoToggle",
         "Block1_StakeInput",
@@ -886,10 +873,11 @@ class CalibrationWizard(ctk.CTkToplevel):
         "Block1_History"
     ]
 
-    def __init__(self, parent, block2_enabled=True, on_complete=None):
+    def __init__(self, parent, block2_enabled=True, on_complete=None, platform=None):
         super().__init__(parent)
         self.parent = parent
         self.on_complete = on_complete
+        self.platform = platform
         self.title("Calibration Wizard")
         self.geometry("720x480")
         self.resizable(True, True)
@@ -901,10 +889,23 @@ class CalibrationWizard(ctk.CTkToplevel):
         self._build_ui()
         self.step = 0
         self.current_region = None
+        self._step_widgets = []     # per-step entry/button widgets, destroyed when the step is left
+        self._region_queue = None   # regions still to capture after auto calibration
         self.recording_tl = None
         self.recording_br = None
+        # Written by the pynput listener threads, consumed by _poll_pointer on the Tk thread
+        self._pointer = None
+        self._drag_start = None
+        self._pending_drag = None
+        self._pending_mark = False
+        self._own_bbox = None
+        self._shown_pointer = None
+        self._mouse_listener = None
+        self._keyboard_listener = None
+        self._start_input_listeners()
         self._render_step()
         self.bind("<Return>", self._on_enter_key)
+        self.after(self.POINTER_POLL_MS, self._poll_pointer)
 
     def _build_ui(self):
         self.logbox = ctk.CTkTextbox(self, height=300)
@@ -933,15 +934,118 @@ class CalibrationWizard(ctk.CTkToplevel):
         self.br_calibrate_btn = ctk.CTkButton(br_frame, text="Calibrate", width=80, command=self._capture_br)
         self.br_calibrate_btn.pack(side="left", padx=(10, 5))
 
+        self.pointer_label = ctk.CTkLabel(self.coord_frame, text="Pointer: -", anchor="w")
+        self.pointer_label.pack(fill="x", padx=5, pady=(0, 5))
+
         btn_frame = ctk.CTkFrame(self)
         btn_frame.pack(fill="x", padx=12, pady=(0, 12))
         self.skip_btn = ctk.CTkButton(btn_frame, text="Skip", command=self._on_skip)
         self.skip_btn.pack(side="left", padx=(0, 6))
         self.next_btn = ctk.CTkButton(btn_frame, text="Next", command=self._on_next)
         self.next_btn.pack(side="left", padx=(0, 6))
+        self.auto_btn = ctk.CTkButton(btn_frame, text="Auto Calibrate", command=self._on_auto_calibrate,
+                                      state="normal" if (osenaabo_autocalib and self.platform) else "disabled")
+        self.auto_btn.pack(side="left", padx=(0, 6))
         self.finish_btn = ctk.CTkButton(btn_frame, text="Finish", command=self._on_finish, state="disabled")
         self.finish_btn.pack(side="right")
 
+    # ---- click-drag capture ----
+    def _start_input_listeners(self):
+        if not PYNPUT_AVAILABLE:
+            return
+        try:
+            self._mouse_listener = pynput_mouse.Listener(on_move=self._on_pointer_move, on_click=self._on_pointer_click)
+            self._mouse_listener.start()
+            self._keyboard_listener = pynput_keyboard.Listener(on_press=self._on_key_press)
+            self._keyboard_listener.start()
+        except Exception as e:
+            print(f"Input listeners unavailable - using countdown capture: {e}")
+            self._stop_input_listeners()
+
+    def _stop_input_listeners(self):
+        for listener in (self._mouse_listener, self._keyboard_listener):
+            if listener:
+                try:
+                    listener.stop()
+                except Exception:
+                    pass
+        self._mouse_listener = None
+        self._keyboard_listener = None
+
+    def _inside_wizard(self, x, y):
+        bbox = self._own_bbox
+        return bbox is not None and bbox[0] <= x < bbox[2] and bbox[1] <= y < bbox[3]
+
+    def _on_pointer_move(self, x, y):
+        self._pointer = (int(x), int(y))
+
+    def _on_pointer_click(self, x, y, button, pressed):
+        if button != pynput_mouse.Button.left or not self.current_region:
+            return
+        if pressed:
+            self._drag_start = None if self._inside_wizard(x, y) else (int(x), int(y))
+        elif self._drag_start:
+            start, self._drag_start = self._drag_start, None
+            if abs(x - start[0]) >= self.MIN_DRAG_PIXELS and abs(y - start[1]) >= self.MIN_DRAG_PIXELS:
+                self._pending_drag = (start, (int(x), int(y)))
+
+    def _on_key_press(self, key):
+        if key == getattr(pynput_keyboard.Key, self.MARK_KEY, None) and self.current_region:
+            self._pending_mark = True
+
+    def _poll_pointer(self):
+        """Live pointer readout and hand-off of listener events to the Tk thread"""
+        try:
+            if not self.winfo_exists():
+                return
+            self._own_bbox = (self.winfo_rootx(), self.winfo_rooty(),
+                              self.winfo_rootx() + self.winfo_width(), self.winfo_rooty() + self.winfo_height())
+            pointer = self._pointer if self._mouse_listener else tuple(pyautogui.position())
+            if pointer and pointer != self._shown_pointer:
+                self._shown_pointer = pointer
+                self.pointer_label.configure(text=f"Pointer: ({pointer[0]}, {pointer[1]})")
+
+            if self._pending_drag and self.current_region:
+                (x1, y1), (x2, y2) = self._pending_drag
+                self._pending_drag = None
+                self.recording_tl = None
+                self.recording_br = None
+                self._set_point("tl", x1, y1)
+                self._set_point("br", x2, y2)
+            elif self._pending_mark and pointer and self.current_region:
+                self._pending_mark = False
+                self._set_point("br" if self.recording_tl else "tl", *pointer)
+        except tk.TclError:
+            return
+        self.after(self.POINTER_POLL_MS, self._poll_pointer)
+
+    def _set_point(self, capture_type, x, y):
+        pos = pyautogui.Point(int(x), int(y))
+        if capture_type == "tl":
+            self.tl_x_entry.delete(0, "end")
+            self.tl_x_entry.insert(0, str(pos.x))
+            self.tl_y_entry.delete(0, "end")
+            self.tl_y_entry.insert(0, str(pos.y))
+            self.recording_tl = pos
+            self._append_log(f"Top-Left captured at ({pos.x}, {pos.y})")
+        else:
+            self.br_x_entry.delete(0, "end")
+            self.br_x_entry.insert(0, str(pos.x))
+            self.br_y_entry.delete(0, "end")
+            self.br_y_entry.insert(0, str(pos.y))
+            self.recording_br = pos
+            self._append_log(f"Bottom-Right captured at ({pos.x}, {pos.y})")
+            self._calculate_region()
+
+    def _capture_prompt(self):
+        if self._mouse_listener:
+            return f"Drag over the region from TOP-LEFT to BOTTOM-RIGHT (or press {self.MARK_KEY.upper()} at each corner)."
+        return "Move mouse to TOP-LEFT and press ENTER."
+
+    def destroy(self):
+        self._stop_input_listeners()
+        super().destroy()
+
     def _capture_tl(self):
         self._append_log("Capturing Top-Left in 5 seconds...")
         self.tl_calibrate_btn.configure(state="disabled", text="5...")
@@ -959,21 +1063,7 @@ class CalibrationWizard(ctk.CTkToplevel):
         else:
             getattr(self, f"{capture_type}_calibrate_btn").configure(text="Calibrate", state="normal")
             pos = pyautogui.position()
-            if capture_type == "tl":
-                self.tl_x_entry.delete(0, "end")
-                self.tl_x_entry.insert(0, str(pos.x))
-                self.tl_y_entry.delete(0, "end")
-                self.tl_y_entry.insert(0, str(pos.y))
-                self.recording_tl = pos
-                self._append_log(f"Top-Left captured at ({pos.x}, {pos.y})")
-            else:
-                self.br_x_entry.delete(0, "end")
-                self.br_x_entry.insert(0, str(pos.x))
-                self.br_y_entry.delete(0, "end")
-                self.br_y_entry.insert(0, str(pos.y))
-                self.recording_br = pos
-                self._append_log(f"Bottom-Right captured at ({pos.x}, {pos.y})")
-                self._calculate_region()
+            self._set_point(capture_type, pos.x, pos.y)
 
     def _calculate_region(self):
         if self.recording_tl and self.recording_br and self.current_region:
@@ -1029,6 +1119,7 @@ class CalibrationWizard(ctk.CTkToplevel):
                     
             submit_btn = ctk.CTkButton(self, text="Submit", command=submit_prestart)
             submit_btn.pack(pady=12)
+            self._step_widgets = [up_entry, down_entry, submit_btn]
             
             def cleanup_and_submit():
                 up_entry.destroy()
@@ -1044,7 +1135,7 @@ class CalibrationWizard(ctk.CTkToplevel):
             
             def yes():
                 self.current_region = "Game_Activation"
-                self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+                self._append_log(self._capture_prompt())
                 for widget in self.winfo_children():
                     if isinstance(widget, ctk.CTkButton) and widget.winfo_y() > 300:
                         widget.destroy()
@@ -1060,6 +1151,7 @@ class CalibrationWizard(ctk.CTkToplevel):
             yes_btn.pack(side="left", padx=6)
             no_btn = ctk.CTkButton(self, text="No", command=no)
             no_btn.pack(side="left", padx=6)
+            self._step_widgets = [yes_btn, no_btn]
             
         elif self.step == 2:
             self._append_log("Step 3: Close Chat Window (optional)")
@@ -1067,7 +1159,7 @@ class CalibrationWizard(ctk.CTkToplevel):
             
             def yes():
                 self.current_region = "Close_Chat_Window"
-                self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+                self._append_log(self._capture_prompt())
                 for widget in self.winfo_children():
                     if isinstance(widget, ctk.CTkButton) and widget.winfo_y() > 300:
                         widget.destroy()
@@ -1083,6 +1175,7 @@ class CalibrationWizard(ctk.CTkToplevel):
             yes_btn.pack(side="left", padx=6)
             no_btn = ctk.CTkButton(self, text="No", command=no)
             no_btn.pack(side="left", padx=6)
+            self._step_widgets = [yes_btn, no_btn]
             
         elif self.step == 3:
             self._append_log("Step 4: Block 1 Regions")
@@ -1112,34 +1205,55 @@ class CalibrationWizard(ctk.CTkToplevel):
         self.step = 4
         self.current_region = "Block1_AutoToggle"
         self._append_log("Capture Block1_AutoToggle region:")
-        self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+        self._append_log(self._capture_prompt())
         self.next_btn.configure(state="disabled")
 
     def _start_block2(self):
         self.step = 5
         self.current_region = "Block2_AutoToggle"
         self._append_log("Capture Block2_AutoToggle region:")
-        self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+        self._append_log(self._capture_prompt())
         self.next_btn.configure(state="disabled")
 
     def _start_history(self):
         self.step = 6
         self.current_region = "Block1_History"
         self._append_log("Capture Block1_History region:")
-        self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+        self._append_log(self._capture_prompt())
         self.next_btn.configure(state="disabled")
 
+    def _required_regions(self):
+        if self.block2_enabled:
+            return list(self.REQUIRED_REGIONS)
+        return [r for r in self.REQUIRED_REGIONS if not r.startswith("Block2")]
+
+    def _clear_step_widgets(self):
+        for widget in self._step_widgets:
+            if widget.winfo_exists():
+                widget.destroy()
+        self._step_widgets = []
+
     def _advance_region(self):
-        regions = self.REQUIRED_REGIONS.copy()
-        if not self.block2_enabled:
-            regions = [r for r in regions if not r.startswith("Block2")]
+        regions = self._required_regions()
+        if self._region_queue is not None:
+            # Auto calibration left only these regions to capture
+            if self._region_queue:
+                self.current_region = self._region_queue.pop(0)
+                self._append_log(f"Capture {self.current_region} region:")
+                self._append_log(self._capture_prompt())
+            else:
+                self._region_queue = None
+                self.current_region = None
+                self.step = 6
+                self._render_step()
+            return
             
         if self.current_region in regions:
             idx = regions.index(self.current_region)
             if idx + 1 < len(regions):
                 self.current_region = regions[idx + 1]
                 self._append_log(f"Capture {self.current_region} region:")
-                self._append_log("Move mouse to TOP-LEFT and press ENTER.")
+                self._append_log(self._capture_prompt())
             else:
                 self.current_region = None
                 self.step = 6
@@ -1180,7 +1294,124 @@ class CalibrationWizard(ctk.CTkToplevel):
         elif self.step == 6:
             self._on_finish()
 
+    def _template_dir(self):
+        return osenaabo_autocalib.get_template_dir(ASSETS_DIR, self.platform)
+
+    def _grab_screen(self):
+        """Full-screen capture with the wizard hidden; returns (image, pixels per calibration unit)"""
+        self.withdraw()
+        self.update()
+        time.sleep(0.3)
+        try:
+            screenshot = pyautogui.screenshot()
+        finally:
+            self.deiconify()
+        logical_width = pyautogui.size()[0]
+        return screenshot, (screenshot.width / logical_width if logical_width else 1.0)
+
+    def _on_auto_calibrate(self):
+        """Locate every region from the platform's reference templates"""
+        if not osenaabo_autocalib or not self.platform:
+            return
+        templates = osenaabo_autocalib.load_templates(self._template_dir())
+        offsets = osenaabo_autocalib.load_offsets(self._template_dir())
+        if not templates:
+            self._append_log(f"No reference templates for {self.platform} yet - "
+                             "calibrate manually once and they will be saved on Finish.")
+            return
+        self.auto_btn.configure(state="disabled", text="Searching...")
+        try:
+            screenshot, pixel_scale = self._grab_screen()
+        except Exception as e:
+            self._append_log(f"Screen capture failed: {e}")
+            self.auto_btn.configure(state="normal", text="Auto Calibrate")
+            return
+
+        def worker():
+            try:
+                proposals = osenaabo_autocalib.locate_regions(screenshot, templates, pixel_scale=pixel_scale,
+                                                              offsets=offsets)
+                error = None
+            except Exception as e:
+                proposals, error = {}, e
+            self.after(0, lambda: self._confirm_auto_calibration(proposals, templates, error))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _confirm_auto_calibration(self, proposals, templates, error=None):
+        self.auto_btn.configure(state="normal", text="Auto Calibrate")
+        if error:
+            self._append_log(f"Auto calibration failed: {error}")
+            return
+        missing = [name for name in templates if name not in proposals]
+        for name, match in proposals.items():
+            found = f"placed from {match['anchor']}" if match.get("anchor") else f"score {match['score']:.2f}"
+            self._append_log(f"Found {name} -> ({match['x']},{match['y']},{match['width']},{match['height']}) "
+                             f"{found}")
+        for name in missing:
+            self._append_log(f"Not found: {name}")
+        if not proposals:
+            self._append_log("No regions matched - is the game visible at its usual size?")
+            return
+
+        summary = "\n".join(f"{name}: ({m['x']}, {m['y']}, {m['width']}x{m['height']})"
+                            for name, m in proposals.items())
+        if not messagebox.askyesno("Auto Calibration",
+                                   f"Use these {len(proposals)} detected regions?\n\n{summary}", parent=self):
+            self._append_log("Auto calibration discarded")
+            return
+
+        # Leave the prestart/optional steps the way Submit/No would have
+        self._clear_step_widgets()
+        self.coords.setdefault("Prestart_Flow", [])
+        self.coords.update(osenaabo_autocalib.proposals_to_coords(proposals))
+        remaining = [name for name in self._required_regions() if name not in self.coords]
+        if remaining:
+            self.step = 5
+            self.next_btn.configure(state="disabled")
+            self._append_log(f"Capture the {len(remaining)} region(s) auto calibration could not place "
+                             "(their offsets are saved for next time when you Finish):")
+            self._region_queue = remaining
+            self._advance_region()
+        else:
+            self.current_region = None
+            self.step = 6
+            self._render_step()
+
+    def _save_reference_templates(self, screenshot, pixel_scale):
+        """Crop every calibrated region from a clean capture for future auto calibration"""
+        if not osenaabo_autocalib or not self.platform:
+            return
+        try:
+            saved = osenaabo_autocalib.save_region_templates(screenshot, self.coords, self._template_dir(),
+                                                             pixel_scale=pixel_scale)
+            self._append_log(f"Saved {saved} reference templates for {self.platform}")
+        except Exception as e:
+            self._append_log(f"Could not save reference templates: {e}")
+
+    def _save_anchor(self, screenshot, pixel_scale):
+        """Store a fingerprint patch next to the regions for drift detection"""
+        if not make_anchor:
+            return
+        try:
+            anchor = make_anchor(screenshot, self.coords, pixel_scale=pixel_scale)
+            if anchor:
+                self.coords.update(anchor)
+                box = anchor["Anchor"]
+                self._append_log(f"Drift anchor saved at ({box['x']},{box['y']})")
+            else:
+                self._append_log("No textured area found for a drift anchor")
+        except Exception as e:
+            self._append_log(f"Could not save drift anchor: {e}")
+
     def _on_finish(self):
+        if osenaabo_autocalib or make_anchor:
+            try:
+                screenshot, pixel_scale = self._grab_screen()
+                self._save_anchor(screenshot, pixel_scale)
+                self._save_reference_templates(screenshot, pixel_scale)
+            except Exception as e:
+                self._append_log(f"Screen capture failed: {e}")
         save_coords_json(self.coords)
         self._append_log("Calibration saved!")
         if self.on_complete:
@@ -1196,6 +1427,7 @@ class CalibrationWizard(ctk.CTkToplevel):
 # ---------------------------
 class OsenaaboApp(ctk.CTk):
     def __init__(self):
+        self._init_started = time.perf_counter()
         super().__init__()
         
         # Basic window configuration
@@ -1212,22 +1444,41 @@ class OsenaaboApp(ctk.CTk):
         self.corner_radius = 20
         self.logo_img = load_inline_logo_image()
         self.calib_data = load_coords_json()
+        self.profiles = ProfileStore(PROFILES_DIR) if ProfileStore else None
+        self.profile_key = None
         self.stop_event = threading.Event()
         self.bot_thread = None
         self.block2_enabled = True
         self.mute_sounds = tk.BooleanVar(value=False)
         self.mute_notifications = tk.BooleanVar(value=False)
         
+        # Log lines queued by any thread, drained into log_textbox by the Tk thread
+        self.log_sink = LogSink()
+        self._reported_log_drops = 0
+        self.file_logger, self.log_listener = setup_file_logging(LOGS_DIR)
+        
+        # Status widget values, applied at a capped frame rate
+        self.view_model = StatusViewModel()
+        self._status_renderers = {}
+        
         # Initialize license status variable
         self.license_status_var = ctk.StringVar(value="⚠️ No valid license")
         
         # Session management
         self.current_session_type = "fresh"
-        self.session_start_capital = 0
+        
+        # Engine driven by the bot thread (kept after a run for its status and history)
+        self.engine = None
         
         # Configuration panel visibility state
         self.config_panel_visible = True
         
+        # Secondary sections are built on idle after first paint
+        # (set OSENAABO_EAGER_UI=1 to build everything up front for comparison)
+        self.eager_ui = os.environ.get("OSENAABO_EAGER_UI") == "1"
+        self.telegram_section_built = False
+        self.hardware_id = None
+        
         # Platform selection
         self.platform_var = ctk.StringVar(value="SportyBetNg")
         self.platform_enabled = False
@@ -1241,26 +1492,46 @@ class OsenaaboApp(ctk.CTk):
         self.trading_started = False
         self.capital_locked = False
         
-        # Session cookies management
-        self.session_cookies = {}
-        
         # Telegram notification settings
         self.telegram_enabled = tk.BooleanVar(value=False)
         self.bot_token = tk.StringVar(value="")
         self.chat_id = tk.StringVar(value="")
-        
-        # Initialize pygame mixer if available
-        if PYGAME_AVAILABLE and pygame:
-            try:
-                pygame.mixer.init()
-            except:
-                pass
+        # Plain-attribute copy of the notification settings, kept current by
+        # Tk variable traces, so notify() never touches Tk off the Tk thread
+        self._notify_settings = (False, False, "", "")
+        for var in (self.mute_notifications, self.telegram_enabled, self.bot_token, self.chat_id):
+            var.trace_add("write", self._sync_notify_settings)
+        self._sounds_muted = False
+        self.mute_sounds.trace_add("write", self._sync_notify_settings)
+        self.telegram_notifier = TelegramNotifier()
+        self.telegram_digest_enabled = tk.BooleanVar(value=True)
+        self.telegram_digest = TelegramDigest(self.notify, DEFAULT_DIGEST_WINDOW)
+        
+        # Audio service: sounds decoded once, played off the calling thread
+        self.audio = AudioService({"clap": CLAP_SOUND, "found": FOUND_SOUND})
+        self.audio.start()
+
+        # Prometheus metrics: logs/osenaabo.prom, plus 127.0.0.1:<metrics.port> when configured
+        REGISTRY.add_collector(status_collector(self._bot_status))
+        REGISTRY.add_collector(self._collect_metrics)
+        self.metrics_exporter = MetricsExporter.from_config(load_config_json(), LOGS_DIR).start()
+
+        # Capture frames reuse a fixed set of buffers; memory diagnostics are opt-in
+        self.frame_pool = FramePool() if FramePool else None
+        self.diagnostics = MemoryDiagnostics.from_config(load_config_json(), LOGS_DIR,
+                                                         extra_stats=self._diagnostic_stats)
+        if self.diagnostics:
+            self.diagnostics.start()
                 
         self._build_ui()
         self._refresh_license_ui()
         self._update_betting_hours()
         self._load_daily_target()
         self._load_platform_selection()
+        self._activate_profile(self.platform_var.get())
+        self.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_sink)
+        self.after(self.view_model.interval_ms, self._render_status)
+        self.after_idle(self._build_deferred_sections)
 
     def _center_window(self):
         """Center the window on the screen"""
@@ -1300,6 +1571,37 @@ class OsenaaboApp(ctk.CTk):
         self.platform_var.set(platform)
         self.previous_platform = platform
 
+    def _activate_profile(self, platform):
+        """Switch to the calibration profile for this platform and screen layout"""
+        if not self.profiles:
+            return
+        key, coords = self.profiles.select(platform)
+        if coords is None:
+            if not self.profiles.list_profiles() and self.calib_data:
+                # First run with profiles: adopt the existing calibration
+                self.profile_key = self.profiles.save(platform, self.calib_data)
+                self._log(f"Existing calibration saved as profile {self.profile_key}")
+            else:
+                # Never drive this platform with another platform's regions
+                self.profile_key = None
+                self.calib_data = {}
+                self._log(f"No calibration profile for {key} - run Calibrate for this platform/screen")
+            self._update_start_button()
+            return
+        if key == self.profile_key:
+            return
+        self.profile_key = key
+        self.calib_data = coords
+        save_coords_json(coords)
+        self._log(f"Calibration profile loaded: {key}")
+        self._update_start_button()
+
+    def _update_start_button(self):
+        """Start needs a valid license and a calibration for the selected platform"""
+        license_data = load_license_json()
+        ready = bool(license_data and license_data.get("valid")) and bool(self.calib_data)
+        self.start_btn.configure(state="normal" if ready else "disabled")
+
     def _build_ui(self):
         # Header frame
         header_frame = ctk.CTkFrame(self, height=70, corner_radius=self.corner_radius)
@@ -1362,6 +1664,18 @@ class OsenaaboApp(ctk.CTk):
                                             wraplength=350)
         self.stop_loss_warning.pack(fill="x", padx=12, pady=(0, 12))
         
+        # Monte Carlo risk estimate for the capital / stop loss above
+        self.simulate_risk_btn = ctk.CTkButton(self.config_scrollable, text="Simulate Risk",
+                                             command=self._simulate_risk,
+                                             state="normal" if osenaabo_simulator else "disabled")
+        self.simulate_risk_btn.pack(fill="x", padx=12, pady=(0, 5))
+        
+        self.risk_label = ctk.CTkLabel(self.config_scrollable, text="",
+                                     font=ctk.CTkFont(size=12),
+                                     anchor="w", justify="left",
+                                     wraplength=350)
+        self.risk_label.pack(fill="x", padx=12, pady=(0, 12))
+        
         self.block2_var = tk.BooleanVar(value=True)
         block2_cb = ctk.CTkCheckBox(self.config_scrollable, text="Enable Block 2 (higher risk)", 
                                    variable=self.block2_var, command=self._on_block2_toggle)
@@ -1407,8 +1721,11 @@ class OsenaaboApp(ctk.CTk):
                                     state="disabled")
         self.stop_btn.pack(fill="x", padx=12, pady=(0, 12))
         
-        # Add Telegram Notification Section
-        self._build_telegram_section()
+        # Telegram Notification Section (filled in by _ensure_telegram_section)
+        self.telegram_container = ctk.CTkFrame(self.config_scrollable, fg_color="transparent")
+        self.telegram_container.pack(fill="x")
+        if self.eager_ui:
+            self._ensure_telegram_section()
 
         # Status & Info panel
         self.status_panel = ctk.CTkFrame(self.main_frame, corner_radius=self.corner_radius)
@@ -1474,14 +1791,16 @@ class OsenaaboApp(ctk.CTk):
         
         ctk.CTkLabel(hardware_frame, text="Computer ID:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=12, pady=(8, 0))
         
-        hardware_id = get_hardware_fingerprint()
-        self.hardware_label = ctk.CTkLabel(hardware_frame, text=hardware_id, 
+        self.hardware_label = ctk.CTkLabel(hardware_frame, text="Loading...", 
                                   font=ctk.CTkFont(family="Courier", size=11),
                                   text_color="lightblue")
         self.hardware_label.pack(anchor="w", padx=12, pady=(0, 8))
+        if self.eager_ui:
+            self._load_hardware_id()
         
         # Add copy hardware ID button
         def copy_hardware_id():
+            hardware_id = self._load_hardware_id()
             self.clipboard_clear()
             self.clipboard_append(hardware_id)
             messagebox.showinfo("Copied", f"Computer ID copied to clipboard:\n{hardware_id}")
@@ -1499,19 +1818,62 @@ class OsenaaboApp(ctk.CTk):
         
         ctk.CTkLabel(log_frame, text="Activity Log:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=12, pady=(8, 0))
         
+        # Search across the rotated log files in logs/
+        log_search_frame = ctk.CTkFrame(log_frame, fg_color="transparent")
+        log_search_frame.pack(fill="x", padx=12, pady=(4, 4))
+        
+        self.log_search_entry = ctk.CTkEntry(log_search_frame, placeholder_text="Search log history...", height=28)
+        self.log_search_entry.pack(side="left", fill="x", expand=True, padx=(0, 6))
+        self.log_search_entry.bind("<Return>", lambda event: self._search_logs())
+        
+        self.log_search_btn = ctk.CTkButton(log_search_frame, text="Search", width=70, height=28,
+                                          command=self._search_logs)
+        self.log_search_btn.pack(side="right")
+        
         self.log_textbox = ctk.CTkTextbox(log_frame, wrap="word", state="disabled")
         self.log_textbox.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         
+        # Status widgets updated through the view model
+        self._status_renderers = {
+            "base_bet": lambda text: self.base_bet_label.configure(text=text),
+            "daily_target": lambda text: self.daily_target_label.configure(text=text),
+            "daily_target_reset": lambda state: self.daily_target_reset_btn.configure(state=state),
+            "trading_hours": lambda text: self.trading_hours_label.configure(text=text),
+        }
+        
         # Update initial displays
         self._update_base_bet_display()
         self._update_daily_target_display()
 
+    def _build_deferred_sections(self):
+        """Build secondary sections once the first frame has been painted"""
+        first_paint_ms = (time.perf_counter() - self._init_started) * 1000
+        self._ensure_telegram_section()
+        self._load_hardware_id()
+        interactive_ms = (time.perf_counter() - self._init_started) * 1000
+        mode = "eager" if self.eager_ui else "deferred"
+        self._log(f"Startup ({mode} UI): first paint {first_paint_ms:.0f}ms, "
+                  f"fully interactive {interactive_ms:.0f}ms")
+
+    def _load_hardware_id(self):
+        """Compute the hardware fingerprint once and show it"""
+        if self.hardware_id is None:
+            self.hardware_id = get_hardware_fingerprint()
+            self.hardware_label.configure(text=self.hardware_id)
+        return self.hardware_id
+
+    def _ensure_telegram_section(self):
+        """Build the Telegram section and load its settings on first use"""
+        if not self.telegram_section_built:
+            self.telegram_section_built = True
+            self._build_telegram_section()
+
     def _build_telegram_section(self):
         """Build Telegram notification configuration section"""
-        separator = ctk.CTkFrame(self.config_scrollable, height=2, fg_color="gray")
+        separator = ctk.CTkFrame(self.telegram_container, height=2, fg_color="gray")
         separator.pack(fill="x", padx=12, pady=(10, 15))
     
-        telegram_frame = ctk.CTkFrame(self.config_scrollable)
+        telegram_frame = ctk.CTkFrame(self.telegram_container)
         telegram_frame.pack(fill="x", padx=12, pady=(0, 12))
     
         telegram_header = ctk.CTkFrame(telegram_frame, fg_color="transparent")
@@ -1552,6 +1914,11 @@ class OsenaaboApp(ctk.CTk):
                                         height=35)
         self.chat_id_entry.pack(fill="x", padx=12, pady=(0, 12))
         
+        self.telegram_digest_cb = ctk.CTkCheckBox(telegram_frame, text="Digest mode (summarise round events)",
+                                                variable=self.telegram_digest_enabled,
+                                                command=self._on_telegram_digest_toggle)
+        self.telegram_digest_cb.pack(anchor="w", padx=12, pady=(0, 12))
+        
         test_btn = ctk.CTkButton(telegram_frame, 
                                text="Test Notification", 
                                command=self._test_telegram_notification,
@@ -1598,6 +1965,9 @@ Example:
             self.telegram_enabled.set(telegram_config.get("enabled", False))
             self.bot_token.set(telegram_config.get("bot_token", ""))
             self.chat_id.set(telegram_config.get("chat_id", ""))
+            self.telegram_digest_enabled.set(telegram_config.get("digest_enabled", True))
+            self.telegram_digest.configure(self.telegram_digest_enabled.get(),
+                                           telegram_config.get("digest_window", DEFAULT_DIGEST_WINDOW))
             
             if self.telegram_enabled.get():
                 self.bot_token_entry.configure(state="normal")
@@ -1606,13 +1976,22 @@ Example:
     def _save_telegram_settings(self):
         """Save telegram settings to config"""
         config = load_config_json()
-        config["telegram"] = {
+        telegram_config = config.get("telegram", {})
+        telegram_config.update({
             "enabled": self.telegram_enabled.get(),
             "bot_token": self.bot_token.get(),
-            "chat_id": self.chat_id.get()
-        }
+            "chat_id": self.chat_id.get(),
+            "digest_enabled": self.telegram_digest_enabled.get(),
+            "digest_window": telegram_config.get("digest_window", DEFAULT_DIGEST_WINDOW)
+        })
+        config["telegram"] = telegram_config
         save_config_json(config)
 
+    def _on_telegram_digest_toggle(self):
+        """Switch between digest summaries and one message per round event"""
+        self.telegram_digest.configure(self.telegram_digest_enabled.get(), self.telegram_digest.window)
+        self._save_telegram_settings()
+
     def _on_telegram_toggle(self):
         """Handle telegram notification toggle"""
         if not self.platform_enabled:
@@ -1645,92 +2024,61 @@ Example:
             return
         
         self._save_telegram_settings()
+        self.telegram_notifier.update_credentials(bot_token, chat_id)
         
-        try:
-            import requests
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-            payload = {
-                'chat_id': chat_id,
-                'text': '🔔 OSENAABO! Test Notification\n\nThis is a test message from your trading bot. If you receive this, your Telegram notifications are working correctly! ✅',
-                'parse_mode': 'HTML'
-            }
-            response = requests.post(url, data=payload, timeout=10)
-            
-            if response.status_code == 200:
-                messagebox.showinfo("Test Successful", "✅ Telegram test notification sent successfully!")
-                self._log("Telegram test notification sent successfully")
-            else:
-                error_msg = response.json().get('description', 'Unknown error')
-                messagebox.showerror("Test Failed", f"❌ Failed to send test notification:\n{error_msg}")
-                self._log(f"Telegram test failed: {error_msg}")
-                
-        except Exception as e:
-            messagebox.showerror("Test Failed", f"❌ Error sending test notification:\n{str(e)}")
-            self._log(f"Telegram test error: {str(e)}")
+        def on_delivered(success, description):
+            self.after(0, lambda: self._on_telegram_test_result(success, description))
+        
+        self.telegram_notifier.send(
+            '🔔 OSENAABO! Test Notification\n\nThis is a test message from your trading bot. If you receive this, your Telegram notifications are working correctly! ✅',
+            callback=on_delivered
+        )
+        self._log("Telegram test notification queued")
 
-    # ======== FIXED SOUND HANDLING ========
-    def play_sound(self, sound_type):
-        """Play sound with platform compatibility - FIXED with PYGAME_AVAILABLE check"""
-        if self.mute_sounds.get():
+    def _on_telegram_test_result(self, success, description):
+        """Report the outcome of a test notification on the Tk thread"""
+        if success:
+            messagebox.showinfo("Test Successful", "✅ Telegram test notification sent successfully!")
+            self._log("Telegram test notification sent successfully")
+        else:
+            messagebox.showerror("Test Failed", f"❌ Failed to send test notification:\n{description}")
+            self._log(f"Telegram test failed: {description}")
+
+    def record_round_result(self, won, profit_delta):
+        """Feed a finished round into the Telegram digest"""
+        self.telegram_digest.record_round(won, profit_delta)
+
+    def record_session(self, session_record):
+        """Report a session record saved by the engine via the digest"""
+        self.telegram_digest.record_session(session_record)
+        if session_record.get("target_reached"):
+            self.telegram_digest.urgent(f"Daily target reached! Capital: ₦{session_record['capital_after']:,.2f}")
+
+    def notify_stop_loss(self, capital, loss_percent):
+        """Stop-loss alerts skip the digest window"""
+        self.telegram_digest.urgent(f"Stop loss hit ({loss_percent:.2f}%). Capital: ₦{capital:,.2f}")
+
+    def _sync_notify_settings(self, *_):
+        """Copy the notification settings out of their Tk variables (Tk thread only)"""
+        self._sounds_muted = self.mute_sounds.get()
+        self._notify_settings = (self.mute_notifications.get(), self.telegram_enabled.get(),
+                                 self.bot_token.get().strip(), self.chat_id.get().strip())
+
+    def notify(self, text):
+        """Send a Telegram notification if enabled (safe from any thread: reads no Tk state)"""
+        muted, enabled, bot_token, chat_id = self._notify_settings
+        if muted or not enabled:
             return
-            
-        # ADD THIS CHECK:
-        if not PYGAME_AVAILABLE:
-            return  # Skip sound if pygame not available
-            
-        try:
-            # First try: Use existing .wav files with pygame (works on all platforms)
-            if pygame and pygame.mixer.get_init():
-                if sound_type == "clap" and os.path.exists(CLAP_SOUND):
-                    pygame.mixer.Sound(CLAP_SOUND).play()
-                    return
-                elif sound_type == "found" and os.path.exists(FOUND_SOUND):
-                    pygame.mixer.Sound(FOUND_SOUND).play()
-                    return
-                
-            # Second try: Platform-specific fallbacks ONLY if .wav files fail
-            self._play_fallback_sound(sound_type)
-            
-        except Exception as e:
-            print(f"Sound play failed: {e}")
-            self._play_fallback_sound(sound_type)
+        if bot_token and chat_id:
+            self.telegram_notifier.update_credentials(bot_token, chat_id)
+            self.telegram_notifier.send(text)
 
-    def _play_fallback_sound(self, sound_type):
-        """Platform-specific fallback sounds - only used if .wav files fail"""
-        try:
-            if IS_WINDOWS:
-                import winsound
-                if sound_type == "clap":
-                    winsound.Beep(800, 400)
-                elif sound_type == "found":
-                    winsound.Beep(1200, 300)
-                elif sound_type == "win":
-                    winsound.Beep(1000, 500)
-                elif sound_type == "loss":
-                    winsound.Beep(500, 300)
-                    
-            elif IS_MAC:
-                if sound_type == "clap":
-                    os.system('afplay /System/Library/Sounds/Submarine.aiff > /dev/null 2>&1')
-                elif sound_type == "found":
-                    os.system('afplay /System/Library/Sounds/Glass.aiff > /dev/null 2>&1')
-                elif sound_type == "win":
-                    os.system('afplay /System/Library/Sounds/Tink.aiff > /dev/null 2>&1')
-                elif sound_type == "loss":
-                    os.system('osascript -e "beep 1"')
-                    
-            elif IS_LINUX:
-                if sound_type == "clap":
-                    os.system('paplay /usr/share/sounds/ubuntu/stereo/button-pressed.ogg > /dev/null 2>&1')
-                elif sound_type == "found":
-                    os.system('paplay /usr/share/sounds/ubuntu/stereo/message.ogg > /dev/null 2>&1')
-                elif sound_type == "win":
-                    os.system('echo -e "\a\a"')
-                elif sound_type == "loss":
-                    os.system('echo -e "\a"')
-                    
-        except Exception as e:
-            print(f"Fallback sound failed: {e}")
+    # ======== SOUND HANDLING ========
+    def play_sound(self, sound_type):
+        """Queue a sound on the audio service (never blocks the caller or touches Tk)"""
+        if self._sounds_muted:
+            return
+        self.audio.play(sound_type)
 
     def _show_license_dialog(self):
         """Open license update dialog"""
@@ -1769,18 +2117,68 @@ Example:
         try:
             capital = float(self.capital_entry.get().replace(",", ""))
             base_bet = capital * 0.001
-            self.base_bet_label.configure(text=f"₦{base_bet:,.2f}")
+            self.view_model.publish("base_bet", f"₦{base_bet:,.2f}")
         except (ValueError, AttributeError):
-            self.base_bet_label.configure(text="₦0")
+            self.view_model.publish("base_bet", "₦0")
+
+    def _simulate_risk(self):
+        """Estimate risk of ruin and days to target for the current settings"""
+        try:
+            capital = float(self.capital_entry.get().replace(",", "") or 1000000)
+            stop_loss = float(self.stoploss_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numeric values for capital and stop loss")
+            return
+        
+        self.simulate_risk_btn.configure(state="disabled", text="Simulating...")
+        self.risk_label.configure(text="")
+        strategy = osenaabo_simulator.strategy_from_config(load_config_json(), self.block2_var.get())
+        
+        def worker():
+            try:
+                # Resample the recorded multipliers once there are enough of them
+                history = self.engine.multiplier_history if self.engine else None
+                sample = history.values() if history is not None else []
+                if len(sample) >= osenaabo_simulator.MIN_EMPIRICAL_SAMPLE:
+                    dist = {"distribution": "empirical", "sample": sample}
+                    source = f"{len(sample):,} recorded rounds"
+                else:
+                    dist = {"distribution": "crash"}
+                    source = "crash model"
+                result = osenaabo_simulator.run_simulation(stop_loss=stop_loss, **strategy, **dist)
+                summary = osenaabo_simulator.format_summary(result)
+                summary += f"\nMedian capital after {result['horizon_days']} days: ₦{capital * result['final_capital_median']:,.2f}"
+                block2 = f"Block 2 @ {strategy['cashout2']:g}x" if strategy["cashout2"] else "Block 2 off"
+                summary += f"\nBlock 1 @ {strategy['cashout']:g}x, {block2} - {source}"
+            except Exception as e:
+                summary = f"Simulation failed: {e}"
+            self.after(0, lambda: self._show_risk_result(summary))
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_risk_result(self, summary):
+        """Show simulation results next to the capital and stop loss fields"""
+        self.risk_label.configure(text=summary)
+        self.simulate_risk_btn.configure(state="normal", text="Simulate Risk")
+        self._log(summary.replace("\n", " | "))
 
     def _update_daily_target_display(self):
         """Update the daily target display"""
-        self.daily_target_label.configure(text=f"{self.daily_target_reached:.2f}%")
+        self.view_model.publish("daily_target", f"{self.daily_target_reached:.2f}%")
         
         if self.daily_target_reached >= 5.0:
-            self.daily_target_reset_btn.configure(state="normal")
+            self.view_model.publish("daily_target_reset", "normal")
         else:
-            self.daily_target_reset_btn.configure(state="disabled")
+            self.view_model.publish("daily_target_reset", "disabled")
+
+    def _render_status(self):
+        """Apply the latest status values to their widgets, then reschedule"""
+        try:
+            self.view_model.apply(self._status_renderers)
+        except Exception as e:
+            print(f"Status render error: {e}")
+        finally:
+            self.after(self.view_model.interval_ms, self._render_status)
 
     def _reset_daily_target(self):
         """Reset daily target with capital unlock"""
@@ -1824,6 +2222,7 @@ Example:
         config = load_config_json()
         config["platform"] = choice
         save_config_json(config)
+        self._activate_profile(choice)
 
     def _show_license_required_message(self, action):
         """Show license required message for protected actions"""
@@ -1853,16 +2252,78 @@ Example:
         self._log(f"Block 2 {'enabled' if self.block2_enabled else 'disabled'}")
 
     def _log(self, msg, level="info"):
-        """Add message to log with timestamp"""
+        """Queue message for the log with timestamp (safe from any thread)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_msg = f"[{timestamp}] {msg}"
+        self.log_sink.put(f"[{timestamp}] {msg}")
+        self.file_logger.log(getattr(logging, str(level).upper(), logging.INFO), msg)
+
+    def _drain_log_sink(self):
+        """Insert queued log lines in one widget operation, then reschedule"""
+        try:
+            lines = self.log_sink.drain(LOG_DRAIN_BATCH)
+            
+            stats = self.log_sink.stats()
+            if stats["dropped"] > self._reported_log_drops:
+                lines.append(f"[{datetime.now().strftime('%H:%M:%S')}] ⚠️ "
+                             f"{stats['dropped'] - self._reported_log_drops} log lines dropped "
+                             f"(queued: {stats['queued']}, backlog: {stats['depth']})")
+                self._reported_log_drops = stats["dropped"]
+            
+            if lines:
+                print("\n".join(lines))
+                text = "\n".join(lines[-MAX_LOG_VIEW_LINES:])
+                self.log_textbox.configure(state="normal")
+                self.log_textbox.insert("end", text + "\n")
+                
+                # Keep only the newest MAX_LOG_VIEW_LINES lines on screen
+                line_count = int(self.log_textbox.index("end-1c").split(".")[0]) - 1
+                if line_count > MAX_LOG_VIEW_LINES:
+                    self.log_textbox.delete("1.0", f"{line_count - MAX_LOG_VIEW_LINES + 1}.0")
+                
+                self.log_textbox.see("end")
+                self.log_textbox.configure(state="disabled")
+        except Exception as e:
+            print(f"Log drain error: {e}")
+        finally:
+            self.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_sink)
+
+    def _search_logs(self):
+        """Search the rotated log files without blocking the GUI"""
+        needle = self.log_search_entry.get().strip()
+        if not needle:
+            return
+        
+        self.log_search_btn.configure(state="disabled", text="...")
+        
+        def worker():
+            try:
+                results = search_log_files(LOGS_DIR, needle)
+                error = None
+            except Exception as e:
+                results, error = [], str(e)
+            self.after(0, lambda: self._show_log_search_results(needle, results, error))
         
-        self.log_textbox.configure(state="normal")
-        self.log_textbox.insert("end", formatted_msg + "\n")
-        self.log_textbox.see("end")
-        self.log_textbox.configure(state="disabled")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_log_search_results(self, needle, results, error=None):
+        """Display log search results in a separate window"""
+        self.log_search_btn.configure(state="normal", text="Search")
+        if error:
+            messagebox.showerror("Search Failed", f"Error searching logs:\n{error}")
+            return
         
-        print(formatted_msg)
+        window = ctk.CTkToplevel(self)
+        window.title(f"Log search: {needle}")
+        window.geometry("800x450")
+        window.transient(self)
+        
+        ctk.CTkLabel(window, text=f"{len(results)} matching line(s), newest first",
+                    font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=12, pady=(12, 4))
+        
+        results_box = ctk.CTkTextbox(window, wrap="none")
+        results_box.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+        results_box.insert("end", "\n".join(f"{name}: {line}" for name, line in results) or "No matches found.")
+        results_box.configure(state="disabled")
 
     def _refresh_license_ui(self):
         """Update license status in main GUI"""
@@ -1874,7 +2335,7 @@ Example:
             self.license_status_var.set(f"Valid | {plan} | PC_{hwid.upper()[:8]}...")
             self.platform_selector.configure(state="normal")
             self.calibrate_btn.configure(state="normal")
-            self.start_btn.configure(state="normal")
+            self._update_start_button()
             self._log(f"License active: {plan} plan")
         else:
             self.license_status_var.set("No valid license")
@@ -1891,13 +2352,13 @@ Example:
                 formatted_hours = format_betting_hours(hours)
                 
                 if "Not available" in formatted_hours or "No betting hours" in formatted_hours:
-                    self.trading_hours_label.configure(text="Available Today: No trading hours")
+                    self.view_model.publish("trading_hours", "Available Today: No trading hours")
                 else:
-                    self.trading_hours_label.configure(text=f"Available Today: {formatted_hours}")
+                    self.view_model.publish("trading_hours", f"Available Today: {formatted_hours}")
             else:
-                self.trading_hours_label.configure(text="Core module not available")
+                self.view_model.publish("trading_hours", "Core module not available")
         except Exception as e:
-            self.trading_hours_label.configure(text="Error loading hours")
+            self.view_model.publish("trading_hours", "Error loading hours")
             self._log(f"Error updating trading hours: {e}")
 
     def _launch_calibration(self):
@@ -1922,14 +2383,18 @@ Example:
                 self._log(f"Failed to open platform URL: {e}")
                 messagebox.showerror("Error", f"Failed to open {platform} URL: {e}")
         
-        wizard = CalibrationWizard(self, self.block2_enabled, self._on_calibration_complete)
+        wizard = CalibrationWizard(self, self.block2_enabled, self._on_calibration_complete, platform=platform)
         wizard.grab_set()
 
     def _on_calibration_complete(self, coords):
         """Handle calibration completion"""
         self.calib_data = coords
+        if self.profiles:
+            self.profile_key = self.profiles.save(self.platform_var.get(), coords)
+            self._log(f"Calibration profile saved: {self.profile_key}")
         self._log("Calibration completed successfully")
         save_coords_json(coords)
+        self._update_start_button()
         self.play_sound("clap")
 
     def _update_capital_lock(self):
@@ -1966,7 +2431,12 @@ Example:
         if not license_data or not license_data.get("valid"):
             messagebox.showerror("Error", "Valid license required to start bot")
             return
+
+        if not self.calib_data:
+            messagebox.showerror("Error", f"Calibrate {self.platform_var.get()} before starting the bot")
+            return
             
+        self._ensure_telegram_section()
         self._save_telegram_settings()
             
         if not is_within_betting_hours():
@@ -1982,22 +2452,18 @@ Example:
             self._log("Session start cancelled by user")
             return
             
-        if self.current_session_type == "continue":
-            session_data = load_today_session()
-            if session_data.get("sessions"):
-                last_session = session_data["sessions"][-1]
-                self.session_start_capital = last_session["capital_after"]
-                self._log(f"Continuing from previous session. Capital: ₦{self.session_start_capital:,.2f}")
-                self._load_session_cookies()
-        else:
-            self.session_start_capital = capital
-            if self.current_session_type == "reset":
-                save_today_session({"sessions": [], "target_reached": False})
-                self.session_cookies = {}
-                self._save_session_cookies()
-                self._log("Previous session data cleared. Starting fresh session.")
-            else:
-                self._log("Starting fresh session.")
+        # Same session, cookie, history and journal handling as headless runs
+        self.stop_event.clear()
+        strategy = osenaabo_simulator.strategy_from_config(load_config_json(), self.block2_var.get()) \
+            if osenaabo_simulator else None
+        self.engine = BotEngine(capital, stop_loss, self.calib_data, log=self._log, stop_event=self.stop_event,
+                                profiles=self.profiles if self.profile_key else None,
+                                profile=self.previous_platform, frame_pool=self.frame_pool, strategy=strategy)
+        self.engine.on_round = self.record_round_result
+        self.engine.on_session = self.record_session
+        self.engine.on_stop_loss = self.notify_stop_loss
+        if not self.engine.prepare_session(self.current_session_type):
+            return
         
         self.trading_started = True
         self._update_capital_lock()
@@ -2006,11 +2472,12 @@ Example:
         self.stop_btn.configure(state="normal")
         self.platform_selector.configure(state="disabled")
         
-        self.stop_event.clear()
+        self.telegram_digest.start()
         self.bot_thread = threading.Thread(target=self._run_bot, daemon=True)
         self.bot_thread.start()
         
         self._log("Bot started successfully")
+        self.notify(f"▶️ OSENAABO! bot started on {self.platform_var.get()}")
         self.play_sound("found")
 
     def _stop_bot(self):
@@ -2021,58 +2488,60 @@ Example:
         
         self.platform_selector.configure(state="normal")
         
-        self.start_btn.configure(state="normal")
+        self._update_start_button()
         self.stop_btn.configure(state="disabled")
         self._log("Bot stopping...")
-
-    def _load_session_cookies(self):
-        """Load session cookies from file"""
-        try:
-            session_file = get_today_session_file().replace('.json', '_cookies.json')
-            if os.path.exists(session_file):
-                with open(session_file, 'r') as f:
-                    self.session_cookies = json.load(f)
-                self._log("Session cookies loaded")
-        except Exception as e:
-            self._log(f"Error loading session cookies: {e}")
-
-    def _save_session_cookies(self):
-        """Save session cookies to file"""
-        try:
-            session_file = get_today_session_file().replace('.json', '_cookies.json')
-            with open(session_file, 'w') as f:
-                json.dump(self.session_cookies, f, indent=2)
-        except Exception as e:
-            self._log(f"Error saving session cookies: {e}")
+        
+        stats = self.view_model.stats()
+        self._log(f"Status updates: {stats['published']} published, {stats['applied']} rendered, "
+                  f"{stats['skipped']} redundant skipped")
+
+    def _bot_status(self):
+        """get_bot_status()-style snapshot of the GUI's bot engine (no Tk access)"""
+        engine = self.engine
+        if engine is None:
+            return {"running": False, "capital": 0.0, "profit": 0.0, "progress_percent": self.daily_target_reached,
+                    "tick_rate": 0.0, "errors": []}
+        return dict(engine.status(), progress_percent=self.daily_target_reached)
+
+    def _collect_metrics(self):
+        """Refresh queue-depth and skipped-frame metrics before each export"""
+        log_stats = self.log_sink.stats()
+        audio_stats = self.audio.stats()
+        telegram_stats = self.telegram_notifier.metrics()
+        view_stats = self.view_model.stats()
+        QUEUE_DEPTH.set(log_stats["depth"], queue="log")
+        QUEUE_DEPTH.set(audio_stats["pending"], queue="audio")
+        QUEUE_DEPTH.set(telegram_stats["depth"], queue="telegram")
+        SKIPPED_FRAMES.set_total(view_stats["skipped"], source="status_view")
+        SKIPPED_FRAMES.set_total(log_stats["dropped"], source="log")
+        SKIPPED_FRAMES.set_total(audio_stats["dropped"] + audio_stats["coalesced"], source="audio")
+        SKIPPED_FRAMES.set_total(telegram_stats["dropped"], source="telegram")
+
+    def _diagnostic_stats(self):
+        """Queue and pool sizes appended to every memory diagnostics sample"""
+        stats = {"log_depth": self.log_sink.stats()["depth"],
+                 "cookies": len(self.engine.session_cookies) if self.engine else 0}
+        if self.frame_pool:
+            stats.update({f"frames_{k}": v for k, v in self.frame_pool.stats().items()})
+        return stats
 
     def _run_bot(self):
-        """Main bot execution loop with session management"""
+        """Bot thread: run the shared engine loop, then hand the controls back"""
+        engine = self.engine
         try:
-            self._save_session_cookies()
-            
-            count = 0
-            while not self.stop_event.is_set() and count < 10:
-                self._log(f"Bot running... {count}")
-                
-                if count % 3 == 0:
-                    self.session_cookies['last_activity'] = datetime.now().isoformat()
-                    self._save_session_cookies()
-                    self._log("Session cookies updated")
-                
-                time.sleep(2)
-                count += 1
-                
+            engine.run()
             if not self.stop_event.is_set():
-                self._log("Bot completed normally")
+                self.notify("⏹ OSENAABO! bot completed")
             else:
-                self._log("Bot stopped by user")
-                
-        except Exception as e:
-            self._log(f"Bot error: {str(e)}")
+                self.notify("⏹ OSENAABO! bot stopped by user")
         finally:
-            self._save_session_cookies()
+            if any(engine.drift):
+                # The engine already saved the re-anchored regions; start the next run from them
+                self.calib_data = engine.coords
+            self.telegram_digest.stop()
             
-            self.after(0, lambda: self.start_btn.configure(state="normal"))
+            self.after(0, self._update_start_button)
             self.after(0, lambda: self.stop_btn.configure(state="disabled"))
             self.after(0, lambda: self.platform_selector.configure(state="normal"))
 
@@ -2083,6 +2552,14 @@ Example:
                 self.stop_event.set()
                 self.bot_thread.join(timeout=5)
             
+            if self.log_listener:
+                self.log_listener.stop()
+            self.audio.stop()
+            self.telegram_notifier.stop()
+            self.metrics_exporter.stop()
+            if self.diagnostics:
+                self.diagnostics.stop()
+            
             cleanup_tkinter()
             self.destroy()
 
@@ -2091,12 +2568,9 @@ def now_ts():
     return datetime.now().strftime("%H:%M:%S")
 
 def load_inline_logo_image(size=(36, 36)):
-    """Return a ctk-compatible image from inline base64 logo."""
+    """Return a shared ctk-compatible image from the inline base64 logo."""
     try:
-        raw = base64.b64decode(BASE64_LOGO)
-        img = Image.open(io.BytesIO(raw)).convert("RGBA")
-        img = img.resize(size, Image.LANCZOS)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+        return ASSET_CACHE.ctk_image("logo", size)
     except Exception:
         return None
 
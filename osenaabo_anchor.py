@@ -0,0 +1,176 @@
+# osenaabo_anchor.py
+"""
+Drift detection for calibrated regions.
+
+At calibration time a small, high-texture fingerprint patch is cut from the
+screen next to the calibrated regions (never inside them, since their content
+changes) and stored in aviator_coordinates.json as "Anchor" (its box) and
+"Anchor_Patch" (base64 PNG). While the bot runs, AnchorTracker grabs only a
+small window around the expected anchor position and matches the patch there;
+if the browser moved or scrolled, the offset is applied to every region with
+RegionSet.translated(). A check costs a few milliseconds.
+"""
+
+import io
+import time
+import base64
+from typing import Dict, Any, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from osenaabo_regions import is_region_entry, REGION_KEYS
+
+ANCHOR_KEY = "Anchor"
+ANCHOR_PATCH_KEY = "Anchor_Patch"
+ANCHOR_SIZE = 48
+SEARCH_MARGIN = 48
+WIDE_SEARCH_MARGIN = 240
+MATCH_THRESHOLD = 0.85
+DEFAULT_CHECK_INTERVAL = 5.0
+
+
+def _to_gray(image) -> np.ndarray:
+    array = np.asarray(image)
+    if array.ndim == 2:
+        return array.astype(np.uint8, copy=False)
+    if array.shape[2] == 4:
+        return cv2.cvtColor(array, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(array, cv2.COLOR_RGB2GRAY)
+
+
+def encode_patch(patch: np.ndarray) -> str:
+    buffer = io.BytesIO()
+    Image.fromarray(patch).save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def decode_patch(data: str) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(base64.b64decode(data))).convert("L"))
+
+
+def select_anchor(gray: np.ndarray, coords: Dict[str, Any], size: int = ANCHOR_SIZE,
+                  margin: int = WIDE_SEARCH_MARGIN) -> Optional[Tuple[int, int]]:
+    """
+    Top-left (in gray pixels) of the most textured size x size patch around the
+    calibrated area that does not overlap any region. Patch variance comes from
+    integral images, so every candidate on the grid costs O(1).
+    """
+    boxes = [[int(v[k]) for k in REGION_KEYS] for v in coords.values() if is_region_entry(v)]
+    if not boxes:
+        return None
+    boxes = np.array(boxes, dtype=np.int64)
+    height, width = gray.shape
+    left = max(int(boxes[:, 0].min()) - margin, 0)
+    top = max(int(boxes[:, 1].min()) - margin, 0)
+    right = min(int((boxes[:, 0] + boxes[:, 2]).max()) + margin, width) - size
+    bottom = min(int((boxes[:, 1] + boxes[:, 3]).max()) + margin, height) - size
+    if right < left or bottom < top:
+        return None
+
+    sums, squares = cv2.integral2(gray, sdepth=cv2.CV_64F)
+    step = max(size // 4, 1)
+    ys, xs = np.mgrid[top:bottom + 1:step, left:right + 1:step]
+    ys, xs = ys.ravel(), xs.ravel()
+
+    def window_sum(table):
+        return table[ys + size, xs + size] - table[ys, xs + size] - table[ys + size, xs] + table[ys, xs]
+
+    area = float(size * size)
+    variance = window_sum(squares) / area - (window_sum(sums) / area) ** 2
+
+    x0, y0 = boxes[:, 0], boxes[:, 1]
+    x1, y1 = x0 + boxes[:, 2], y0 + boxes[:, 3]
+    overlaps = ((xs[:, None] < x1) & (x0 < xs[:, None] + size) &
+                (ys[:, None] < y1) & (y0 < ys[:, None] + size)).any(axis=1)
+    variance[overlaps] = -1.0
+    best = int(np.argmax(variance))
+    if variance[best] <= 0:
+        return None
+    return int(xs[best]), int(ys[best])
+
+
+def make_anchor(screenshot, coords: Dict[str, Any], pixel_scale: float = 1.0) -> Dict[str, Any]:
+    """Coords entries ("Anchor", "Anchor_Patch") for a clean full-screen capture, or {} if none fits"""
+    gray = _to_gray(screenshot)
+    if pixel_scale != 1.0:
+        gray = cv2.resize(gray, (int(round(gray.shape[1] / pixel_scale)), int(round(gray.shape[0] / pixel_scale))),
+                          interpolation=cv2.INTER_AREA)
+    regions = {k: v for k, v in coords.items() if k != ANCHOR_KEY}
+    location = select_anchor(gray, regions)
+    if location is None:
+        return {}
+    x, y = location
+    patch = np.ascontiguousarray(gray[y:y + ANCHOR_SIZE, x:x + ANCHOR_SIZE])
+    return {
+        ANCHOR_KEY: {"x": x, "y": y, "width": ANCHOR_SIZE, "height": ANCHOR_SIZE},
+        ANCHOR_PATCH_KEY: encode_patch(patch),
+    }
+
+
+class AnchorTracker:
+    """Find the fingerprint patch near where it should be and report how far it moved"""
+
+    def __init__(self, x: int, y: int, patch: np.ndarray, margin: int = SEARCH_MARGIN,
+                 threshold: float = MATCH_THRESHOLD):
+        self.x = int(x)
+        self.y = int(y)
+        self.patch = patch
+        self.margin = margin
+        self.threshold = threshold
+        self.last_score = None
+        self.last_check_ms = None
+        self.checks = 0
+        self.misses = 0
+
+    @classmethod
+    def from_coords(cls, coords: Dict[str, Any], **kwargs) -> Optional["AnchorTracker"]:
+        box = (coords or {}).get(ANCHOR_KEY)
+        data = (coords or {}).get(ANCHOR_PATCH_KEY)
+        if not is_region_entry(box) or not data:
+            return None
+        try:
+            return cls(box["x"], box["y"], decode_patch(data), **kwargs)
+        except Exception as e:
+            print(f"Invalid anchor patch: {e}")
+            return None
+
+    def _match(self, grab, margin: int, release=None) -> Tuple[float, int, int]:
+        h, w = self.patch.shape
+        left, top = max(self.x - margin, 0), max(self.y - margin, 0)
+        right, bottom = self.x + w + margin, self.y + h + margin
+        frame = grab((left, top, right, bottom))
+        try:
+            gray = _to_gray(frame)
+        finally:
+            if release:
+                release(frame)
+        if gray.shape != (bottom - top, right - left):  # HiDPI capture: bring back to calibration units
+            gray = cv2.resize(gray, (right - left, bottom - top), interpolation=cv2.INTER_AREA)
+        result = cv2.matchTemplate(gray, self.patch, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (mx, my) = cv2.minMaxLoc(result)
+        return float(score), left + mx - self.x, top + my - self.y
+
+    def check(self, grab, release=None) -> Optional[Tuple[int, int]]:
+        """
+        grab(bbox) -> image of (left, top, right, bottom); release(image), if
+        given, returns a pooled frame once it has been converted. Returns the
+        (dx, dy) drift since the last check ((0, 0) if still in place) or None
+        if the anchor could not be found even in the wide search window.
+        """
+        started = time.perf_counter()
+        self.checks += 1
+        try:
+            score, dx, dy = self._match(grab, self.margin, release)
+            if score < self.threshold:
+                score, dx, dy = self._match(grab, WIDE_SEARCH_MARGIN, release)
+        finally:
+            self.last_check_ms = (time.perf_counter() - started) * 1000.0
+        self.last_score = score
+        if score < self.threshold:
+            self.misses += 1
+            return None
+        self.x += dx
+        self.y += dy
+        return dx, dy
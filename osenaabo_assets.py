@@ -0,0 +1,129 @@
+# osenaabo_assets.py
+"""
+Cached image assets for OSENAABO! GUI.
+
+Embedded (base64) and bundled images are decoded once. Resized variants are
+kept per (size, theme), optionally persisted as ready-to-load PNGs, and
+widgets share one CTkImage per variant instead of decoding and resampling
+on every call.
+"""
+
+import os
+import io
+import base64
+import hashlib
+import threading
+from typing import Optional, Dict, Tuple
+
+from PIL import Image
+
+DEFAULT_THEME = "default"
+
+
+class AssetCache:
+    """Decode-once image store with pre-resized, optionally persisted variants"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self._sources: Dict[Tuple[str, str], Tuple[str, object]] = {}
+        self._digests: Dict[Tuple[str, str], str] = {}
+        self._images: Dict[Tuple[str, str], Image.Image] = {}
+        self._variants: Dict[Tuple[str, Tuple[int, int], str], Image.Image] = {}
+        self._ctk_images: Dict[Tuple[str, Tuple[int, int]], object] = {}
+        self._lock = threading.RLock()
+
+    def register_base64(self, name: str, data: str, theme: str = DEFAULT_THEME):
+        """Register an embedded base64 image (decoded on first use)"""
+        with self._lock:
+            self._sources[(name, theme)] = ("base64", data)
+            self._digests[(name, theme)] = hashlib.sha1(data.encode("ascii")).hexdigest()[:10]
+
+    def register_file(self, name: str, path: str, theme: str = DEFAULT_THEME):
+        """Register a bundled image file (read on first use)"""
+        with self._lock:
+            self._sources[(name, theme)] = ("file", path)
+            try:
+                stamp = f"{path}:{os.path.getmtime(path)}:{os.path.getsize(path)}"
+            except OSError:
+                stamp = path
+            self._digests[(name, theme)] = hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:10]
+
+    def _source_key(self, name: str, theme: str) -> Tuple[str, str]:
+        if (name, theme) in self._sources:
+            return name, theme
+        if (name, DEFAULT_THEME) in self._sources:
+            return name, DEFAULT_THEME
+        raise KeyError(f"Unknown asset: {name}")
+
+    def image(self, name: str, theme: str = DEFAULT_THEME) -> Image.Image:
+        """Full-size RGBA image, decoded once"""
+        with self._lock:
+            key = self._source_key(name, theme)
+            img = self._images.get(key)
+            if img is None:
+                kind, source = self._sources[key]
+                if kind == "base64":
+                    img = Image.open(io.BytesIO(base64.b64decode(source)))
+                else:
+                    img = Image.open(source)
+                img = img.convert("RGBA")
+                img.load()
+                self._images[key] = img
+            return img
+
+    def _variant_path(self, name: str, size: Tuple[int, int], theme: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        digest = self._digests.get(self._source_key(name, theme), "")
+        return os.path.join(self.cache_dir, f"{name}_{size[0]}x{size[1]}_{theme}_{digest}.png")
+
+    def variant(self, name: str, size: Tuple[int, int], theme: str = DEFAULT_THEME) -> Image.Image:
+        """Resized image, computed once per (name, size, theme) and persisted if cache_dir is set"""
+        size = (int(size[0]), int(size[1]))
+        with self._lock:
+            theme = self._source_key(name, theme)[1]
+            key = (name, size, theme)
+            img = self._variants.get(key)
+            if img is not None:
+                return img
+
+            path = self._variant_path(name, size, theme)
+            if path and os.path.exists(path):
+                try:
+                    img = Image.open(path).convert("RGBA")
+                    img.load()
+                except Exception:
+                    img = None
+
+            if img is None:
+                img = self.image(name, theme).resize(size, Image.LANCZOS)
+                if path:
+                    try:
+                        os.makedirs(self.cache_dir, exist_ok=True)
+                        img.save(path, format="PNG")
+                    except Exception as e:
+                        print(f"Could not persist asset variant {path}: {e}")
+
+            self._variants[key] = img
+            return img
+
+    def ctk_image(self, name: str, size: Tuple[int, int] = (36, 36)):
+        """Shared CTkImage for a size, using 'light'/'dark' variants when registered"""
+        import customtkinter as ctk
+        size = (int(size[0]), int(size[1]))
+        with self._lock:
+            key = (name, size)
+            ctk_img = self._ctk_images.get(key)
+            if ctk_img is None:
+                ctk_img = ctk.CTkImage(light_image=self.variant(name, size, "light"),
+                                       dark_image=self.variant(name, size, "dark"),
+                                       size=size)
+                self._ctk_images[key] = ctk_img
+            return ctk_img
+
+    def clear(self):
+        """Drop every decoded image and variant held in memory"""
+        with self._lock:
+            self._images.clear()
+            self._variants.clear()
+            self._ctk_images.clear()
@@ -0,0 +1,182 @@
+# osenaabo_audio.py
+"""
+Non-blocking audio dispatcher for OSENAABO! GUI.
+
+Sounds are decoded once at startup and played from a dedicated thread on a
+reserved pygame mixer channel. Requests never block the caller: a sound that
+is already queued is coalesced, and requests that arrive while the channel
+(or a fallback player) is still busy are dropped.
+"""
+
+import os
+import sys
+import queue
+import platform
+import threading
+import subprocess
+from typing import Dict
+
+try:
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    pygame = None
+    PYGAME_AVAILABLE = False
+
+IS_MAC = platform.system() == 'Darwin'
+IS_WINDOWS = platform.system() == 'Windows'
+IS_LINUX = platform.system() == 'Linux'
+
+DEFAULT_MAX_PENDING = 4
+
+# Platform fallbacks used when a .wav file is missing or pygame is unavailable
+WINDOWS_BEEPS = {
+    "clap": (800, 400),
+    "found": (1200, 300),
+    "win": (1000, 500),
+    "loss": (500, 300),
+}
+
+MAC_COMMANDS = {
+    "clap": ["afplay", "/System/Library/Sounds/Submarine.aiff"],
+    "found": ["afplay", "/System/Library/Sounds/Glass.aiff"],
+    "win": ["afplay", "/System/Library/Sounds/Tink.aiff"],
+    "loss": ["osascript", "-e", "beep 1"],
+}
+
+LINUX_COMMANDS = {
+    "clap": ["paplay", "/usr/share/sounds/ubuntu/stereo/button-pressed.ogg"],
+    "found": ["paplay", "/usr/share/sounds/ubuntu/stereo/message.ogg"],
+}
+
+LINUX_BELLS = {"win": "\a\a", "loss": "\a"}
+
+
+class AudioService:
+    """Plays preloaded sounds on a dedicated thread without blocking callers"""
+
+    def __init__(self, sound_files: Dict[str, str], max_pending: int = DEFAULT_MAX_PENDING):
+        self.sound_files = dict(sound_files)
+        self._queue = queue.Queue(max_pending)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._sounds = {}
+        self._channel = None
+        self._fallback_proc = None
+        self._thread = None
+        self._running = False
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def start(self):
+        """Initialise the mixer, decode every sound once and start the audio thread"""
+        if self._running:
+            return
+        self._preload()
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="osenaabo-audio", daemon=True)
+        self._thread.start()
+
+    def _preload(self):
+        if not PYGAME_AVAILABLE:
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_reserved(1)
+            self._channel = pygame.mixer.Channel(0)
+        except Exception as e:
+            print(f"Audio mixer unavailable: {e}")
+            return
+        for sound_type, path in self.sound_files.items():
+            if os.path.exists(path):
+                try:
+                    self._sounds[sound_type] = pygame.mixer.Sound(path)
+                except Exception as e:
+                    print(f"Could not load sound {path}: {e}")
+
+    def play(self, sound_type: str) -> bool:
+        """Request a sound; returns False if it was coalesced or dropped"""
+        with self._lock:
+            if sound_type in self._pending:
+                self.coalesced += 1
+                return False
+            try:
+                self._queue.put_nowait(sound_type)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending.add(sound_type)
+        return True
+
+    def stop(self):
+        self._running = False
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "played": self.played,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "pending": len(self._pending),
+            }
+
+    def _worker(self):
+        while self._running:
+            sound_type = self._queue.get()
+            if sound_type is None:
+                break
+            with self._lock:
+                self._pending.discard(sound_type)
+            try:
+                played = self._play_now(sound_type)
+            except Exception as e:
+                print(f"Sound play failed: {e}")
+                played = False
+            with self._lock:
+                if played:
+                    self.played += 1
+                else:
+                    self.dropped += 1
+
+    def _play_now(self, sound_type: str) -> bool:
+        sound = self._sounds.get(sound_type)
+        if sound is not None and self._channel is not None:
+            if self._channel.get_busy():
+                return False  # overlapping request, drop it
+            self._channel.play(sound)
+            return True
+        return self._play_fallback(sound_type)
+
+    def _play_fallback(self, sound_type: str) -> bool:
+        """Platform-specific fallback sounds - only used if .wav files fail"""
+        if IS_WINDOWS:
+            beep = WINDOWS_BEEPS.get(sound_type)
+            if beep:
+                import winsound
+                winsound.Beep(*beep)  # blocks only the audio thread
+                return True
+            return False
+
+        if IS_LINUX and sound_type in LINUX_BELLS:
+            sys.stdout.write(LINUX_BELLS[sound_type])
+            sys.stdout.flush()
+            return True
+
+        command = (MAC_COMMANDS if IS_MAC else LINUX_COMMANDS if IS_LINUX else {}).get(sound_type)
+        if not command:
+            return False
+        if self._fallback_proc is not None and self._fallback_proc.poll() is None:
+            return False  # previous fallback still playing
+        try:
+            self._fallback_proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except OSError:
+            return False
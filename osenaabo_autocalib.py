@@ -0,0 +1,213 @@
+# osenaabo_autocalib.py
+"""
+Automatic region calibration for OSENAABO! GUI.
+
+Reference templates are stored per platform under assets/templates/<platform>/
+(one PNG per region, saved from a full-screen capture when a manual
+calibration finishes). Auto-calibration takes a single full-screen capture
+and finds every region with multi-scale cv2 template matching: a coarse
+search on a downscaled copy of the screen, then a full-resolution refine in
+a small window around the best coarse hit.
+
+Regions whose pixels change between runs cannot be matched; their offsets
+from a static region of the same block are saved next to the templates
+(offsets.json) and they are placed from whichever of those regions matched.
+"""
+
+import os
+import json
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+TEMPLATES_DIR_NAME = "templates"
+DEFAULT_SCALES = (1.0, 0.9, 1.1, 0.8, 1.25)
+DEFAULT_THRESHOLD = 0.8
+COARSE_FACTOR = 0.5
+REFINE_MARGIN = 8
+MIN_TEMPLATE_SIDE = 6
+# Regions whose pixels change between runs (typed values, round history) never match a saved template
+DYNAMIC_REGIONS = frozenset({"Block1_History", "Block1_StakeInput", "Block1_AutoCashInput",
+                             "Block2_StakeInput", "Block2_AutoCashInput"})
+# Static regions each dynamic region is placed from, most reliable first
+DYNAMIC_ANCHORS = {
+    "Block1_History": ("Block1_BetButton", "Block1_AutoToggle", "Block2_BetButton"),
+    "Block1_StakeInput": ("Block1_BetButton", "Block1_AutoToggle", "Block1_AutoCashToggle"),
+    "Block1_AutoCashInput": ("Block1_AutoCashToggle", "Block1_BetButton", "Block1_AutoToggle"),
+    "Block2_StakeInput": ("Block2_BetButton", "Block2_AutoToggle", "Block2_AutoCashToggle"),
+    "Block2_AutoCashInput": ("Block2_AutoCashToggle", "Block2_BetButton", "Block2_AutoToggle"),
+}
+OFFSETS_FILE = "offsets.json"
+
+
+def get_template_dir(assets_dir: str, platform: str) -> str:
+    return os.path.join(assets_dir, TEMPLATES_DIR_NAME, platform)
+
+
+def to_gray(image) -> np.ndarray:
+    """Convert a PIL image or RGB/RGBA/BGR array to a grayscale uint8 array"""
+    array = np.asarray(image)
+    if array.ndim == 2:
+        return array.astype(np.uint8, copy=False)
+    if array.shape[2] == 4:
+        return cv2.cvtColor(array, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(array, cv2.COLOR_RGB2GRAY)
+
+
+def save_region_templates(screenshot, coords: Dict[str, Any], template_dir: str, pixel_scale: float = 1.0) -> int:
+    """
+    Crop every calibrated box out of a full-screen capture and save it as a template.
+    pixel_scale converts calibration (logical) coordinates to screenshot pixels on HiDPI displays.
+    """
+    gray = to_gray(screenshot)
+    os.makedirs(template_dir, exist_ok=True)
+    saved = 0
+    for name, box in coords.items():
+        if name in DYNAMIC_REGIONS:
+            stale = os.path.join(template_dir, f"{name}.png")
+            if os.path.exists(stale):
+                os.remove(stale)
+            continue
+        if not _is_box(box):
+            continue
+        x, y, w, h = (int(round(box[k] * pixel_scale)) for k in ("x", "y", "width", "height"))
+        crop = gray[max(y, 0):y + h, max(x, 0):x + w]
+        if crop.shape[0] < MIN_TEMPLATE_SIDE or crop.shape[1] < MIN_TEMPLATE_SIDE:
+            continue
+        if cv2.imwrite(os.path.join(template_dir, f"{name}.png"), crop):
+            saved += 1
+    save_dynamic_offsets(coords, template_dir)
+    return saved
+
+
+def _is_box(box) -> bool:
+    return isinstance(box, dict) and all(k in box for k in ("x", "y", "width", "height"))
+
+
+def save_dynamic_offsets(coords: Dict[str, Any], template_dir: str) -> int:
+    """Record where each dynamic region sits relative to its anchor regions (calibration coordinates)"""
+    offsets = {}
+    for name, anchors in DYNAMIC_ANCHORS.items():
+        box = coords.get(name)
+        if not _is_box(box):
+            continue
+        offsets[name] = [{"anchor": anchor,
+                          "dx": box["x"] - coords[anchor]["x"], "dy": box["y"] - coords[anchor]["y"],
+                          "width": box["width"], "height": box["height"]}
+                         for anchor in anchors if _is_box(coords.get(anchor))]
+    os.makedirs(template_dir, exist_ok=True)
+    with open(os.path.join(template_dir, OFFSETS_FILE), "w", encoding="utf-8") as f:
+        json.dump(offsets, f, indent=2)
+    return len(offsets)
+
+
+def load_offsets(template_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(template_dir, OFFSETS_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def place_dynamic_regions(found: Dict[str, Dict[str, Any]], offsets: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Boxes for the dynamic regions, placed from the first of their anchors that was matched"""
+    placed = {}
+    for name, candidates in offsets.items():
+        for offset in candidates:
+            match = found.get(offset["anchor"])
+            if not match:
+                continue
+            # The anchor's match scale applies to the offset too (browser zoom, other DPI)
+            scale = match.get("scale", 1.0)
+            placed[name] = {"x": match["x"] + int(round(offset["dx"] * scale)),
+                            "y": match["y"] + int(round(offset["dy"] * scale)),
+                            "width": int(round(offset["width"] * scale)),
+                            "height": int(round(offset["height"] * scale)),
+                            "score": match["score"], "scale": scale, "anchor": offset["anchor"]}
+            break
+    return placed
+
+
+def load_templates(template_dir: str) -> Dict[str, np.ndarray]:
+    templates = {}
+    if not os.path.isdir(template_dir):
+        return templates
+    for filename in sorted(os.listdir(template_dir)):
+        if filename.lower().endswith(".png") and os.path.splitext(filename)[0] not in DYNAMIC_REGIONS:
+            template = cv2.imread(os.path.join(template_dir, filename), cv2.IMREAD_GRAYSCALE)
+            if template is not None:
+                templates[os.path.splitext(filename)[0]] = template
+    return templates
+
+
+def _best_match(haystack: np.ndarray, needle: np.ndarray) -> Tuple[float, Tuple[int, int]]:
+    if needle.shape[0] > haystack.shape[0] or needle.shape[1] > haystack.shape[1]:
+        return -1.0, (0, 0)
+    result = cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED)
+    _, score, _, location = cv2.minMaxLoc(result)
+    return float(score), location
+
+
+def locate_template(screen_gray: np.ndarray, template: np.ndarray, scales: Sequence[float] = DEFAULT_SCALES,
+                    coarse_screen: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
+    """Best (x, y, width, height, score) match of template on the screen over several scales"""
+    if coarse_screen is None:
+        coarse_screen = cv2.resize(screen_gray, None, fx=COARSE_FACTOR, fy=COARSE_FACTOR,
+                                   interpolation=cv2.INTER_AREA)
+    best = None
+    for scale in scales:
+        h = int(round(template.shape[0] * scale))
+        w = int(round(template.shape[1] * scale))
+        if h < MIN_TEMPLATE_SIDE or w < MIN_TEMPLATE_SIDE:
+            continue
+        scaled = cv2.resize(template, (w, h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+
+        # Coarse search on the downscaled screen (skip for templates too small to survive it)
+        ch, cw = int(h * COARSE_FACTOR), int(w * COARSE_FACTOR)
+        if ch >= MIN_TEMPLATE_SIDE and cw >= MIN_TEMPLATE_SIDE:
+            coarse = cv2.resize(scaled, (cw, ch), interpolation=cv2.INTER_AREA)
+            _, (cx, cy) = _best_match(coarse_screen, coarse)
+            x0 = max(int(cx / COARSE_FACTOR) - REFINE_MARGIN, 0)
+            y0 = max(int(cy / COARSE_FACTOR) - REFINE_MARGIN, 0)
+            window = screen_gray[y0:y0 + h + 2 * REFINE_MARGIN, x0:x0 + w + 2 * REFINE_MARGIN]
+        else:
+            x0, y0, window = 0, 0, screen_gray
+
+        score, (fx, fy) = _best_match(window, scaled)
+        if best is None or score > best["score"]:
+            best = {"x": x0 + fx, "y": y0 + fy, "width": w, "height": h, "score": score, "scale": scale}
+    return best
+
+
+def locate_regions(screenshot, templates: Dict[str, np.ndarray], scales: Sequence[float] = DEFAULT_SCALES,
+                   threshold: float = DEFAULT_THRESHOLD, pixel_scale: float = 1.0,
+                   offsets: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Locate every template on one screenshot; only matches scoring >= threshold are returned.
+    Boxes are divided by pixel_scale so they come back in calibration coordinates.
+    Dynamic regions are then placed from their saved offsets when given.
+    """
+    screen_gray = to_gray(screenshot)
+    coarse_screen = cv2.resize(screen_gray, None, fx=COARSE_FACTOR, fy=COARSE_FACTOR, interpolation=cv2.INTER_AREA)
+    found = {}
+    for name, template in templates.items():
+        match = locate_template(screen_gray, template, scales, coarse_screen)
+        if match and match["score"] >= threshold:
+            for key in ("x", "y", "width", "height"):
+                match[key] = int(round(match[key] / pixel_scale))
+            found[name] = match
+    if offsets:
+        found.update(place_dynamic_regions(found, offsets))
+    return found
+
+
+def auto_calibrate(screenshot, assets_dir: str, platform: str, **kwargs) -> Dict[str, Dict[str, Any]]:
+    """Propose calibration boxes for a platform from its stored reference templates"""
+    template_dir = get_template_dir(assets_dir, platform)
+    return locate_regions(screenshot, load_templates(template_dir), offsets=load_offsets(template_dir), **kwargs)
+
+
+def proposals_to_coords(proposals: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """Strip match metadata, leaving aviator_coordinates.json boxes"""
+    return {name: {k: int(match[k]) for k in ("x", "y", "width", "height")} for name, match in proposals.items()}
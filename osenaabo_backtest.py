@@ -0,0 +1,283 @@
+# osenaabo_backtest.py
+"""
+Offline strategy backtester for OSENAABO! GUI.
+
+Replays the staking rules over recorded crash-multiplier sequences (one
+sequence per trading day) for a whole grid of parameters at once:
+
+- base bet is capital * base_fraction (the GUI uses 0.001)
+- Block 1 (and optionally Block 2) stake the base bet with auto cash-out
+- the day stops when the loss reaches stop_loss % of the day's capital
+  or the profit reaches the daily target %
+
+Because stakes and limits are proportional to capital, a day's return does
+not depend on the capital it starts with, so days are simulated with unit
+capital in one vectorized pass and compounded afterwards. Large grids are
+split across a process pool.
+
+Usage:
+    python osenaabo_backtest.py sessions/*_multipliers.npz --cashout 1.5 2 3 --stop-loss 10 20
+    python osenaabo_backtest.py sessions/rounds.osj --cashout 1.5 2 3
+"""
+
+import os
+import sys
+import csv
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import osenaabo_journal
+except ImportError:
+    osenaabo_journal = None
+
+BASE_BET_FRACTION = 0.001
+DAILY_TARGET_PERCENT = 5.0
+DEFAULT_STOP_LOSS = 20.0
+DEFAULT_CASHOUT = 2.0
+
+# Grid columns, in order
+PARAM_FIELDS = ("cashout", "cashout2", "base_fraction", "stop_loss", "target")
+
+# Upper bound on (params x days x rounds) elements evaluated per chunk
+CHUNK_ELEMENTS = 4_000_000
+
+
+def make_grid(cashouts: Sequence[float] = (DEFAULT_CASHOUT,),
+              cashouts2: Sequence[float] = (0.0,),
+              base_fractions: Sequence[float] = (BASE_BET_FRACTION,),
+              stop_losses: Sequence[float] = (DEFAULT_STOP_LOSS,),
+              targets: Sequence[float] = (DAILY_TARGET_PERCENT,)):
+    """Cartesian product of parameters as a (P, 5) float array; cashout2 = 0 disables Block 2"""
+    mesh = np.meshgrid(cashouts, cashouts2, base_fractions, stop_losses, targets, indexing="ij")
+    return np.stack([m.ravel() for m in mesh], axis=1).astype(np.float64)
+
+
+def pad_days(days: Sequence[Sequence[float]]):
+    """Stack per-day multiplier sequences into a (D, T) array padded with NaN"""
+    days = [np.asarray(d, dtype=np.float64).ravel() for d in days if len(d)]
+    if not days:
+        return np.zeros((0, 0), dtype=np.float64)
+    width = max(len(d) for d in days)
+    padded = np.full((len(days), width), np.nan)
+    for i, d in enumerate(days):
+        padded[i, :len(d)] = d
+    return padded
+
+
+def simulate_days(multipliers, params):
+    """
+    Simulate every parameter row over every day with unit capital.
+
+    multipliers: (D, T) array, NaN for rounds that did not happen
+    params: (P, 5) array of PARAM_FIELDS
+    Returns dict of (P, D) arrays: day_return, max_drawdown, stop_hit,
+    target_hit, rounds, and stop_round (rounds to the stopping event or -1).
+    """
+    m = multipliers[None, :, :]
+    cashout = params[:, 0, None, None]
+    cashout2 = params[:, 1, None, None]
+    stake = params[:, 2, None, None]
+    stop_level = -params[:, 3, None, None] / 100.0
+    target_level = params[:, 4, None, None] / 100.0
+
+    played = ~np.isnan(m)
+    pnl = np.where(m >= cashout, stake * (cashout - 1.0), -stake)
+    pnl = pnl + np.where(cashout2 > 0, np.where(m >= cashout2, stake * (cashout2 - 1.0), -stake), 0.0)
+    pnl = np.where(played, pnl, 0.0)
+    equity = np.cumsum(pnl, axis=-1)
+
+    stop_hit_round = equity <= stop_level
+    target_hit_round = equity >= target_level
+    stopped = (stop_hit_round | target_hit_round) & played
+    any_stop = stopped.any(axis=-1)
+    first_stop = np.where(any_stop, stopped.argmax(axis=-1), -1)
+
+    n_rounds = played.sum(axis=-1)
+    last_index = np.maximum(n_rounds - 1, 0)
+    end_index = np.where(any_stop, first_stop, last_index)
+    day_return = np.take_along_axis(equity, end_index[..., None], axis=-1)[..., 0]
+    day_return = np.where(n_rounds > 0, day_return, 0.0)
+
+    t = np.arange(multipliers.shape[1])
+    active = t[None, None, :] <= end_index[..., None]
+    peak = np.maximum(np.maximum.accumulate(equity, axis=-1), 0.0)
+    drawdown = np.where(active & played, peak - equity, 0.0).max(axis=-1, initial=0.0)
+
+    first_stop_is_loss = np.take_along_axis(stop_hit_round, np.maximum(first_stop, 0)[..., None], axis=-1)[..., 0]
+    return {
+        "day_return": day_return,
+        "max_drawdown": drawdown,
+        "stop_hit": any_stop & first_stop_is_loss,
+        "target_hit": any_stop & ~first_stop_is_loss,
+        "rounds": np.where(any_stop, first_stop + 1, n_rounds),
+        "stop_round": first_stop,
+    }
+
+
+def summarize(day_results: Dict[str, np.ndarray], capital: float = 1.0) -> Dict[str, np.ndarray]:
+    """Compound daily returns into per-parameter report columns"""
+    returns = day_results["day_return"]
+    curve = capital * np.cumprod(1.0 + returns, axis=1)
+    start = np.full((curve.shape[0], 1), capital)
+    curve = np.concatenate((start, curve), axis=1)
+    peak = np.maximum.accumulate(curve, axis=1)
+    n_days = max(returns.shape[1], 1)
+    return {
+        "final_capital": curve[:, -1],
+        "pnl": curve[:, -1] - capital,
+        "total_return_pct": (curve[:, -1] / capital - 1.0) * 100.0,
+        "mean_daily_return_pct": returns.mean(axis=1) * 100.0 if returns.shape[1] else np.zeros(len(returns)),
+        "max_drawdown_pct": ((peak - curve) / peak).max(axis=1) * 100.0,
+        "worst_intraday_drawdown_pct": day_results["max_drawdown"].max(axis=1, initial=0.0) * 100.0,
+        "stop_loss_rate": day_results["stop_hit"].sum(axis=1) / n_days,
+        "target_rate": day_results["target_hit"].sum(axis=1) / n_days,
+        "rounds": day_results["rounds"].sum(axis=1),
+    }
+
+
+def _run_chunk(multipliers, params, capital):
+    return summarize(simulate_days(multipliers, params), capital)
+
+
+_worker_multipliers = None
+
+
+def _init_worker(multipliers):
+    global _worker_multipliers
+    _worker_multipliers = multipliers
+
+
+def _run_worker_chunk(args):
+    params, capital = args
+    return _run_chunk(_worker_multipliers, params, capital)
+
+
+def _merge(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return {key: np.concatenate([c[key] for c in chunks]) for key in chunks[0]}
+
+
+def run_backtest(days, params, capital: float = 1000000.0, workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Backtest a (P, 5) parameter grid over per-day multiplier sequences.
+
+    workers=None picks a process count from the grid size; workers=1 runs
+    in-process. The returned dict holds one array per report column plus the
+    parameter columns themselves.
+    """
+    multipliers = days if isinstance(days, np.ndarray) and days.ndim == 2 else pad_days(days)
+    params = np.atleast_2d(np.asarray(params, dtype=np.float64))
+    per_row = max(multipliers.size, 1)
+    rows_per_chunk = max(1, CHUNK_ELEMENTS // per_row)
+    chunks = [params[i:i + rows_per_chunk] for i in range(0, len(params), rows_per_chunk)]
+
+    if workers is None:
+        workers = min(len(chunks), os.cpu_count() or 1)
+    started = time.perf_counter()
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(multipliers,)) as pool:
+            results = list(pool.map(_run_worker_chunk, [(c, capital) for c in chunks]))
+    else:
+        results = [_run_chunk(multipliers, c, capital) for c in chunks]
+    elapsed = time.perf_counter() - started
+
+    report = _merge(results)
+    for i, field in enumerate(PARAM_FIELDS):
+        report[field] = params[:, i]
+    report["elapsed"] = elapsed
+    report["rounds_per_second"] = float(len(params) * np.count_nonzero(~np.isnan(multipliers))) / max(elapsed, 1e-9)
+    return report
+
+
+def load_multiplier_file(path: str):
+    """Load multipliers from a MultiplierRing .npz snapshot, a round journal or a text/CSV file"""
+    if osenaabo_journal and path.endswith(osenaabo_journal.JOURNAL_EXT):
+        return np.asarray(osenaabo_journal.read_journal(path)["multiplier"], dtype=np.float64)
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return np.asarray(data["values"], dtype=np.float64)
+    values = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            for token in line.replace(",", " ").split():
+                try:
+                    values.append(float(token.rstrip("xX")))
+                except ValueError:
+                    continue
+    return np.asarray(values, dtype=np.float64)
+
+
+def load_multiplier_days(paths: Sequence[str]) -> List[np.ndarray]:
+    """Load one multiplier sequence per file (per day for round journals), skipping unreadable files"""
+    days = []
+    for path in sorted(paths):
+        try:
+            if osenaabo_journal and path.endswith(osenaabo_journal.JOURNAL_EXT):
+                days.extend(osenaabo_journal.split_days(osenaabo_journal.read_journal(path)))
+                continue
+            days.append(load_multiplier_file(path))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+    return days
+
+
+def best_rows(report: Dict[str, np.ndarray], key: str = "total_return_pct", top: int = 10):
+    """Indices of the top rows by a report column"""
+    return np.argsort(report[key])[::-1][:top]
+
+
+def format_report(report: Dict[str, np.ndarray], top: int = 10) -> str:
+    """Compact text table of the best parameter rows"""
+    lines = [f"{len(report['cashout'])} parameter sets in {report['elapsed']:.2f}s "
+             f"({report['rounds_per_second']:,.0f} rounds/s)",
+             "cashout  cashout2  base    stop%  target%  return%   maxDD%  stop-hit  target-hit"]
+    for i in best_rows(report, top=top):
+        lines.append(f"{report['cashout'][i]:7.2f}  {report['cashout2'][i]:8.2f}  {report['base_fraction'][i]:.4f}"
+                     f"  {report['stop_loss'][i]:5.1f}  {report['target'][i]:7.1f}"
+                     f"  {report['total_return_pct'][i]:7.2f}  {report['max_drawdown_pct'][i]:7.2f}"
+                     f"  {report['stop_loss_rate'][i]:8.1%}  {report['target_rate'][i]:10.1%}")
+    return "\n".join(lines)
+
+
+def write_report_csv(report: Dict[str, np.ndarray], path: str):
+    columns = [k for k, v in report.items() if isinstance(v, np.ndarray)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*[report[c].tolist() for c in columns]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest OSENAABO! staking rules over recorded multipliers")
+    parser.add_argument("files", nargs="+", help="one multiplier file per day (.npz snapshot or text), or .osj round journals")
+    parser.add_argument("--capital", type=float, default=1000000.0)
+    parser.add_argument("--cashout", type=float, nargs="+", default=[DEFAULT_CASHOUT])
+    parser.add_argument("--cashout2", type=float, nargs="+", default=[0.0], help="Block 2 cash-out, 0 disables")
+    parser.add_argument("--base-fraction", type=float, nargs="+", default=[BASE_BET_FRACTION])
+    parser.add_argument("--stop-loss", type=float, nargs="+", default=[DEFAULT_STOP_LOSS])
+    parser.add_argument("--target", type=float, nargs="+", default=[DAILY_TARGET_PERCENT])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--csv", help="write every parameter row to this CSV file")
+    args = parser.parse_args(argv)
+
+    days = load_multiplier_days(args.files)
+    if not days:
+        print("No multiplier data found")
+        return 1
+    grid = make_grid(args.cashout, args.cashout2, args.base_fraction, args.stop_loss, args.target)
+    report = run_backtest(days, grid, capital=args.capital, workers=args.workers)
+    print(format_report(report, top=args.top))
+    if args.csv:
+        write_report_csv(report, args.csv)
+        print(f"Wrote {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
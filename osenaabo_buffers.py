@@ -0,0 +1,133 @@
+# osenaabo_buffers.py
+"""
+Fixed-size numpy buffer pools for OSENAABO!.
+
+Capture frames are written into preallocated arrays instead of a fresh PIL
+image per grab, so steady-state memory stays flat over a long session.
+Borrowing beyond the pool size falls back to a temporary array and is
+counted, which makes a leak or an undersized pool visible in stats().
+Pools keep a live reference to every array they own and compare by
+identity, so a foreign array can never be released into a pool.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+import numpy as np
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_SHAPES = 8
+
+
+class BufferPool:
+    """Up to `size` reusable arrays of one shape and dtype"""
+
+    def __init__(self, shape: Tuple[int, ...], dtype=np.uint8, size: int = DEFAULT_POOL_SIZE):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.size = size
+        self._free = [np.empty(self.shape, self.dtype) for _ in range(size)]
+        self._owned = list(self._free)  # live references: ids cannot be recycled
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.overflow = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def acquire(self) -> np.ndarray:
+        with self._lock:
+            self.acquired += 1
+            if self._free:
+                return self._free.pop()
+            self.overflow += 1
+        return np.empty(self.shape, self.dtype)
+
+    def owns(self, buf) -> bool:
+        return any(owned is buf for owned in self._owned)
+
+    def release(self, buf: np.ndarray):
+        """Return a pooled array; temporary overflow arrays are simply dropped"""
+        with self._lock:
+            if self.owns(buf) and not any(free is buf for free in self._free):
+                self._free.append(buf)
+
+    @contextmanager
+    def borrow(self):
+        buf = self.acquire()
+        try:
+            yield buf
+        finally:
+            self.release(buf)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": self.size, "free": len(self._free), "acquired": self.acquired,
+                    "overflow": self.overflow, "bytes": self.nbytes}
+
+
+class FramePool:
+    """BufferPools keyed by frame shape; least recently used shapes are evicted"""
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_shapes: int = DEFAULT_MAX_SHAPES, channels: int = 3):
+        self.size = size
+        self.max_shapes = max_shapes
+        self.channels = channels
+        self._pools: "OrderedDict[Tuple[int, ...], BufferPool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._owner = {}  # id(buf) -> (buf, pool); holding buf keeps its id from being reused
+
+    def pool_for_bbox(self, bbox) -> BufferPool:
+        left, top, right, bottom = bbox
+        shape = (bottom - top, right - left, self.channels)
+        with self._lock:
+            pool = self._pools.get(shape)
+            if pool is None:
+                pool = BufferPool(shape, np.uint8, self.size)
+                self._pools[shape] = pool
+                for buf in pool._owned:
+                    self._owner[id(buf)] = (buf, pool)
+                while len(self._pools) > self.max_shapes:
+                    _, evicted = self._pools.popitem(last=False)
+                    for buf in evicted._owned:
+                        self._owner.pop(id(buf), None)
+            else:
+                self._pools.move_to_end(shape)
+            return pool
+
+    def acquire(self, bbox) -> np.ndarray:
+        return self.pool_for_bbox(bbox).acquire()
+
+    def release(self, buf: np.ndarray):
+        with self._lock:
+            owned, pool = self._owner.get(id(buf), (None, None))
+        if owned is buf:
+            pool.release(buf)
+
+    def fill(self, bbox, grab_into):
+        """
+        grab_into(bbox, out) into a pooled frame. If it returns a different
+        array (frame size mismatch) or raises, the pooled frame goes straight
+        back to the pool.
+        """
+        buf = self.acquire(bbox)
+        frame = None
+        try:
+            frame = grab_into(bbox, buf)
+            return frame
+        finally:
+            if frame is not buf:
+                self.release(buf)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pools = list(self._pools.values())
+        totals = {"shapes": len(pools), "acquired": 0, "overflow": 0, "bytes": 0}
+        for pool in pools:
+            stats = pool.stats()
+            for key in ("acquired", "overflow", "bytes"):
+                totals[key] += stats[key]
+        return totals
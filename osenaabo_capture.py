@@ -0,0 +1,213 @@
+# osenaabo_capture.py
+"""
+Screen capture backends for OSENAABO! GUI.
+
+Each backend grabs a (left, top, right, bottom) box and returns a PIL image,
+or writes it into a preallocated numpy array with grab_into().
+select_fastest_backend() benchmarks every working backend against the
+calibrated bounding box at startup and keeps the fastest one. Run this module
+directly (e.g. under xvfb-run) to print the benchmark for the current display.
+"""
+
+import sys
+import time
+import threading
+from typing import Optional, Dict, Tuple, List
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None
+    PIL_AVAILABLE = False
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_BENCHMARK_SAMPLES = 10
+FALLBACK_BBOX = (0, 0, 200, 200)
+
+
+class CaptureBackend:
+    """Base class for screen capture implementations"""
+
+    name = "base"
+    pooled = False  # True when grab_into() writes into out without allocating an image first
+
+    def is_available(self) -> bool:
+        return False
+
+    def grab(self, bbox: Tuple[int, int, int, int]):
+        """Capture (left, top, right, bottom) and return an RGB PIL image"""
+        raise NotImplementedError
+
+    def grab_into(self, bbox: Tuple[int, int, int, int], out):
+        """
+        Capture into out, an (height, width, 3) uint8 RGB array, and return it.
+        Returns a new array instead if the frame does not match out's shape
+        (HiDPI captures come back larger than the logical box). This default
+        still allocates an image per grab, so callers only pool frames for
+        backends with pooled = True.
+        """
+        frame = np.asarray(self.grab(bbox))
+        if frame.shape != out.shape:
+            return frame
+        np.copyto(out, frame)
+        return out
+
+    def close(self):
+        pass
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class PILImageGrabBackend(CaptureBackend):
+    """PIL ImageGrab (GDI on Windows, screencapture on macOS, X11 on Linux)"""
+
+    name = "imagegrab"
+
+    def is_available(self) -> bool:
+        try:
+            from PIL import ImageGrab
+            return True
+        except ImportError:
+            return False
+
+    def grab(self, bbox):
+        from PIL import ImageGrab
+        return ImageGrab.grab(bbox=bbox).convert("RGB")
+
+
+class PyAutoGUIBackend(CaptureBackend):
+    """pyautogui.screenshot (pyscreeze under the hood)"""
+
+    name = "pyautogui"
+
+    def is_available(self) -> bool:
+        try:
+            import pyautogui
+            return True
+        except Exception:
+            return False
+
+    def grab(self, bbox):
+        import pyautogui
+        left, top, right, bottom = bbox
+        return pyautogui.screenshot(region=(left, top, right - left, bottom - top)).convert("RGB")
+
+
+class MSSBackend(CaptureBackend):
+    """mss (XShm/XGetImage on Linux, BitBlt on Windows, CoreGraphics on macOS)"""
+
+    name = "mss"
+    pooled = True
+
+    def __init__(self):
+        # mss handles are not thread-safe, keep one per thread
+        self._local = threading.local()
+
+    def is_available(self) -> bool:
+        try:
+            import mss
+            return True
+        except ImportError:
+            return False
+
+    def _handle(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            import mss
+            sct = mss.mss()
+            self._local.sct = sct
+        return sct
+
+    def grab(self, bbox):
+        left, top, right, bottom = bbox
+        shot = self._handle().grab({"left": left, "top": top, "width": right - left, "height": bottom - top})
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+    def grab_into(self, bbox, out):
+        left, top, right, bottom = bbox
+        shot = self._handle().grab({"left": left, "top": top, "width": right - left, "height": bottom - top})
+        width, height = shot.size
+        bgra = np.frombuffer(shot.bgra, dtype=np.uint8).reshape(height, width, 4)
+        if out.shape != (height, width, 3):
+            return np.ascontiguousarray(bgra[:, :, 2::-1])
+        out[...] = bgra[:, :, 2::-1]  # BGRA -> RGB without an intermediate image
+        return out
+
+    def close(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+            self._local.sct = None
+
+
+# Registered backends, in order of preference when timings tie
+BACKENDS = [MSSBackend, PILImageGrabBackend, PyAutoGUIBackend]
+
+
+def available_backends() -> List[CaptureBackend]:
+    """Instantiate every backend whose dependencies import"""
+    backends = []
+    for backend_cls in BACKENDS:
+        backend = backend_cls()
+        if backend.is_available():
+            backends.append(backend)
+    return backends
+
+
+def benchmark_backend(backend: CaptureBackend, bbox, samples: int = DEFAULT_BENCHMARK_SAMPLES) -> Optional[float]:
+    """Average seconds per grab, or None if the backend fails on this machine"""
+    try:
+        image = backend.grab(bbox)  # warm-up, also validates output
+        expected = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        if image is None or image.size != expected:
+            return None
+        start = time.perf_counter()
+        for _ in range(samples):
+            backend.grab(bbox)
+        return (time.perf_counter() - start) / samples
+    except Exception:
+        return None
+
+
+def select_fastest_backend(bbox=None, samples: int = DEFAULT_BENCHMARK_SAMPLES,
+                           backends=None) -> Tuple[Optional[CaptureBackend], Dict[str, Optional[float]]]:
+    """Benchmark backends on bbox and return (fastest, {name: seconds_per_grab})"""
+    if bbox is None or bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+        bbox = FALLBACK_BBOX
+    candidates = backends if backends is not None else available_backends()
+    timings = {}
+    best, best_time = None, None
+    for backend in candidates:
+        elapsed = benchmark_backend(backend, bbox, samples)
+        timings[backend.name] = elapsed
+        if elapsed is not None and (best_time is None or elapsed < best_time):
+            best, best_time = backend, elapsed
+    for backend in candidates:
+        if backend is not best:
+            backend.close()
+    return best, timings
+
+
+def format_timings(timings: Dict[str, Optional[float]]) -> str:
+    """Human readable benchmark summary"""
+    parts = []
+    for name, elapsed in sorted(timings.items(), key=lambda item: (item[1] is None, item[1] or 0)):
+        parts.append(f"{name}: {elapsed * 1000:.1f}ms" if elapsed is not None else f"{name}: failed")
+    return ", ".join(parts) if parts else "no capture backends available"
+
+
+if __name__ == "__main__":
+    box = tuple(int(v) for v in sys.argv[1:5]) if len(sys.argv) >= 5 else None
+    fastest, results = select_fastest_backend(box)
+    print(format_timings(results))
+    print(f"Selected backend: {fastest.name if fastest else 'none'}")
+    sys.exit(0 if fastest else 1)
@@ -7,16 +7,102 @@ import json
 import os
 import sys
 import platform
-from datetime import datetime, time
+import tempfile
+from datetime import datetime, time, date
 import subprocess
 import threading
+import multiprocessing
 from typing import Optional, Dict, Any
 
+from osenaabo_schedule import BettingSchedule, DEFAULT_WEEKLY_HOURS
+from osenaabo_metrics import PERSIST_SECONDS
+
 # Platform detection
 IS_MAC = platform.system() == 'Darwin'
 IS_WINDOWS = platform.system() == 'Windows'
 IS_LINUX = platform.system() == 'Linux'
 
+# ---------------------------
+# Data directory and session persistence (shared with the headless engine)
+# ---------------------------
+def get_data_directory():
+    """Get the writable data directory (same location the GUI uses)"""
+    try:
+        appdata_dir = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~')), 'Osenaabo')
+        os.makedirs(appdata_dir, exist_ok=True)
+        return appdata_dir
+    except Exception:
+        temp_dir = os.path.join(tempfile.gettempdir(), 'Osenaabo')
+        os.makedirs(temp_dir, exist_ok=True)
+        return temp_dir
+
+def get_data_path(*parts):
+    return os.path.join(get_data_directory(), *parts)
+
+def load_json_file(path, default=None):
+    """Load a JSON file, returning default if missing or unreadable"""
+    if not os.path.exists(path):
+        return {} if default is None else default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {} if default is None else default
+
+def save_json_file(path, data):
+    """Write a JSON file, returning True on success"""
+    try:
+        with PERSIST_SECONDS.time(kind="json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        return True
+    except Exception:
+        return False
+
+def load_config_json():
+    return load_json_file(get_data_path("config.json"))
+
+def load_coords_json():
+    return load_json_file(get_data_path("aviator_coordinates.json"))
+
+def load_license_json():
+    return load_json_file(get_data_path("license.json"))
+
+def get_today_session_file(platform=None):
+    """Get today's session file path (platform-suffixed when several platforms run at once)"""
+    sessions_dir = get_data_path("sessions")
+    os.makedirs(sessions_dir, exist_ok=True)
+    suffix = f"_{platform}" if platform else ""
+    return os.path.join(sessions_dir, f"session_{date.today().isoformat()}{suffix}.json")
+
+def get_today_cookies_file(platform=None):
+    return get_today_session_file(platform).replace('.json', '_cookies.json')
+
+def get_today_multipliers_file(platform=None):
+    return get_today_session_file(platform).replace('.json', '_multipliers.npz')
+
+def load_today_session(platform=None):
+    """Load today's session data"""
+    return load_json_file(get_today_session_file(platform), {"sessions": [], "target_reached": False})
+
+def save_today_session(session_data, platform=None):
+    """Save today's session data"""
+    save_json_file(get_today_session_file(platform), session_data)
+
+def add_session_record(profit, capital_after, target_reached=False, platform=None):
+    """Add a session record to today's sessions"""
+    session_data = load_today_session(platform)
+    session_data["sessions"].append({
+        "timestamp": datetime.now().isoformat(),
+        "profit": profit,
+        "capital_after": capital_after,
+        "target_reached": target_reached
+    })
+    if target_reached:
+        session_data["target_reached"] = True
+    save_today_session(session_data, platform)
+    return session_data
+
 class OsenaaboCore:
     """Core interface between GUI and bot logic"""
     
@@ -24,6 +110,34 @@ class OsenaaboCore:
         self.bot_process = None
         self.bot_running = False
         self.current_session_data = {}
+        self.on_log = print  # receives log lines streamed from the worker
+        self._stop_event = None
+        self._status_conn = None
+        self._status_thread = None
+        self._latest_status = self._idle_status()
+        self.schedule = self._load_schedule()
+
+    @staticmethod
+    def _load_schedule() -> BettingSchedule:
+        """Compile betting hours once (config.json 'betting_hours'/'timezone' override the defaults)"""
+        config = load_config_json()
+        try:
+            return BettingSchedule(config.get("betting_hours") or DEFAULT_WEEKLY_HOURS, config.get("timezone"))
+        except Exception as e:
+            print(f"Invalid betting hours in config, using defaults: {e}")
+            return BettingSchedule(DEFAULT_WEEKLY_HOURS)
+
+    @staticmethod
+    def _idle_status() -> Dict[str, Any]:
+        return {
+            "available": True,
+            "running": False,
+            "capital": 0,
+            "profit": 0,
+            "target_percent": 5,
+            "tick_rate": 0.0,
+            "errors": []
+        }
     
     def get_platform_tesseract_path(self):
         """Get Tesseract path based on platform"""
@@ -45,42 +159,46 @@ class OsenaaboCore:
     def get_betting_hours(self) -> str:
         """Get formatted betting hours for today"""
         try:
-            # Fallback betting hours - you can customize these
-            betting_hours = {
-                0: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Monday
-                1: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Tuesday
-                2: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Wednesday
-                3: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Thursday
-                4: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Friday
-                5: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Saturday
-                6: "09:00-12:00 | 14:00-17:00 | 19:00-22:00",  # Sunday
-            }
-            
-            today = datetime.now().weekday()
-            return betting_hours.get(today, "09:00-12:00 | 14:00-17:00 | 19:00-22:00")
-            
+            return self.schedule.hours_for_day() or "No betting hours today"
         except Exception as e:
             return "09:00-12:00 | 14:00-17:00 | 19:00-22:00"
     
     def is_within_betting_hours(self) -> bool:
         """Check if current time is within betting hours"""
         try:
-            now = datetime.now().time()
-            # Simple check for demo - adjust as needed
-            current_hour = now.hour
-            return (9 <= current_hour < 12) or (14 <= current_hour < 17) or (19 <= current_hour < 22)
+            return self.schedule.is_open()
         except:
             return True
     
+    def seconds_until_open(self) -> Optional[float]:
+        """Seconds until betting opens (0 if open now, None if never)"""
+        return self.schedule.seconds_until_open()
+    
+    def seconds_until_close(self) -> Optional[float]:
+        """Seconds until betting closes (0 if closed now)"""
+        return self.schedule.seconds_until_close()
+    
     def get_bot_status(self) -> Dict[str, Any]:
-        """Get current bot status"""
-        return {
-            "available": True,
-            "capital": 1000000,
-            "profit": 0,
-            "target_percent": 5,
-            "running": self.bot_running
-        }
+        """Get the latest status snapshot pushed by the worker"""
+        status = dict(self._latest_status)
+        status["running"] = self.bot_running
+        return status
+
+    def _read_status(self, conn):
+        """Receive status snapshots and log lines from the worker until it exits"""
+        try:
+            while True:
+                kind, payload = conn.recv()
+                if kind == "status":
+                    self._latest_status = payload
+                elif kind == "log" and self.on_log:
+                    self.on_log(payload)
+        except (EOFError, OSError):
+            pass
+        finally:
+            self.bot_running = False
+            if self.bot_process is not None:
+                self.bot_process.join(timeout=1)
     
     def start_bot(self, config: Dict[str, Any]) -> bool:
         """Start the bot with given configuration"""
@@ -96,8 +214,22 @@ class OsenaaboCore:
             with open(config_path, 'w') as f:
                 json.dump(config, f, indent=2)
             
+            # Launch the engine in a worker process that streams status back
+            from osenaabo_engine import run_worker
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+            self._stop_event = multiprocessing.Event()
+            self.bot_process = multiprocessing.Process(target=run_worker,
+                                                       args=(config, child_conn, self._stop_event),
+                                                       name="osenaabo-bot", daemon=True)
+            self._latest_status = self._idle_status()
+            self.bot_process.start()
+            child_conn.close()
+            
             self.bot_running = True
-            print("✅ Bot started successfully (simulation mode)")
+            self._status_conn = parent_conn
+            self._status_thread = threading.Thread(target=self._read_status, args=(parent_conn,), daemon=True)
+            self._status_thread.start()
+            print(f"✅ Bot started successfully (worker pid {self.bot_process.pid})")
             return True
             
         except Exception as e:
@@ -110,6 +242,16 @@ class OsenaaboCore:
         if not self.bot_running:
             return False
         
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self.bot_process is not None:
+            self.bot_process.join(timeout=10)
+            if self.bot_process.is_alive():
+                self.bot_process.terminate()
+                self.bot_process.join(timeout=2)
+        if self._status_thread is not None:
+            self._status_thread.join(timeout=2)
+        
         self.bot_running = False
         print("✅ Bot stopped successfully")
         return True
@@ -154,6 +296,12 @@ def get_betting_hours():
 def is_within_betting_hours():
     return core.is_within_betting_hours()
 
+def seconds_until_open():
+    return core.seconds_until_open()
+
+def seconds_until_close():
+    return core.seconds_until_close()
+
 def get_bot_status():
     return core.get_bot_status()
 
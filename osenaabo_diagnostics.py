@@ -0,0 +1,177 @@
+# osenaabo_diagnostics.py
+"""
+Memory diagnostics mode for OSENAABO!.
+
+Enabled with OSENAABO_DIAGNOSTICS=1 or config.json
+"diagnostics": {"enabled": true, "interval": 60}. A background thread takes a
+tracemalloc snapshot every interval, appends the top allocation growth since
+the previous snapshot to logs/memory_top.log, and appends process RSS,
+traced memory and gc generation counts to logs/memory_rss.csv.
+"""
+
+import os
+import gc
+import sys
+import threading
+import tracemalloc
+from datetime import datetime
+from typing import Optional, Callable, Dict
+
+from osenaabo_metrics import REGISTRY
+
+DIAGNOSTICS_ENV = "OSENAABO_DIAGNOSTICS"
+DEFAULT_INTERVAL = 60.0
+DEFAULT_TOP = 15
+TRACE_FRAMES = 5
+RSS_FILE = "memory_rss.csv"
+TOP_FILE = "memory_top.log"
+
+RSS_BYTES = REGISTRY.gauge("osenaabo_rss_bytes", "Resident set size of the process")
+TRACED_BYTES = REGISTRY.gauge("osenaabo_traced_bytes", "Memory currently traced by tracemalloc")
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Current resident set size, or None if it cannot be read on this platform"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        pass
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except Exception:
+            return None
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except Exception:
+            return None
+    try:
+        import resource  # peak, not current, on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return None
+
+
+def diagnostics_enabled(config: Optional[Dict] = None) -> bool:
+    if os.environ.get(DIAGNOSTICS_ENV, "").lower() in ("1", "true", "yes", "on"):
+        return True
+    return bool(((config or {}).get("diagnostics") or {}).get("enabled", False))
+
+
+class MemoryDiagnostics:
+    """Periodic tracemalloc diffs and RSS samples written under log_dir"""
+
+    def __init__(self, log_dir: str, interval: float = DEFAULT_INTERVAL, top: int = DEFAULT_TOP,
+                 extra_stats: Optional[Callable[[], Dict[str, int]]] = None):
+        self.log_dir = log_dir
+        self.interval = interval
+        self.top = top
+        self.extra_stats = extra_stats  # e.g. frame pool stats, appended to every CSV row
+        self.rss_path = os.path.join(log_dir, RSS_FILE)
+        self.top_path = os.path.join(log_dir, TOP_FILE)
+        self._baseline = None
+        self._previous = None
+        self._started_tracing = False
+        self._thread = None
+        self._stop_event = threading.Event()
+        self.samples = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict], log_dir: str, **kwargs) -> Optional["MemoryDiagnostics"]:
+        """A diagnostics instance if enabled by env var or config, else None"""
+        if not diagnostics_enabled(config):
+            return None
+        settings = (config or {}).get("diagnostics") or {}
+        return cls(log_dir, interval=float(settings.get("interval", DEFAULT_INTERVAL)),
+                   top=int(settings.get("top", DEFAULT_TOP)), **kwargs)
+
+    def start(self) -> "MemoryDiagnostics":
+        os.makedirs(self.log_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._started_tracing = True
+        self._baseline = self._previous = self._snapshot()
+        self._thread = threading.Thread(target=self._run, name="osenaabo-memory", daemon=True)
+        self._thread.start()
+        print(f"🧪 Memory diagnostics on: sampling every {self.interval:g}s into {self.log_dir}")
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @staticmethod
+    def _snapshot():
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"Memory diagnostics error: {e}")
+        try:
+            self.sample(final=True)
+        except Exception:
+            pass
+
+    def sample(self, final: bool = False):
+        """Write one RSS row and the top allocation growth since the previous sample"""
+        gc.collect()
+        snapshot = self._snapshot()
+        now = datetime.now().isoformat(timespec="seconds")
+        rss = get_rss_bytes()
+        traced, peak = tracemalloc.get_traced_memory()
+        extra = self.extra_stats() if self.extra_stats else {}
+        self.samples += 1
+        if rss is not None:
+            RSS_BYTES.set(rss)
+        TRACED_BYTES.set(traced)
+
+        new_file = not os.path.exists(self.rss_path)
+        with open(self.rss_path, "a", encoding="utf-8") as f:
+            if new_file:
+                f.write(",".join(["time", "rss_bytes", "traced_bytes", "traced_peak_bytes",
+                                  "gc_gen0", "gc_gen1", "gc_gen2"] + sorted(extra)) + "\n")
+            row = [now, "" if rss is None else str(rss), str(traced), str(peak)]
+            row += [str(count) for count in gc.get_count()]
+            row += [str(extra[key]) for key in sorted(extra)]
+            f.write(",".join(row) + "\n")
+
+        # Growth since the last sample shows what is accumulating right now;
+        # the final report compares against the baseline taken at start().
+        reference = self._baseline if final else self._previous
+        diff = snapshot.compare_to(reference, "lineno")
+        with open(self.top_path, "a", encoding="utf-8") as f:
+            label = "since start" if final else "since previous sample"
+            f.write(f"=== {now} rss={rss} traced={traced} ({label}) ===\n")
+            for stat in diff[:self.top]:
+                f.write(f"{stat}\n")
+            f.write("\n")
+        self._previous = snapshot
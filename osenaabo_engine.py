@@ -0,0 +1,508 @@
+# osenaabo_engine.py
+"""
+Tk-free bot engine for OSENAABO!.
+
+BotEngine owns the bot loop with its session handling and persistence
+(session cookies, multiplier history, round journal, capture backend
+selection) using only osenaabo_core, so the GUI's bot thread, the headless
+entry point and worker processes all run the same code without the engine
+loading customtkinter.
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, Callable
+
+import osenaabo_core as core
+from osenaabo_schedule import format_duration
+from osenaabo_metrics import TICKS, TICK_SECONDS, CAPTURE_SECONDS, PERSIST_SECONDS, ERRORS
+
+try:
+    from osenaabo_regions import compile_regions
+except ImportError:
+    compile_regions = None
+
+try:
+    from osenaabo_history import MultiplierRing
+except ImportError:
+    MultiplierRing = None
+
+try:
+    from osenaabo_journal import RoundJournal, get_journal_file, settle
+except ImportError:
+    RoundJournal = None
+    settle = None
+
+try:
+    from osenaabo_simulator import strategy_from_config
+except ImportError:
+    strategy_from_config = None
+
+try:
+    import osenaabo_capture
+except ImportError:
+    osenaabo_capture = None
+
+try:
+    from osenaabo_buffers import FramePool
+except ImportError:
+    FramePool = None
+
+try:
+    from osenaabo_anchor import AnchorTracker, DEFAULT_CHECK_INTERVAL as ANCHOR_CHECK_INTERVAL
+except ImportError:
+    AnchorTracker = None
+    ANCHOR_CHECK_INTERVAL = None
+
+DEFAULT_TICK_INTERVAL = 2.0
+DEFAULT_MAX_TICKS = 10
+OCR_TIMEOUT = 10.0
+COOKIE_SAVE_EVERY = 3
+DAILY_TARGET_PERCENT = 5.0
+MAX_RECENT_ERRORS = 20
+
+
+def resolve_session_type(requested: Optional[str] = None, platform: Optional[str] = None) -> str:
+    """
+    Non-interactive counterpart of the GUI's check_session_continuation().
+    Returns "fresh", "continue", "reset" or "tomorrow" (target already reached).
+    """
+    session_data = core.load_today_session(platform)
+    if not session_data.get("sessions"):
+        return "fresh"
+    if session_data.get("target_reached", False):
+        return "reset" if requested == "reset" else "tomorrow"
+    return requested if requested in ("fresh", "continue", "reset") else "continue"
+
+
+class BotEngine:
+    """Bot loop with session persistence, independent of any GUI toolkit"""
+
+    def __init__(self, capital: float, stop_loss: float, coords: Optional[Dict[str, Any]] = None,
+                 log: Callable[[str], None] = print, stop_event: Optional[threading.Event] = None,
+                 tick_interval: float = DEFAULT_TICK_INTERVAL, max_ticks: Optional[int] = DEFAULT_MAX_TICKS,
+                 respect_hours: bool = False, platform: Optional[str] = None, capture_backend=None, ocr=None,
+                 profiles=None, profile: Optional[str] = None, frame_pool=None,
+                 strategy: Optional[Dict[str, float]] = None):
+        self.capital = capital
+        self.stop_loss = stop_loss
+        self.session_start_capital = capital
+        self.coords = coords if coords is not None else core.load_coords_json()
+        self.regions = compile_regions(self.coords) if compile_regions else None
+        self.log = log
+        self.stop_event = stop_event or threading.Event()
+        self.tick_interval = tick_interval
+        self.max_ticks = max_ticks
+        self.respect_hours = respect_hours
+        self.platform = platform  # set when several platforms run at once: suffixes session files
+        self.ocr = ocr  # shared OCRService; a single engine starts its own
+        self._owns_ocr = ocr is None
+        # cashout, cashout2 (0 = Block 2 off) and base_fraction, as in the backtester
+        if strategy is None and strategy_from_config:
+            strategy = strategy_from_config(core.load_config_json())
+        self.strategy = strategy or {"cashout": 0.0, "cashout2": 0.0, "base_fraction": 0.0}
+        self.profiles = profiles  # shared ProfileStore; where a platform engine saves re-anchored coords
+        self.profile = profile or platform  # platform whose profile re-anchored coords are saved to
+
+        self.session_cookies = {}
+        self.multiplier_history = MultiplierRing() if MultiplierRing else None
+        self.journal = RoundJournal(get_journal_file(core.get_data_path("sessions"), platform)) if RoundJournal else None
+        self.capture_backend = capture_backend
+        self._owns_capture = capture_backend is None  # shared backends are closed by their owner
+        self._last_history_text = None
+        self.frame_pool = frame_pool if frame_pool is not None else (FramePool() if FramePool else None)
+        self.anchor = AnchorTracker.from_coords(self.coords) if AnchorTracker else None
+        self.anchor_lost = False
+        self.drift = [0, 0]
+        self._next_anchor_check = 0.0
+
+        self.on_status = None  # optional callback(status_dict) after every tick
+        self.on_round = None  # optional callback(won, profit) after every round with a stake
+        self.on_session = None  # optional callback(session_record) after every add_session_record()
+        self.on_stop_loss = None  # optional callback(capital, loss_percent)
+        self.finished = False  # daily target or stop loss reached
+        self._unrecorded_rounds = 0
+        self.running = False
+        self.ticks = 0
+        self.started_at = None
+        self.errors = []
+
+    # ---- session handling ----
+    def prepare_session(self, session_type: str) -> bool:
+        """Apply fresh/continue/reset the way the GUI does; False means do not start"""
+        if session_type == "tomorrow":
+            self.log("Target already reached today - session not started")
+            return False
+
+        if session_type == "continue":
+            session_data = core.load_today_session(self.platform)
+            if session_data.get("sessions"):
+                self.session_start_capital = session_data["sessions"][-1]["capital_after"]
+                self.capital = self.session_start_capital
+                self.log(f"Continuing from previous session. Capital: ₦{self.session_start_capital:,.2f}")
+                self._load_session_cookies()
+                self._load_multiplier_history()
+        else:
+            self.session_start_capital = self.capital
+            if session_type == "reset":
+                core.save_today_session({"sessions": [], "target_reached": False}, self.platform)
+                self.session_cookies = {}
+                self._save_session_cookies()
+                self.log("Previous session data cleared. Starting fresh session.")
+            else:
+                self.log("Starting fresh session.")
+        return True
+
+    def _load_session_cookies(self):
+        try:
+            cookies_file = core.get_today_cookies_file(self.platform)
+            if os.path.exists(cookies_file):
+                with open(cookies_file, 'r') as f:
+                    self.session_cookies = json.load(f)
+                self.log("Session cookies loaded")
+        except Exception as e:
+            self.log(f"Error loading session cookies: {e}")
+
+    def _save_session_cookies(self):
+        try:
+            with PERSIST_SECONDS.time(kind="cookies"), open(core.get_today_cookies_file(self.platform), 'w') as f:
+                json.dump(self.session_cookies, f, indent=2)
+        except Exception as e:
+            self.log(f"Error saving session cookies: {e}")
+
+    def _load_multiplier_history(self):
+        snapshot_file = core.get_today_multipliers_file(self.platform)
+        if MultiplierRing and os.path.exists(snapshot_file):
+            self.multiplier_history = MultiplierRing.load(snapshot_file)
+            self.log(f"Multiplier history loaded ({len(self.multiplier_history)} rounds)")
+
+    def _save_multiplier_history(self):
+        if self.multiplier_history is not None:
+            with PERSIST_SECONDS.time(kind="multipliers"):
+                self.multiplier_history.save(core.get_today_multipliers_file(self.platform))
+
+    def record_multiplier(self, multiplier: float, **bets):
+        """Record a round; bets are the journal's block1_stake/cashout1/block2_stake/cashout2"""
+        if self.multiplier_history is not None:
+            self.multiplier_history.append(multiplier)
+        if self.journal is not None:
+            try:
+                with PERSIST_SECONDS.time(kind="journal"):
+                    self.journal.append(multiplier, **bets)
+            except Exception as e:
+                self._record_error(f"Round journal error: {e}")
+
+    # ---- staking ----
+    def current_bets(self) -> Dict[str, float]:
+        """Stakes and auto cash-outs set on both blocks: base_fraction of the session's starting capital"""
+        base = self.session_start_capital * self.strategy["base_fraction"]
+        cashout2 = self.strategy["cashout2"]
+        return {"block1_stake": base, "cashout1": self.strategy["cashout"],
+                "block2_stake": base if cashout2 > 0 else 0.0, "cashout2": cashout2}
+
+    def settle_round(self, multiplier: float) -> float:
+        """Apply a finished round to capital and journal it with the stakes used; returns the profit"""
+        bets = self.current_bets()
+        outcome, profit = settle(multiplier, **bets) if settle else (0, 0.0)
+        self.capital += profit
+        self.record_multiplier(multiplier, outcome=outcome, profit=profit, **bets)
+        if outcome:
+            self._unrecorded_rounds += 1
+            self._emit(self.on_round, profit > 0, profit)
+            self._check_limits()
+        return profit
+
+    def _check_limits(self) -> bool:
+        """Save the session and finish once the daily target or the stop loss is reached"""
+        if not self.session_start_capital or self.finished:
+            return self.finished
+        profit = self.capital - self.session_start_capital
+        percent = profit / self.session_start_capital * 100.0
+        if percent >= DAILY_TARGET_PERCENT:
+            self.log(f"Daily target reached: ₦{profit:+,.2f} ({percent:.2f}%)")
+            self._record_session(target_reached=True)
+        elif -percent >= self.stop_loss:
+            self.log(f"Stop loss hit: ₦{profit:+,.2f} ({percent:.2f}%)")
+            self._record_session()
+            self._emit(self.on_stop_loss, self.capital, -percent)
+        else:
+            return False
+        self.finished = True
+        return True
+
+    def _record_session(self, target_reached: bool = False):
+        session_data = core.add_session_record(self.capital - self.session_start_capital, self.capital,
+                                               target_reached, self.platform)
+        self._unrecorded_rounds = 0
+        self._emit(self.on_session, session_data["sessions"][-1])
+
+    def _emit(self, callback, *args):
+        if callback:
+            try:
+                callback(*args)
+            except Exception as e:
+                self.log(f"Event callback error: {e}")
+
+    # ---- main loop ----
+    def _start_ocr(self):
+        if self.ocr is not None or not self.capture_backend:
+            return
+        from osenaabo_multi import OCRService  # imports this module
+        ocr = OCRService(workers=1, tesseract_cmd=core.get_platform_tesseract_path())
+        if ocr.available:
+            self.ocr = ocr
+        else:
+            ocr.close()
+            self.log("pytesseract not available - round history is not read")
+
+    def _select_capture_backend(self):
+        if not osenaabo_capture or self.capture_backend:
+            return
+        bbox = self.regions.bounding_box() if self.regions else None
+        self.capture_backend, timings = osenaabo_capture.select_fastest_backend(bbox)
+        self.log(f"Capture benchmark: {osenaabo_capture.format_timings(timings)}")
+        if self.capture_backend:
+            self.log(f"Using capture backend: {self.capture_backend.name}")
+        else:
+            self.log("No working screen capture backend found")
+
+    def grab(self, bbox):
+        """
+        Capture through the selected backend, timing every grab. Backends that
+        can write in place fill a frame from the fixed-size frame pool; hand
+        every frame back with release_frame().
+        """
+        backend = self.capture_backend
+        with CAPTURE_SECONDS.time(backend=backend.name):
+            if self.frame_pool is None or not backend.pooled:
+                return backend.grab(bbox)
+            return self.frame_pool.fill(bbox, backend.grab_into)
+
+    def release_frame(self, frame):
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
+
+    def _check_anchor(self):
+        """Re-anchor all regions if the game window moved since calibration"""
+        if not self.anchor or not self.capture_backend or self.regions is None:
+            return
+        now = time.monotonic()
+        if now < self._next_anchor_check:
+            return
+        self._next_anchor_check = now + ANCHOR_CHECK_INTERVAL
+        try:
+            offset = self.anchor.check(self.grab, self.release_frame)
+        except Exception as e:
+            self._record_error(f"Anchor check error: {e}")
+            return
+        if offset is None:
+            if not self.anchor_lost:
+                self.log("Anchor not found near its calibrated position - window covered or moved far; recalibrate if this persists")
+            self.anchor_lost = True
+            return
+        self.anchor_lost = False
+        dx, dy = offset
+        if dx or dy:
+            self.regions = self.regions.translated(dx, dy)
+            self.coords = self.regions.to_coords()
+            self.drift[0] += dx
+            self.drift[1] += dy
+            self._save_coords()
+            self.log(f"Window moved by ({dx:+d}, {dy:+d}) - regions re-anchored "
+                     f"({self.anchor.last_check_ms:.1f} ms)")
+
+    def _save_coords(self):
+        """
+        Persist re-anchored coords to the profile. Platform engines run side by
+        side, so only a single engine also writes aviator_coordinates.json.
+        """
+        if self.platform is None:
+            core.save_json_file(core.get_data_path("aviator_coordinates.json"), self.coords)
+        if self.profiles is not None and self.profile:
+            self.profiles.save(self.profile, self.coords)
+
+    def _record_error(self, message: str):
+        ERRORS.inc()
+        self.errors.append({"time": datetime.now().isoformat(), "message": message})
+        del self.errors[:-MAX_RECENT_ERRORS]
+        self.log(message)
+
+    def _wait_for_betting_hours(self) -> bool:
+        """Sleep until the betting window opens; False if stopped meanwhile"""
+        wait = core.seconds_until_open()
+        if wait is None:
+            self.log("No betting hours configured - stopping")
+            self.stop_event.set()
+            return False
+        if wait <= 0:
+            return not self.stop_event.is_set()
+        self.log(f"Outside betting hours - sleeping {format_duration(wait)} until the window opens")
+        self._publish_status()
+        return not self.stop_event.wait(wait)
+
+    def read_region_text(self, name: str) -> Optional[str]:
+        """OCR one calibrated region through the shared OCR service"""
+        if not self.ocr or not self.capture_backend or self.regions is None or name not in self.regions:
+            return None
+        frame = self.grab(self.regions[name].bbox)
+        try:
+            future = self.ocr.submit(frame, region=name)
+        except Exception:
+            self.release_frame(frame)
+            raise
+        # The worker may still be reading the frame after a timeout: only
+        # hand it back to the pool once the OCR call has finished
+        future.add_done_callback(lambda _: self.release_frame(frame))
+        return future.result(timeout=OCR_TIMEOUT)
+
+    def _read_history(self):
+        """Settle the newest round when the history strip changes"""
+        text = self.read_region_text("Block1_History")
+        if not text or text == self._last_history_text:
+            return
+        first_read = self._last_history_text is None
+        self._last_history_text = text
+        values = re.findall(r"(\d+(?:\.\d+)?)\s*x", text)
+        if not values:
+            return
+        if first_read:
+            # Finished before the bot set its stakes: observed only
+            self.record_multiplier(float(values[0]))
+        else:
+            self.settle_round(float(values[0]))
+
+    def tick(self):
+        """One iteration of the bot loop"""
+        self.log(f"Bot running... {self.ticks}")
+        if self.ocr:
+            self._read_history()
+        if self.ticks % COOKIE_SAVE_EVERY == 0:
+            self.session_cookies['last_activity'] = datetime.now().isoformat()
+            self._save_session_cookies()
+            self.log("Session cookies updated")
+
+    def run(self):
+        """Run until stopped or max_ticks is reached"""
+        self.running = True
+        self.started_at = time.monotonic()
+        try:
+            self._save_session_cookies()
+            self._select_capture_backend()
+            self._start_ocr()
+
+            while not self.stop_event.is_set() and not self.finished and \
+                    (self.max_ticks is None or self.ticks < self.max_ticks):
+                if self.respect_hours and not core.is_within_betting_hours():
+                    if not self._wait_for_betting_hours():
+                        break
+                    continue
+                with TICK_SECONDS.time():
+                    self._check_anchor()
+                    try:
+                        self.tick()
+                    except Exception as e:
+                        self._record_error(f"Tick error: {e}")
+                self.ticks += 1
+                TICKS.inc()
+                self._publish_status()
+                self.stop_event.wait(self.tick_interval)
+
+            if not self.stop_event.is_set():
+                self.log("Bot completed normally")
+            else:
+                self.log("Bot stopped by user")
+        except Exception as e:
+            self._record_error(f"Bot error: {str(e)}")
+        finally:
+            self.running = False
+            if self._unrecorded_rounds:
+                # Lets the next run continue from this capital
+                self._record_session()
+            self._save_session_cookies()
+            self._save_multiplier_history()
+            if self.journal is not None:
+                self.journal.close()
+            if self.capture_backend and self._owns_capture:
+                self.capture_backend.close()
+            if self.ocr and self._owns_ocr:
+                self.ocr.close()
+                self.ocr = None
+            self._publish_status()
+
+    def stop(self):
+        self.stop_event.set()
+
+    # ---- status ----
+    def status(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        profit = self.capital - self.session_start_capital
+        return {
+            "available": True,
+            "platform": self.platform,
+            "running": self.running,
+            "capital": self.capital,
+            "profit": profit,
+            "target_percent": DAILY_TARGET_PERCENT,
+            "progress_percent": (profit / self.session_start_capital * 100.0) if self.session_start_capital else 0.0,
+            "ticks": self.ticks,
+            "tick_rate": self.ticks / elapsed if elapsed > 0 else 0.0,
+            "errors": list(self.errors),
+            "drift": list(self.drift),
+            "updated_at": time.time(),
+        }
+
+    def _publish_status(self):
+        if self.on_status:
+            try:
+                self.on_status(self.status())
+            except Exception as e:
+                print(f"Status publish error: {e}")
+
+
+def run_worker(config: Dict[str, Any], conn, stop_event):
+    """
+    Worker process entry point used by OsenaaboCore.start_bot().
+    Streams ("status", dict) and ("log", str) messages over conn until the
+    engine finishes or stop_event is set.
+    """
+    send_lock = threading.Lock()
+
+    def send(kind, payload):
+        try:
+            with send_lock:
+                conn.send((kind, payload))
+        except (OSError, EOFError, BrokenPipeError):
+            stop_event.set()  # parent went away
+
+    def log(msg):
+        send("log", f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+    try:
+        if config.get("platforms"):
+            from osenaabo_multi import MultiEngineRunner
+            runner = MultiEngineRunner(config["platforms"], config, log=log, stop_event=stop_event)
+            runner.on_status = lambda status: send("status", status)
+            runner.run()
+            return
+        engine = BotEngine(float(config.get("capital", 1000000)), float(config.get("stop_loss", 20.0)),
+                           config.get("coords"), log=log, stop_event=stop_event,
+                           tick_interval=float(config.get("tick_interval", DEFAULT_TICK_INTERVAL)),
+                           max_ticks=config.get("max_ticks", DEFAULT_MAX_TICKS),
+                           respect_hours=bool(config.get("respect_hours", False)))
+        engine.on_status = lambda status: send("status", status)
+        if engine.prepare_session(resolve_session_type(config.get("session_type"))):
+            engine.run()
+        else:
+            send("status", engine.status())
+    except Exception as e:
+        send("status", {"available": False, "running": False,
+                        "errors": [{"time": datetime.now().isoformat(), "message": f"Worker error: {e}"}]})
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,154 @@
+# osenaabo_headless.py
+"""
+Headless command-line entry point for OSENAABO!.
+
+Reads config.json and aviator_coordinates.json from the data directory and
+runs BotEngine with the GUI's session and persistence logic, logging to
+logs/headless.log. Nothing here imports tkinter or customtkinter.
+
+Usage:
+    python osenaabo_headless.py --capital 1000000 --stop-loss 20 --session continue
+    python osenaabo_headless.py --platforms SportyBetNg,BetwayNg
+"""
+
+import sys
+import signal
+import logging
+import argparse
+import threading
+
+import osenaabo_core as core
+from osenaabo_engine import BotEngine, resolve_session_type, DEFAULT_TICK_INTERVAL, DEFAULT_MAX_TICKS
+from osenaabo_logging import setup_file_logging
+from osenaabo_metrics import REGISTRY, MetricsExporter, status_collector
+from osenaabo_diagnostics import MemoryDiagnostics
+
+try:
+    from osenaabo_profiles import ProfileStore
+except ImportError:
+    ProfileStore = None
+
+DEFAULT_CAPITAL = 1000000.0
+DEFAULT_STOP_LOSS = 20.0
+HEADLESS_LOG_FILE = "headless.log"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run the OSENAABO! engine without the GUI")
+    parser.add_argument("--capital", type=float, default=None,
+                        help="starting capital (default: config.json 'capital' or 1000000)")
+    parser.add_argument("--stop-loss", type=float, default=None,
+                        help="stop loss percent (default: config.json 'stop_loss' or 20)")
+    parser.add_argument("--session", choices=["auto", "fresh", "continue", "reset"], default="auto",
+                        help="how to treat sessions already recorded today")
+    parser.add_argument("--ignore-hours", action="store_true",
+                        help="run outside configured betting hours instead of sleeping until they open")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_MAX_TICKS, help="stop after N ticks (0 = run until stopped)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_TICK_INTERVAL, help="seconds between ticks")
+    parser.add_argument("--quiet", action="store_true", help="log to file only")
+    parser.add_argument("--platforms", default=None,
+                        help="comma-separated platforms to run concurrently, each with its own calibration profile")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus metrics on 127.0.0.1:PORT (default: config.json metrics.port)")
+    return parser
+
+
+def run_platforms(args, config, capital, stop_loss, stop_event, log):
+    """Drive several platforms at once with shared capture and OCR"""
+    from osenaabo_multi import MultiEngineRunner
+
+    platforms = [p.strip() for p in args.platforms.split(",") if p.strip()]
+    runner_config = dict(config, capital=capital, stop_loss=stop_loss, tick_interval=args.interval,
+                         max_ticks=args.ticks or None, respect_hours=not args.ignore_hours,
+                         session_type=None if args.session == "auto" else args.session)
+    runner = MultiEngineRunner(platforms, runner_config, log=log, stop_event=stop_event)
+    if not runner.build():
+        return 2
+    REGISTRY.add_collector(status_collector(runner.status))
+    diagnostics = MemoryDiagnostics.from_config(config, core.get_data_path("logs"), extra_stats=runner.frame_stats)
+    if diagnostics:
+        diagnostics.start()
+    try:
+        runner.run()
+    finally:
+        if diagnostics:
+            diagnostics.stop()
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    logger, listener = setup_file_logging(core.get_data_path("logs"), name="osenaabo.headless",
+                                          file_name=HEADLESS_LOG_FILE)
+    if not args.quiet:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%H:%M:%S"))
+        logger.addHandler(console)
+
+    def log(msg):
+        logger.info(msg)
+
+    exporter = None
+    diagnostics = None
+    try:
+        license_data = core.load_license_json()
+        if not license_data or not license_data.get("valid"):
+            log("Valid license required to start bot")
+            return 2
+
+        config = core.load_config_json()
+        capital = args.capital if args.capital is not None else float(config.get("capital", DEFAULT_CAPITAL))
+        stop_loss = args.stop_loss if args.stop_loss is not None else float(config.get("stop_loss", DEFAULT_STOP_LOSS))
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+        if args.metrics_port is not None:
+            config.setdefault("metrics", {})["port"] = args.metrics_port
+        exporter = MetricsExporter.from_config(config, core.get_data_path("logs")).start()
+
+        if args.platforms:
+            return run_platforms(args, config, capital, stop_loss, stop_event, log)
+
+        platform = config.get("platform", "SportyBetNg")
+        coords = None
+        if ProfileStore:
+            key, coords = ProfileStore(core.get_data_path("profiles")).select(platform)
+            if coords:
+                log(f"Calibration profile: {key}")
+        coords = coords or core.load_coords_json()
+        if not coords:
+            log("No calibration found - run calibration from the GUI first")
+            return 2
+
+        engine = BotEngine(capital, stop_loss, coords, log=log, stop_event=stop_event,
+                           tick_interval=args.interval, max_ticks=args.ticks or None,
+                           respect_hours=not args.ignore_hours)
+
+        REGISTRY.add_collector(status_collector(engine.status))
+        diagnostics = MemoryDiagnostics.from_config(
+            config, core.get_data_path("logs"),
+            extra_stats=lambda: {f"frames_{k}": v for k, v in engine.frame_pool.stats().items()}
+            if engine.frame_pool else {})
+        if diagnostics:
+            diagnostics.start()
+        session_type = resolve_session_type(None if args.session == "auto" else args.session)
+        log(f"Platform: {platform} | Session: {session_type}")
+        if not engine.prepare_session(session_type):
+            return 1
+
+        engine.run()
+        return 0
+    finally:
+        if diagnostics:
+            diagnostics.stop()
+        if exporter:
+            exporter.stop()
+        if listener:
+            listener.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# osenaabo_history.py
+"""
+In-memory time series of observed crash multipliers for OSENAABO! GUI.
+
+Every multiplier read from Block1_History is appended to a fixed-capacity
+NumPy ring buffer with its timestamp. Windowed statistics are computed with
+vectorized NumPy operations so decision code never rescans Python lists.
+"""
+
+import os
+import time
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+
+DEFAULT_CAPACITY = 10000
+
+
+class MultiplierRing:
+    """Fixed-capacity ring buffer of (timestamp, multiplier) observations"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self._values = np.zeros(self.capacity, dtype=np.float64)
+        self._times = np.zeros(self.capacity, dtype=np.float64)
+        self._head = 0  # next write position
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, multiplier: float, timestamp: Optional[float] = None):
+        """Record one observation in O(1), overwriting the oldest when full"""
+        with self._lock:
+            self._values[self._head] = multiplier
+            self._times[self._head] = time.time() if timestamp is None else timestamp
+            self._head = (self._head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def extend(self, multipliers: Sequence[float], timestamps: Optional[Sequence[float]] = None):
+        """Append many observations, oldest first"""
+        values = np.asarray(multipliers, dtype=np.float64).ravel()
+        if timestamps is None:
+            times = np.full(len(values), time.time())
+        else:
+            times = np.asarray(timestamps, dtype=np.float64).ravel()
+        if len(values) > self.capacity:
+            values, times = values[-self.capacity:], times[-self.capacity:]
+        with self._lock:
+            n = len(values)
+            positions = (self._head + np.arange(n)) % self.capacity
+            self._values[positions] = values
+            self._times[positions] = times
+            self._head = (self._head + n) % self.capacity
+            self._count = min(self._count + n, self.capacity)
+
+    def clear(self):
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+    def _copy(self, data, n: int):
+        """Chronological copy of the newest n entries of data; caller holds the lock"""
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return data[start:start + n].copy()
+        return np.concatenate((data[start:], data[:self._head]))
+
+    def _ordered(self, data, window: Optional[int]):
+        """Chronological copy of the newest `window` entries of data"""
+        with self._lock:
+            n = self._count if window is None else max(0, min(int(window), self._count))
+            return self._copy(data, n)
+
+    def snapshot(self):
+        """(timestamps, multipliers) of every observation, taken under one lock"""
+        with self._lock:
+            return self._copy(self._times, self._count), self._copy(self._values, self._count)
+
+    def values(self, window: Optional[int] = None):
+        """Newest `window` multipliers (all if None), oldest first"""
+        return self._ordered(self._values, window)
+
+    def timestamps(self, window: Optional[int] = None):
+        return self._ordered(self._times, window)
+
+    def latest(self) -> Optional[float]:
+        with self._lock:
+            if not self._count:
+                return None
+            return float(self._values[(self._head - 1) % self.capacity])
+
+    def since(self, seconds: float, now: Optional[float] = None):
+        """Multipliers observed within the last `seconds`"""
+        times, values = self.snapshot()
+        cutoff = (time.time() if now is None else now) - seconds
+        return values[np.searchsorted(times, cutoff, side="left"):]
+
+    def mean(self, window: Optional[int] = None) -> Optional[float]:
+        values = self.values(window)
+        return float(values.mean()) if len(values) else None
+
+    def rolling_mean(self, window: int):
+        """Mean of every consecutive `window` multipliers"""
+        values = self.values()
+        if window <= 0 or len(values) < window:
+            return np.zeros(0, dtype=np.float64)
+        csum = np.cumsum(np.concatenate(([0.0], values)))
+        return (csum[window:] - csum[:-window]) / window
+
+    def count_below(self, threshold: float, window: Optional[int] = None) -> int:
+        return int(np.count_nonzero(self.values(window) < threshold))
+
+    def count_at_least(self, threshold: float, window: Optional[int] = None) -> int:
+        return int(np.count_nonzero(self.values(window) >= threshold))
+
+    def streak_lengths(self, threshold: float, window: Optional[int] = None):
+        """Lengths of every run of consecutive multipliers below threshold"""
+        below = self.values(window) < threshold
+        if not below.any():
+            return np.zeros(0, dtype=np.int64)
+        edges = np.diff(np.concatenate(([0], below.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return ends - starts
+
+    def current_streak(self, threshold: float) -> int:
+        """How many of the newest multipliers in a row are below threshold"""
+        values = self.values()
+        at_least = np.flatnonzero(values >= threshold)
+        if not len(at_least):
+            return len(values)
+        return int(len(values) - 1 - at_least[-1])
+
+    def quantiles(self, qs: Sequence[float], window: Optional[int] = None):
+        values = self.values(window)
+        if not len(values):
+            return np.full(len(qs), np.nan)
+        return np.quantile(values, qs)
+
+    def save(self, path: str) -> bool:
+        """Snapshot the buffer to an .npz file"""
+        try:
+            tmp_path = f"{path}.tmp"
+            times, values = self.snapshot()
+            with open(tmp_path, "wb") as f:
+                np.savez(f, values=values, timestamps=times,
+                         capacity=np.array(self.capacity))
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"Error saving multiplier history: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: str, capacity: Optional[int] = None) -> "MultiplierRing":
+        """Restore a snapshot, or return an empty buffer if unavailable"""
+        try:
+            with np.load(path) as data:
+                ring = cls(capacity or int(data["capacity"]))
+                ring.extend(data["values"], data["timestamps"])
+                return ring
+        except Exception:
+            return cls(capacity or DEFAULT_CAPACITY)
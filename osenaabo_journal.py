@@ -0,0 +1,171 @@
+# osenaabo_journal.py
+"""
+Append-only round journal for OSENAABO!.
+
+Every observed round is appended to sessions/rounds[_<platform>].osj as one
+fixed-width 48-byte record (struct-packed, little-endian) after a 16-byte
+header. Nothing is ever rewritten, so a crash can at most leave a torn
+record at the end, which the writer trims and the reader ignores.
+
+Readers map the file with a NumPy structured dtype, so analytics and
+backtests scan millions of rounds without parsing JSON:
+
+    rounds = read_journal(path)          # np.memmap, one row per round
+    rounds["multiplier"].mean()
+"""
+
+import os
+import glob
+import struct
+import threading
+import time
+from typing import Optional, List
+
+import numpy as np
+
+MAGIC = b"OSJRNL"
+VERSION = 1
+HEADER = struct.Struct("<6sHI4x")  # magic, version, record size
+JOURNAL_EXT = ".osj"
+
+# timestamp, multiplier, cashout1, cashout2, outcome, block1_stake, block2_stake, profit
+RECORD = struct.Struct("<dfffB3xddd")
+RECORD_DTYPE = np.dtype({
+    "names": ["timestamp", "multiplier", "cashout1", "cashout2", "outcome",
+              "block1_stake", "block2_stake", "profit"],
+    "formats": ["<f8", "<f4", "<f4", "<f4", "u1", "<f8", "<f8", "<f8"],
+    "offsets": [0, 8, 12, 16, 20, 24, 32, 40],
+    "itemsize": RECORD.size,
+})
+
+# outcome bit flags; 0 means the round was only observed (no bet placed)
+BLOCK1_BET = 1
+BLOCK1_WIN = 2
+BLOCK2_BET = 4
+BLOCK2_WIN = 8
+
+
+def get_journal_file(sessions_dir: str, platform: Optional[str] = None) -> str:
+    name = f"rounds_{platform}{JOURNAL_EXT}" if platform else f"rounds{JOURNAL_EXT}"
+    return os.path.join(sessions_dir, name)
+
+
+def list_journals(sessions_dir: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(sessions_dir, f"rounds*{JOURNAL_EXT}")))
+
+
+def settle(multiplier: float, block1_stake: float = 0.0, cashout1: float = 0.0,
+           block2_stake: float = 0.0, cashout2: float = 0.0):
+    """(outcome flags, profit) of a round with auto cash-out on both blocks"""
+    outcome = 0
+    profit = 0.0
+    for stake, cashout, bet_flag, win_flag in ((block1_stake, cashout1, BLOCK1_BET, BLOCK1_WIN),
+                                               (block2_stake, cashout2, BLOCK2_BET, BLOCK2_WIN)):
+        if stake <= 0:
+            continue
+        outcome |= bet_flag
+        if cashout > 0 and multiplier >= cashout:
+            outcome |= win_flag
+            profit += stake * (cashout - 1.0)
+        else:
+            profit -= stake
+    return outcome, profit
+
+
+class RoundJournal:
+    """Appends fixed-width round records; safe to share between threads"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self.appended = 0
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        f = open(self.path, "a+b")
+        size = f.seek(0, os.SEEK_END)
+        if size < HEADER.size:
+            f.truncate(0)
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        else:
+            f.seek(0)
+            _check_header(f.read(HEADER.size), self.path)
+            torn = (size - HEADER.size) % RECORD.size
+            if torn:
+                print(f"Trimming {torn} bytes of a torn record from {self.path}")
+                f.truncate(size - torn)
+        f.seek(0, os.SEEK_END)
+        self._file = f
+
+    def append(self, multiplier: float, block1_stake: float = 0.0, cashout1: float = 0.0,
+               block2_stake: float = 0.0, cashout2: float = 0.0, outcome: Optional[int] = None,
+               profit: Optional[float] = None, timestamp: Optional[float] = None):
+        """Write one round; outcome and profit are settled from the cash-outs when not given"""
+        settled_outcome, settled_profit = settle(multiplier, block1_stake, cashout1, block2_stake, cashout2)
+        record = RECORD.pack(time.time() if timestamp is None else timestamp, multiplier, cashout1, cashout2,
+                             settled_outcome if outcome is None else outcome, block1_stake, block2_stake,
+                             settled_profit if profit is None else profit)
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(record)
+            self._file.flush()
+            self.appended += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _check_header(header: bytes, path: str):
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path}: truncated journal header")
+    magic, version, record_size = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a round journal")
+    if version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path}: unsupported journal version {version} (record size {record_size})")
+
+
+def read_journal(path: str) -> np.ndarray:
+    """Read-only structured memmap of every complete record (empty array if none)"""
+    with open(path, "rb") as f:
+        _check_header(f.read(HEADER.size), path)
+        count = (f.seek(0, os.SEEK_END) - HEADER.size) // RECORD.size
+    if count <= 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def local_days(timestamps: np.ndarray) -> np.ndarray:
+    """Local calendar day number of each epoch timestamp (current UTC offset)"""
+    offset = -time.altzone if time.localtime().tm_isdst > 0 else -time.timezone
+    return np.floor((np.asarray(timestamps, dtype=np.float64) + offset) / 86400.0).astype(np.int64)
+
+
+def split_days(rounds: np.ndarray) -> List[np.ndarray]:
+    """Multiplier sequence of each local day, in journal order"""
+    if not len(rounds):
+        return []
+    days = local_days(rounds["timestamp"])
+    cuts = np.flatnonzero(np.diff(days)) + 1
+    return [np.asarray(chunk, dtype=np.float64) for chunk in np.split(rounds["multiplier"], cuts)]
+
+
+def summarize(rounds: np.ndarray) -> dict:
+    """Round, bet and win counts and journaled profit, computed column-wise"""
+    outcome = rounds["outcome"]
+    b1_bets = np.count_nonzero(outcome & BLOCK1_BET)
+    b2_bets = np.count_nonzero(outcome & BLOCK2_BET)
+    return {
+        "rounds": int(len(rounds)),
+        "mean_multiplier": float(rounds["multiplier"].mean()) if len(rounds) else 0.0,
+        "block1_bets": int(b1_bets),
+        "block1_wins": int(np.count_nonzero(outcome & BLOCK1_WIN)),
+        "block2_bets": int(b2_bets),
+        "block2_wins": int(np.count_nonzero(outcome & BLOCK2_WIN)),
+        "profit": float(rounds["profit"].sum()),
+    }
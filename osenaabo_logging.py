@@ -0,0 +1,160 @@
+# osenaabo_logging.py
+"""
+Logging helpers for OSENAABO! GUI.
+
+LogSink lets any thread hand log lines to the GUI without touching Tk
+widgets: producers enqueue without blocking and the Tk thread drains the
+queue in batches from an after() timer.
+
+Full history goes to size-rotated files under logs/, written by a
+QueueListener thread so callers never wait on disk I/O.
+"""
+
+import os
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Dict, Tuple, Optional
+
+DEFAULT_MAX_QUEUED = 5000
+LOG_DRAIN_INTERVAL_MS = 100
+LOG_DRAIN_BATCH = 500
+
+# Lines kept in the on-screen log; older ones live only in the files
+MAX_LOG_VIEW_LINES = 1000
+
+LOGGER_NAME = "osenaabo"
+LOG_FILE_NAME = "osenaabo.log"
+MAX_LOG_FILE_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 10
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+MAX_SEARCH_RESULTS = 500
+
+
+class LogSink:
+    """Bounded, non-blocking queue of log lines drained by the Tk thread"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_QUEUED):
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.dropped = 0
+        self.delivered = 0
+        self.max_depth = 0
+
+    def put(self, line: str) -> bool:
+        """Enqueue a line; returns False (and counts a drop) if the queue is full"""
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        with self._lock:
+            self.queued += 1
+            depth = self._queue.qsize()
+            if depth > self.max_depth:
+                self.max_depth = depth
+        return True
+
+    def drain(self, max_items: int = LOG_DRAIN_BATCH) -> List[str]:
+        """Take up to max_items queued lines without blocking"""
+        lines = []
+        try:
+            while len(lines) < max_items:
+                lines.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            with self._lock:
+                self.delivered += len(lines)
+        return lines
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "depth": self._queue.qsize(),
+                "max_depth": self.max_depth,
+            }
+
+
+def setup_file_logging(log_dir: str, name: str = LOGGER_NAME,
+                       file_name: str = LOG_FILE_NAME) -> Tuple[logging.Logger, Optional[QueueListener]]:
+    """
+    Attach a QueueHandler to the named logger and start a QueueListener that
+    writes to a size-rotated file in log_dir. Returns (logger, listener);
+    call listener.stop() on shutdown to flush.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = RotatingFileHandler(os.path.join(log_dir, file_name), maxBytes=MAX_LOG_FILE_BYTES,
+                                           backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    except Exception as e:
+        print(f"File logging disabled: {e}")
+        return logger, None
+
+    log_queue = queue.SimpleQueue()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    return logger, listener
+
+
+def log_files(log_dir: str, file_name: str = LOG_FILE_NAME) -> List[str]:
+    """Current and rotated log files, newest first"""
+    files = []
+    base = os.path.join(log_dir, file_name)
+    if os.path.exists(base):
+        files.append(base)
+    for i in range(1, LOG_BACKUP_COUNT + 1):
+        path = f"{base}.{i}"
+        if os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def search_log_files(log_dir: str, needle: str, max_results: int = MAX_SEARCH_RESULTS,
+                     ignore_case: bool = True, file_name: str = LOG_FILE_NAME) -> List[Tuple[str, str]]:
+    """
+    Find lines containing needle across the rotated log files, newest first.
+    Each file is scanned as one bytes buffer and skipped outright when it
+    has no match, so only matching files are split into lines.
+    """
+    if not needle:
+        return []
+    pattern = needle.encode("utf-8")
+    if ignore_case:
+        pattern = pattern.lower()
+    results = []
+    for path in log_files(log_dir, file_name):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        haystack = data.lower() if ignore_case else data
+        if pattern not in haystack:
+            continue
+        lines = data.splitlines()
+        matched = haystack.splitlines()
+        for raw, folded in zip(reversed(lines), reversed(matched)):
+            if pattern in folded:
+                results.append((os.path.basename(path), raw.decode("utf-8", errors="replace")))
+                if len(results) >= max_results:
+                    return results
+    return results
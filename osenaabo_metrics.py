@@ -0,0 +1,326 @@
+# osenaabo_metrics.py
+"""
+Engine metrics for OSENAABO!.
+
+Counters, gauges and histograms live in one process-wide REGISTRY and are
+rendered in the Prometheus text format, either from an optional localhost
+HTTP endpoint (config.json "metrics": {"port": 9464}) or as logs/osenaabo.prom,
+rewritten every few seconds for node_exporter's textfile collector. Collectors
+registered with add_collector() refresh gauges (bot status, queue depths)
+just before each render.
+"""
+
+import os
+import math
+import time
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+METRICS_HOST = "127.0.0.1"
+TEXTFILE_NAME = "osenaabo.prom"
+DEFAULT_TEXTFILE_INTERVAL = 15.0
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, total: float, **labels):
+        """Mirror a monotonic total kept by another component (e.g. a stats() dict)"""
+        with self._lock:
+            self._values[self._key(labels)] = float(total)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._values.items())
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that refresh gauges before each render"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, help_text, label_names=(), **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, label_names, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, label_names)
+
+    def gauge(self, name: str, help_text: str, label_names: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, label_names)
+
+    def histogram(self, name: str, help_text: str, label_names: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], None]):
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = sorted(self._metrics.items())
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                print(f"Metrics collector error: {e}")
+        lines = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Shared engine metrics
+TICKS = REGISTRY.counter("osenaabo_ticks_total", "Bot loop iterations")
+TICK_SECONDS = REGISTRY.histogram("osenaabo_tick_seconds", "Time spent in one bot loop iteration")
+CAPTURE_SECONDS = REGISTRY.histogram("osenaabo_capture_seconds", "Screen capture latency", ("backend",))
+OCR_SECONDS = REGISTRY.histogram("osenaabo_ocr_seconds", "OCR latency per region", ("region",))
+SKIPPED_FRAMES = REGISTRY.counter("osenaabo_skipped_frames_total", "Frames or status updates dropped", ("source",))
+QUEUE_DEPTH = REGISTRY.gauge("osenaabo_queue_depth", "Items waiting in internal queues", ("queue",))
+PERSIST_SECONDS = REGISTRY.histogram("osenaabo_persist_seconds", "Time to write persisted state", ("kind",))
+ERRORS = REGISTRY.counter("osenaabo_errors_total", "Errors recorded by the engine")
+
+BOT_RUNNING = REGISTRY.gauge("osenaabo_bot_running", "1 while the bot is running")
+BOT_CAPITAL = REGISTRY.gauge("osenaabo_bot_capital", "Current capital reported by the bot")
+BOT_PROFIT = REGISTRY.gauge("osenaabo_bot_profit", "Session profit reported by the bot")
+BOT_PROGRESS = REGISTRY.gauge("osenaabo_bot_progress_percent", "Progress towards the daily target")
+BOT_TICK_RATE = REGISTRY.gauge("osenaabo_bot_tick_rate", "Bot loop iterations per second")
+BOT_RECENT_ERRORS = REGISTRY.gauge("osenaabo_bot_recent_errors", "Errors in the bot's recent error list")
+
+
+def status_collector(status_fn: Callable[[], Dict]) -> Callable[[], None]:
+    """Collector that copies a get_bot_status()-style dict into the bot gauges"""
+    def collect():
+        status = status_fn() or {}
+        BOT_RUNNING.set(1 if status.get("running") else 0)
+        BOT_CAPITAL.set(status.get("capital", 0) or 0)
+        BOT_PROFIT.set(status.get("profit", 0) or 0)
+        BOT_PROGRESS.set(status.get("progress_percent", 0) or 0)
+        BOT_TICK_RATE.set(status.get("tick_rate", 0) or 0)
+        BOT_RECENT_ERRORS.set(len(status.get("errors", []) or []))
+    return collect
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """Optional localhost HTTP endpoint plus a periodically rewritten textfile"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, port: Optional[int] = None,
+                 textfile_path: Optional[str] = None, interval: float = DEFAULT_TEXTFILE_INTERVAL):
+        self.registry = registry
+        self.port = port
+        self.textfile_path = textfile_path
+        self.interval = interval
+        self.server = None
+        self._server_thread = None
+        self._writer_thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_config(cls, config: Dict, log_dir: str, registry: MetricsRegistry = REGISTRY) -> "MetricsExporter":
+        """config.json "metrics": {"port": 9464, "textfile": true, "interval": 15}"""
+        settings = (config or {}).get("metrics", {}) or {}
+        port = settings.get("port")
+        textfile = os.path.join(log_dir, TEXTFILE_NAME) if settings.get("textfile", True) else None
+        return cls(registry, int(port) if port else None, textfile,
+                   float(settings.get("interval", DEFAULT_TEXTFILE_INTERVAL)))
+
+    def start(self) -> "MetricsExporter":
+        if self.port:
+            try:
+                handler = type("Handler", (_MetricsHandler,), {"registry": self.registry})
+                self.server = ThreadingHTTPServer((METRICS_HOST, self.port), handler)
+                self.server.daemon_threads = True
+                self._server_thread = threading.Thread(target=self.server.serve_forever, name="osenaabo-metrics",
+                                                       daemon=True)
+                self._server_thread.start()
+                print(f"📈 Metrics endpoint on http://{METRICS_HOST}:{self.server.server_address[1]}/metrics")
+            except OSError as e:
+                print(f"Metrics endpoint disabled: {e}")
+                self.server = None
+        if self.textfile_path:
+            os.makedirs(os.path.dirname(self.textfile_path), exist_ok=True)
+            self._writer_thread = threading.Thread(target=self._write_loop, name="osenaabo-metrics-file", daemon=True)
+            self._writer_thread.start()
+        return self
+
+    def write_textfile(self):
+        tmp_path = f"{self.textfile_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.registry.render())
+        os.replace(tmp_path, self.textfile_path)
+
+    def _write_loop(self):
+        while True:
+            try:
+                self.write_textfile()
+            except Exception as e:
+                print(f"Metrics textfile error: {e}")
+            if self._stop_event.wait(self.interval):
+                break
+
+    def stop(self):
+        self._stop_event.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self._writer_thread:
+            self._writer_thread.join(timeout=2)
+        if self.textfile_path:
+            try:
+                self.write_textfile()  # final values
+            except Exception:
+                pass
@@ -0,0 +1,228 @@
+# osenaabo_multi.py
+"""
+Concurrent multi-platform engines for OSENAABO!.
+
+MultiEngineRunner drives one BotEngine per platform (SportyBetNg, BetwayNg,
+...) in its own thread, each with the calibration profile for that platform
+and platform-suffixed session files. The expensive parts are shared: one
+SharedCapture (a single benchmarked backend behind a lock) and one
+OCRService (a bounded pool of tesseract workers). Re-anchored coordinates
+are saved to each platform's own calibration profile.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional
+
+import osenaabo_core as core
+from osenaabo_engine import BotEngine, resolve_session_type, DEFAULT_TICK_INTERVAL, DEFAULT_MAX_TICKS
+from osenaabo_metrics import OCR_SECONDS
+
+try:
+    from osenaabo_profiles import ProfileStore
+except ImportError:
+    ProfileStore = None
+
+try:
+    from osenaabo_regions import compile_regions
+except ImportError:
+    compile_regions = None
+
+try:
+    import osenaabo_capture
+except ImportError:
+    osenaabo_capture = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+DEFAULT_OCR_WORKERS = 2
+DEFAULT_OCR_CONFIG = "--psm 7"
+
+
+class OCRService:
+    """Tesseract calls from every engine go through one bounded worker pool"""
+
+    def __init__(self, workers: int = DEFAULT_OCR_WORKERS, tesseract_cmd: Optional[str] = None,
+                 config: str = DEFAULT_OCR_CONFIG):
+        self.config = config
+        self.available = pytesseract is not None
+        if self.available and tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="osenaabo-ocr")
+
+    def _run(self, image, region: str, config: Optional[str]) -> str:
+        with OCR_SECONDS.time(region=region):
+            return pytesseract.image_to_string(image, config=config or self.config).strip()
+
+    def submit(self, image, region: str = "", config: Optional[str] = None):
+        """Future resolving to the recognised text; the image must stay valid until it completes"""
+        return self._executor.submit(self._run, image, region, config)
+
+    def read(self, image, region: str = "", config: Optional[str] = None, timeout: Optional[float] = 10.0) -> Optional[str]:
+        if not self.available:
+            return None
+        return self.submit(image, region, config).result(timeout=timeout)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SharedCapture(osenaabo_capture.CaptureBackend if osenaabo_capture else object):
+    """One benchmarked capture backend shared by several engines; grabs are serialised"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.name = f"shared-{backend.name}"
+        self.pooled = backend.pooled
+        self._lock = threading.Lock()
+        self.grabs = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def grab(self, bbox):
+        with self._lock:
+            self.grabs += 1
+            return self.backend.grab(bbox)
+
+    def grab_into(self, bbox, out):
+        with self._lock:
+            self.grabs += 1
+            return self.backend.grab_into(bbox, out)
+
+    def close(self):
+        self.backend.close()
+
+
+class MultiEngineRunner:
+    """Run one BotEngine per platform concurrently with shared capture and OCR"""
+
+    def __init__(self, platforms: List[str], config: Dict[str, Any], log: Callable[[str], None] = print,
+                 stop_event: Optional[threading.Event] = None, ocr_workers: int = DEFAULT_OCR_WORKERS):
+        self.platforms = list(dict.fromkeys(platforms))
+        self.config = config
+        self.log = log
+        self.stop_event = stop_event or threading.Event()
+        self.ocr = OCRService(ocr_workers, core.get_platform_tesseract_path())
+        self.capture = None
+        self.profiles = ProfileStore(core.get_data_path("profiles")) if ProfileStore else None
+        self.engines: Dict[str, BotEngine] = {}
+        self.on_status = None  # optional callback(status_dict) with every platform's status
+        self._status_lock = threading.Lock()
+
+    def _coords_for(self, platform: str) -> Optional[Dict[str, Any]]:
+        if self.profiles:
+            key, coords = self.profiles.select(platform)
+            if coords:
+                self.log(f"[{platform}] Calibration profile: {key}")
+                return coords
+        self.log(f"[{platform}] No calibration profile for this screen - calibrate it in the GUI first")
+        return None
+
+    def _select_capture(self, coords_list: List[Dict[str, Any]]):
+        """Benchmark once on the box covering every platform's regions"""
+        if not osenaabo_capture:
+            return
+        regions = [compile_regions(coords) for coords in coords_list] if compile_regions else []
+        boxes = [r.bounding_box() for r in regions if r is not None]
+        boxes = [b for b in boxes if b]
+        bbox = None
+        if boxes:
+            bbox = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                    max(b[2] for b in boxes), max(b[3] for b in boxes))
+        backend, timings = osenaabo_capture.select_fastest_backend(bbox)
+        self.log(f"Capture benchmark: {osenaabo_capture.format_timings(timings)}")
+        if backend:
+            self.capture = SharedCapture(backend)
+            self.log(f"Using shared capture backend: {backend.name}")
+
+    def _capital_for(self, platform: str) -> float:
+        per_platform = self.config.get("platform_capital", {}) or {}
+        return float(per_platform.get(platform, self.config.get("capital", 1000000)))
+
+    def build(self) -> int:
+        """Create an engine for every calibrated platform; returns how many are ready"""
+        calibrated = {}
+        for platform in self.platforms:
+            coords = self._coords_for(platform)
+            if coords:
+                calibrated[platform] = coords
+        self._select_capture(list(calibrated.values()))
+
+        for platform, coords in calibrated.items():
+            engine = BotEngine(self._capital_for(platform), float(self.config.get("stop_loss", 20.0)), coords,
+                               log=lambda msg, p=platform: self.log(f"[{p}] {msg}"), stop_event=self.stop_event,
+                               tick_interval=float(self.config.get("tick_interval", DEFAULT_TICK_INTERVAL)),
+                               max_ticks=self.config.get("max_ticks", DEFAULT_MAX_TICKS),
+                               respect_hours=bool(self.config.get("respect_hours", False)),
+                               platform=platform, capture_backend=self.capture,
+                               ocr=self.ocr if self.ocr.available else None, profiles=self.profiles)
+            session_type = resolve_session_type(self.config.get("session_type"), platform)
+            engine.log(f"Session: {session_type}")
+            if engine.prepare_session(session_type):
+                engine.on_status = lambda _status: self._publish_status()
+                self.engines[platform] = engine
+        return len(self.engines)
+
+    def status(self) -> Dict[str, Any]:
+        """Combined status: per-platform snapshots plus totals"""
+        platforms = {platform: engine.status() for platform, engine in self.engines.items()}
+        errors = [dict(error, platform=p) for p, s in platforms.items() for error in s["errors"]]
+        return {
+            "available": True,
+            "running": any(s["running"] for s in platforms.values()),
+            "capital": sum(s["capital"] for s in platforms.values()),
+            "profit": sum(s["profit"] for s in platforms.values()),
+            "target_percent": max((s["target_percent"] for s in platforms.values()), default=0),
+            "tick_rate": sum(s["tick_rate"] for s in platforms.values()),
+            "errors": errors[-20:],
+            "platforms": platforms,
+            "updated_at": time.time(),
+        }
+
+    def frame_stats(self) -> Dict[str, int]:
+        """Frame pool counters summed over every engine, for MemoryDiagnostics"""
+        totals: Dict[str, int] = {}
+        for engine in self.engines.values():
+            if engine.frame_pool:
+                for key, value in engine.frame_pool.stats().items():
+                    totals[f"frames_{key}"] = totals.get(f"frames_{key}", 0) + value
+        return totals
+
+    def _publish_status(self):
+        if self.on_status:
+            with self._status_lock:
+                try:
+                    self.on_status(self.status())
+                except Exception as e:
+                    print(f"Status publish error: {e}")
+
+    def run(self):
+        """Run every engine until all finish or stop_event is set"""
+        try:
+            if not self.engines and not self.build():
+                self.log("No platform ready to run")
+                return
+            threads = [threading.Thread(target=engine.run, name=f"osenaabo-{platform}", daemon=True)
+                       for platform, engine in self.engines.items()]
+            self.log(f"Running {len(threads)} platform(s): {', '.join(self.engines)} at {datetime.now():%H:%M:%S}")
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+            if self.capture:
+                self.log(f"Shared capture: {self.capture.grabs} grabs")
+        finally:
+            self._publish_status()
+            if self.capture:
+                self.capture.close()
+            self.ocr.close()
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,152 @@
+# osenaabo_profiles.py
+"""
+Calibration profiles for OSENAABO!.
+
+Each calibration is stored as its own JSON file under profiles/ and indexed
+in profiles/index.json by "platform|WIDTHxHEIGHT|scale", so the profile for
+the current platform and screen layout is found with a single dict lookup at
+startup or on platform change. aviator_coordinates.json stays the active
+profile that the bot and headless engine read.
+"""
+
+import os
+import re
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from osenaabo_regions import get_monitor_key, get_display_scale
+
+try:
+    from osenaabo_regions import compile_regions
+except ImportError:
+    compile_regions = None
+
+INDEX_FILE = "index.json"
+
+
+def profile_key(platform: str, resolution: Optional[str] = None, scale: Optional[float] = None) -> str:
+    """'SportyBetNg|1920x1080|1.25' for the given (default: current) screen layout"""
+    if resolution is None:
+        resolution = get_monitor_key()
+    if scale is None:
+        scale = get_display_scale()
+    return f"{platform}|{resolution}|{float(scale):g}"
+
+
+def _profile_file_name(key: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", key) + ".json"
+
+
+def _write_json_atomic(path: str, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class ProfileStore:
+    """Calibration profiles keyed by platform, resolution and scale factor"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.index_path = os.path.join(root, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._coords = {}   # key -> coords dict
+        self._regions = {}  # key -> compiled RegionSet
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("profiles", {})
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        _write_json_atomic(self.index_path, {"profiles": self.index})
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def list_profiles(self, platform: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        return sorted((k, v) for k, v in self.index.items() if platform is None or v.get("platform") == platform)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Coords for a profile, read from disk once"""
+        with self._lock:
+            if key in self._coords:
+                return self._coords[key]
+            entry = self.index.get(key)
+            if not entry:
+                return None
+            try:
+                with open(os.path.join(self.root, entry["file"]), "r", encoding="utf-8") as f:
+                    coords = json.load(f)
+            except Exception as e:
+                print(f"Error loading calibration profile {key}: {e}")
+                return None
+            self._coords[key] = coords
+            return coords
+
+    def regions(self, key: str):
+        """Compiled RegionSet for a profile, built once and cached"""
+        with self._lock:
+            if key in self._regions:
+                return self._regions[key]
+        coords = self.load(key)
+        if coords is None or not compile_regions:
+            return None
+        regions = compile_regions(coords)
+        with self._lock:
+            self._regions[key] = regions
+        return regions
+
+    def save(self, platform: str, coords: Dict[str, Any], resolution: Optional[str] = None,
+             scale: Optional[float] = None) -> str:
+        """Store coords as the profile for this platform and screen layout; returns its key"""
+        if resolution is None:
+            resolution = get_monitor_key()
+        if scale is None:
+            scale = get_display_scale()
+        key = profile_key(platform, resolution, scale)
+        file_name = _profile_file_name(key)
+        with self._lock:
+            _write_json_atomic(os.path.join(self.root, file_name), coords)
+            self.index[key] = {
+                "file": file_name,
+                "platform": platform,
+                "resolution": resolution,
+                "scale": float(scale),
+                "calibrated_at": coords.get("calibrated_at"),
+                "saved_at": datetime.now().isoformat(),
+            }
+            self._save_index()
+            self._coords[key] = coords
+            self._regions.pop(key, None)
+        return key
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            entry = self.index.pop(key, None)
+            if entry is None:
+                return False
+            self._save_index()
+            self._coords.pop(key, None)
+            self._regions.pop(key, None)
+        try:
+            os.remove(os.path.join(self.root, entry["file"]))
+        except OSError:
+            pass
+        return True
+
+    def select(self, platform: str, resolution: Optional[str] = None,
+               scale: Optional[float] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """(key, coords) of the profile matching the platform and screen layout; coords is None if there is none"""
+        key = profile_key(platform, resolution, scale)
+        return key, self.load(key)
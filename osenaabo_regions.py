@@ -0,0 +1,232 @@
+# osenaabo_regions.py
+"""
+Compiled calibration geometry for OSENAABO! GUI.
+
+Calibration results are stored as {"x", "y", "width", "height"} dicts in
+aviator_coordinates.json. RegionSet loads them once into a single NumPy int
+array so the capture and input stages can share precomputed centres, cached
+DPI transforms and vectorized hit tests.
+"""
+
+import platform
+import threading
+from typing import Optional, Dict, Any, Tuple, List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+IS_WINDOWS = platform.system() == 'Windows'
+
+# Keys every calibrated box must carry
+REGION_KEYS = ("x", "y", "width", "height")
+
+
+def is_region_entry(value) -> bool:
+    """Return True if a coords entry looks like a calibrated box"""
+    return isinstance(value, dict) and all(k in value for k in REGION_KEYS)
+
+
+def get_display_scale() -> float:
+    """Get the primary display scale factor (1.0 = 96 DPI)"""
+    try:
+        if IS_WINDOWS:
+            import ctypes
+            return ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100.0
+    except Exception:
+        pass
+    return 1.0
+
+
+def get_monitor_key() -> str:
+    """Get a key identifying the current screen layout"""
+    try:
+        import pyautogui
+        width, height = pyautogui.size()
+        return f"{width}x{height}"
+    except Exception:
+        return "default"
+
+
+class Region:
+    """Single calibrated box with precomputed edges and centre"""
+
+    __slots__ = ("name", "x", "y", "width", "height", "right", "bottom", "cx", "cy")
+
+    def __init__(self, name: str, x: int, y: int, width: int, height: int):
+        self.name = name
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
+        self.right = self.x + self.width
+        self.bottom = self.y + self.height
+        self.cx = self.x + self.width // 2
+        self.cy = self.y + self.height // 2
+
+    def __repr__(self):
+        return f"Region({self.name!r}, x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+    @property
+    def centre(self) -> Tuple[int, int]:
+        return self.cx, self.cy
+
+    @property
+    def bbox(self) -> Tuple[int, int, int, int]:
+        """(left, top, right, bottom) as used by ImageGrab.grab"""
+        return self.x, self.y, self.right, self.bottom
+
+    def contains(self, px: int, py: int) -> bool:
+        return self.x <= px < self.right and self.y <= py < self.bottom
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+
+
+class RegionSet:
+    """All calibrated boxes packed into one (N, 4) int32 array of x, y, width, height"""
+
+    __slots__ = ("names", "boxes", "centres", "extras", "_index", "_regions", "_transforms", "_lock")
+
+    def __init__(self, names: List[str], boxes, extras: Optional[Dict[str, Any]] = None):
+        self.names = tuple(names)
+        self.boxes = np.asarray(boxes, dtype=np.int32).reshape(len(self.names), 4)
+        self.boxes.setflags(write=False)
+        self.centres = self.boxes[:, :2] + self.boxes[:, 2:] // 2
+        self.centres.setflags(write=False)
+        self.extras = dict(extras or {})
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._regions = {}
+        self._transforms = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_coords(cls, coords: Dict[str, Any]) -> "RegionSet":
+        """Compile a calibration dict, keeping non-box entries as extras"""
+        names, boxes, extras = [], [], {}
+        for key, value in (coords or {}).items():
+            if is_region_entry(value):
+                names.append(key)
+                boxes.append([int(value[k]) for k in REGION_KEYS])
+            else:
+                extras[key] = value
+        return cls(names, boxes if boxes else np.zeros((0, 4), dtype=np.int32), extras)
+
+    def to_coords(self) -> Dict[str, Any]:
+        """Convert back to the aviator_coordinates.json layout"""
+        coords = dict(self.extras)
+        for name, row in zip(self.names, self.boxes.tolist()):
+            coords[name] = dict(zip(REGION_KEYS, row))
+        return coords
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return (self[name] for name in self.names)
+
+    def __getitem__(self, name: str) -> Region:
+        region = self._regions.get(name)
+        if region is None:
+            x, y, w, h = self.boxes[self._index[name]].tolist()
+            region = Region(name, x, y, w, h)
+            self._regions[name] = region
+        return region
+
+    def get(self, name: str, default=None) -> Optional[Region]:
+        if name not in self._index:
+            return default
+        return self[name]
+
+    def centre(self, name: str) -> Tuple[int, int]:
+        cx, cy = self.centres[self._index[name]].tolist()
+        return cx, cy
+
+    def bounding_box(self, names=None) -> Optional[Tuple[int, int, int, int]]:
+        """(left, top, right, bottom) enclosing the given (or all) regions"""
+        boxes = self._select(names)
+        if not len(boxes):
+            return None
+        left, top = boxes[:, :2].min(axis=0).tolist()
+        right, bottom = (boxes[:, :2] + boxes[:, 2:]).max(axis=0).tolist()
+        return left, top, right, bottom
+
+    def contains(self, points):
+        """Boolean (M, N) matrix: point m lies inside region n"""
+        pts = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+        x = pts[:, 0:1]
+        y = pts[:, 1:2]
+        x0, y0 = self.boxes[:, 0], self.boxes[:, 1]
+        x1, y1 = x0 + self.boxes[:, 2], y0 + self.boxes[:, 3]
+        return (x >= x0) & (x < x1) & (y >= y0) & (y < y1)
+
+    def locate(self, px: int, py: int) -> Optional[str]:
+        """Name of the first region containing the point, if any"""
+        hits = np.flatnonzero(self.contains((px, py))[0])
+        return self.names[hits[0]] if len(hits) else None
+
+    def overlaps(self):
+        """Boolean (N, N) matrix of regions whose boxes intersect"""
+        x0, y0 = self.boxes[:, 0], self.boxes[:, 1]
+        x1, y1 = x0 + self.boxes[:, 2], y0 + self.boxes[:, 3]
+        hit = ((x0[:, None] < x1[None, :]) & (x0[None, :] < x1[:, None]) &
+               (y0[:, None] < y1[None, :]) & (y0[None, :] < y1[:, None]))
+        np.fill_diagonal(hit, False)
+        return hit
+
+    def overlapping_pairs(self) -> List[Tuple[str, str]]:
+        rows, cols = np.nonzero(np.triu(self.overlaps()))
+        return [(self.names[i], self.names[j]) for i, j in zip(rows.tolist(), cols.tolist())]
+
+    def translated(self, dx: int, dy: int) -> "RegionSet":
+        """Copy of this set shifted by (dx, dy)"""
+        boxes = self.boxes.copy()
+        boxes[:, 0] += int(dx)
+        boxes[:, 1] += int(dy)
+        return RegionSet(self.names, boxes, self.extras)
+
+    def scaled(self, scale_x: float, scale_y: Optional[float] = None) -> "RegionSet":
+        """Copy of this set with every box multiplied by the scale factor"""
+        if scale_y is None:
+            scale_y = scale_x
+        factors = np.array([scale_x, scale_y, scale_x, scale_y], dtype=np.float64)
+        boxes = np.rint(self.boxes * factors).astype(np.int32)
+        return RegionSet(self.names, boxes, self.extras)
+
+    def for_monitor(self, monitor_key: Optional[str] = None, scale: Optional[float] = None) -> "RegionSet":
+        """Scaled copy for a monitor, computed once per (monitor, scale)"""
+        if monitor_key is None:
+            monitor_key = get_monitor_key()
+        if scale is None:
+            scale = get_display_scale()
+        if scale == 1.0:
+            return self
+        key = (monitor_key, float(scale))
+        with self._lock:
+            transformed = self._transforms.get(key)
+            if transformed is None:
+                transformed = self.scaled(scale)
+                self._transforms[key] = transformed
+        return transformed
+
+    def _select(self, names=None):
+        if names is None:
+            return self.boxes
+        return self.boxes[[self._index[n] for n in names if n in self._index]]
+
+
+def compile_regions(coords: Dict[str, Any]) -> Optional[RegionSet]:
+    """Compile calibration data, or None if NumPy is unavailable"""
+    if not NUMPY_AVAILABLE:
+        return None
+    try:
+        return RegionSet.from_coords(coords)
+    except Exception as e:
+        print(f"Error compiling calibration regions: {e}")
+        return None
@@ -0,0 +1,422 @@
+# osenaabo_report.py
+"""
+Streaming P&L reports for OSENAABO!.
+
+Session records are read one day at a time from sessions/session_<date>[_<platform>].json
+(and line by line from any sessions/ledger*.jsonl files), merged in time
+order and folded into daily, weekly and monthly rows as each period closes,
+so memory stays constant however many years of history there are.
+
+Outputs (in the report directory): daily.csv, weekly.csv, monthly.csv,
+capital_curve.csv, summary.txt and summary.html. Round counts and hit rates
+come from the sessions/rounds*.osj journals when present.
+
+Usage:
+    python osenaabo_report.py [--sessions DIR] [--out DIR] [--since 2025-01-01] [--until 2025-12-31]
+"""
+
+import os
+import re
+import csv
+import sys
+import glob
+import json
+import heapq
+import html
+import time
+import argparse
+from datetime import datetime, date, timedelta
+from typing import Dict, Any, Iterator, Optional, List
+
+try:
+    import numpy as np
+    import osenaabo_journal
+except ImportError:
+    osenaabo_journal = None
+
+SESSION_FILE_RE = re.compile(r"^session_(\d{4}-\d{2}-\d{2})(?:_([A-Za-z0-9]+))?\.json$")
+NON_SESSION_SUFFIXES = ("cookies",)
+LEDGER_GLOB = "ledger*.jsonl"
+DEFAULT_PLATFORM = "default"
+PERIOD_FIELDS = ["period", "days", "sessions", "start_capital", "end_capital", "profit", "return_percent",
+                 "targets_hit", "max_drawdown_percent"]
+
+
+def _parse_time(value) -> Optional[datetime]:
+    """Naive local time; offset-aware timestamps (e.g. from ledgers) are converted"""
+    try:
+        when = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is not None:
+        when = when.astimezone().replace(tzinfo=None)
+    return when
+
+
+def _record(raw: Dict[str, Any], platform: str) -> Optional[Dict[str, Any]]:
+    when = _parse_time(raw.get("timestamp"))
+    if when is None:
+        return None
+    try:
+        return {
+            "time": when,
+            "platform": raw.get("platform") or platform,
+            "profit": float(raw.get("profit", 0.0)),
+            "capital_after": float(raw.get("capital_after", 0.0)),
+            "target_reached": bool(raw.get("target_reached", False)),
+        }
+    except (TypeError, ValueError):
+        return None
+
+
+def _session_files_by_day(sessions_dir: str, since: Optional[date], until: Optional[date]):
+    """(day, [(path, platform), ...]) in date order, one directory listing"""
+    days = {}
+    for name in os.listdir(sessions_dir) if os.path.isdir(sessions_dir) else []:
+        match = SESSION_FILE_RE.match(name)
+        if not match or match.group(2) in NON_SESSION_SUFFIXES:
+            continue
+        day = date.fromisoformat(match.group(1))
+        if (since and day < since) or (until and day > until):
+            continue
+        days.setdefault(day, []).append((os.path.join(sessions_dir, name), match.group(2) or DEFAULT_PLATFORM))
+    for day in sorted(days):
+        yield day, days[day]
+
+
+def iter_session_file_records(sessions_dir: str, since: Optional[date] = None,
+                              until: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+    """Records from per-day session JSON files; only one day is held in memory"""
+    for _, files in _session_files_by_day(sessions_dir, since, until):
+        day_records = []
+        for path, platform in files:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"Skipping unreadable session file {path}: {e}")
+                continue
+            for raw in data.get("sessions", []):
+                record = _record(raw, platform)
+                if record:
+                    day_records.append(record)
+        day_records.sort(key=lambda r: r["time"])
+        yield from day_records
+
+
+def iter_ledger_records(path: str, since: Optional[date] = None,
+                        until: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+    """Records from a JSONL ledger (one session record per line, chronological)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _record(json.loads(line), DEFAULT_PLATFORM)
+            except ValueError:
+                continue
+            if record is None:
+                continue
+            day = record["time"].date()
+            if (since and day < since) or (until and day > until):
+                continue
+            yield record
+
+
+def iter_records(sessions_dir: str, since: Optional[date] = None,
+                 until: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+    """Every session record from session files and ledgers, merged in time order"""
+    sources = [iter_session_file_records(sessions_dir, since, until)]
+    for path in sorted(glob.glob(os.path.join(sessions_dir, LEDGER_GLOB))):
+        sources.append(iter_ledger_records(path, since, until))
+    return heapq.merge(*sources, key=lambda r: r["time"])
+
+
+def journal_summary(sessions_dir: str, since: Optional[date] = None,
+                    until: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """Round totals over every round journal, scanned column-wise through memmaps"""
+    if not osenaabo_journal:
+        return None
+    totals = None
+    for path in osenaabo_journal.list_journals(sessions_dir):
+        try:
+            rounds = osenaabo_journal.read_journal(path)
+        except (OSError, ValueError) as e:
+            print(f"Skipping round journal {path}: {e}")
+            continue
+        if since or until:
+            ts = rounds["timestamp"]
+            mask = np.ones(len(rounds), dtype=bool)
+            if since:
+                mask &= ts >= time.mktime(since.timetuple())
+            if until:
+                mask &= ts < time.mktime((until + timedelta(days=1)).timetuple())
+            rounds = rounds[mask]
+        stats = osenaabo_journal.summarize(rounds)
+        stats.pop("mean_multiplier")
+        totals = stats if totals is None else {k: totals[k] + v for k, v in stats.items()}
+    return totals
+
+
+class _Period:
+    """Running totals for one reporting period"""
+
+    def __init__(self, key: str, start_capital: float):
+        self.key = key
+        self.days = 0
+        self.sessions = 0
+        self.start_capital = start_capital
+        self.end_capital = start_capital
+        self.profit = 0.0
+        self.targets_hit = 0
+        self.peak = start_capital
+        self.trough = start_capital
+        self.max_drawdown = 0.0
+
+    def add_day(self, day: "_Period"):
+        self.days += 1
+        self.sessions += day.sessions
+        self.profit += day.profit
+        self.targets_hit += day.targets_hit
+        # Measure the day's low against the peak carried over from earlier
+        # days too, so drawdowns spanning several days are not cut at midnight
+        peak = max(self.peak, day.start_capital)
+        if peak > 0:
+            self.max_drawdown = max(self.max_drawdown, day.max_drawdown, (peak - day.trough) / peak)
+        self.peak = max(peak, day.peak)
+        self.end_capital = day.end_capital
+
+    def row(self) -> Dict[str, Any]:
+        return {
+            "period": self.key,
+            "days": self.days,
+            "sessions": self.sessions,
+            "start_capital": round(self.start_capital, 2),
+            "end_capital": round(self.end_capital, 2),
+            "profit": round(self.profit, 2),
+            "return_percent": round(self.profit / self.start_capital * 100.0, 4) if self.start_capital else 0.0,
+            "targets_hit": self.targets_hit,
+            "max_drawdown_percent": round(self.max_drawdown * 100.0, 4),
+        }
+
+
+class PnLReport:
+    """Single-pass fold of session records into period rows and summary statistics"""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        os.makedirs(out_dir, exist_ok=True)
+        self._files = {}
+        self._writers = {}
+        for name, fields in (("daily", PERIOD_FIELDS), ("weekly", PERIOD_FIELDS), ("monthly", PERIOD_FIELDS),
+                             ("capital_curve", ["timestamp", "platform", "profit", "capital"])):
+            f = open(os.path.join(out_dir, f"{name}.csv"), "w", newline="", encoding="utf-8")
+            self._files[name] = f
+            self._writers[name] = csv.DictWriter(f, fieldnames=fields)
+            self._writers[name].writeheader()
+
+        self.platform_capital: Dict[str, float] = {}
+        self.capital = 0.0
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+        self.max_drawdown_at = None
+        self.rounds = None  # journal_summary(), attached before finish()
+        self.records = 0
+        self.total_profit = 0.0
+        self.days = 0
+        self.target_days = 0
+        self.deposited = 0.0
+        self.first_time = None
+        self.last_time = None
+        self.best_day = None
+        self.worst_day = None
+        self._day = self._week = self._month = None
+
+    # ---- streaming ----
+    def add(self, record: Dict[str, Any]):
+        when = record["time"]
+        day_key = when.date().isoformat()
+        if self._day is None or self._day.key != day_key:
+            self._close_day()
+
+        platform = record["platform"]
+        capital_before = self.platform_capital.get(platform, record["capital_after"] - record["profit"])
+        if platform not in self.platform_capital:
+            # A platform's first record adds its starting capital: a deposit, not profit
+            self.capital += capital_before
+            self.deposited += capital_before
+        # The peaks must see the capital before this record, or a first
+        # record that is a loss would never count as a drawdown
+        self.peak = max(self.peak, self.capital)
+        if self._day is None:
+            self._day = _Period(day_key, self.capital)
+        self._day.peak = max(self._day.peak, self.capital)
+
+        self.platform_capital[platform] = record["capital_after"]
+        self.capital += record["capital_after"] - capital_before
+
+        if self.first_time is None:
+            self.first_time = when
+        self.last_time = when
+        self.records += 1
+        self.total_profit += record["profit"]
+
+        self.peak = max(self.peak, self.capital)
+        drawdown = (self.peak - self.capital) / self.peak if self.peak > 0 else 0.0
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+            self.max_drawdown_at = when
+
+        day = self._day
+        day.sessions += 1
+        day.profit += record["profit"]
+        day.end_capital = self.capital
+        day.targets_hit = 1 if (day.targets_hit or record["target_reached"]) else 0
+        day.peak = max(day.peak, self.capital)
+        day.trough = min(day.trough, self.capital)
+        if day.peak > 0:
+            day.max_drawdown = max(day.max_drawdown, (day.peak - self.capital) / day.peak)
+
+        self._writers["capital_curve"].writerow({"timestamp": when.isoformat(), "platform": platform,
+                                                 "profit": round(record["profit"], 2),
+                                                 "capital": round(self.capital, 2)})
+
+    def _close_day(self):
+        day = self._day
+        if day is None:
+            return
+        self._day = None
+        day.days = 1
+        self._writers["daily"].writerow(day.row())
+        self.days += 1
+        self.target_days += day.targets_hit
+        if self.best_day is None or day.profit > self.best_day[1]:
+            self.best_day = (day.key, day.profit)
+        if self.worst_day is None or day.profit < self.worst_day[1]:
+            self.worst_day = (day.key, day.profit)
+
+        d = date.fromisoformat(day.key)
+        iso_year, iso_week, _ = d.isocalendar()
+        self._week = self._roll("weekly", self._week, f"{iso_year}-W{iso_week:02d}", day)
+        self._month = self._roll("monthly", self._month, d.strftime("%Y-%m"), day)
+
+    def _roll(self, name: str, period: Optional[_Period], key: str, day: _Period) -> _Period:
+        if period is not None and period.key != key:
+            self._writers[name].writerow(period.row())
+            period = None
+        if period is None:
+            period = _Period(key, day.start_capital)
+        period.add_day(day)
+        return period
+
+    def finish(self) -> Dict[str, Any]:
+        """Flush open periods, close the CSV files and write the summaries"""
+        self._close_day()
+        for name, period in (("weekly", self._week), ("monthly", self._month)):
+            if period is not None:
+                self._writers[name].writerow(period.row())
+        for f in self._files.values():
+            f.close()
+
+        summary = self.summary()
+        with open(os.path.join(self.out_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(format_summary(summary) + "\n")
+        with open(os.path.join(self.out_dir, "summary.html"), "w", encoding="utf-8") as f:
+            f.write(format_summary_html(summary))
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        start = self.deposited
+        return {
+            "from": self.first_time.date().isoformat() if self.first_time else None,
+            "to": self.last_time.date().isoformat() if self.last_time else None,
+            "sessions": self.records,
+            "days": self.days,
+            "platforms": sorted(self.platform_capital),
+            "start_capital": start,
+            "end_capital": self.capital,
+            "total_profit": self.total_profit,
+            "return_percent": self.total_profit / start * 100.0 if start else 0.0,
+            "target_hit_rate": self.target_days / self.days if self.days else 0.0,
+            "target_days": self.target_days,
+            "max_drawdown_percent": self.max_drawdown * 100.0,
+            "max_drawdown_at": self.max_drawdown_at.isoformat() if self.max_drawdown_at else None,
+            "best_day": self.best_day,
+            "worst_day": self.worst_day,
+            "rounds": self.rounds,
+            "out_dir": self.out_dir,
+        }
+
+
+def _summary_lines(summary: Dict[str, Any]) -> List[tuple]:
+    """(label, value) rows; round journal totals are shown even without session records"""
+    if not summary["sessions"]:
+        return [("Sessions", "No session records found")] + _round_lines(summary)
+    lines = [
+        ("Period", f"{summary['from']} to {summary['to']}"),
+        ("Platforms", ", ".join(summary["platforms"]) or "-"),
+        ("Days / sessions", f"{summary['days']:,} / {summary['sessions']:,}"),
+        ("Capital", f"₦{summary['start_capital']:,.2f} deposited -> ₦{summary['end_capital']:,.2f}"),
+        ("Total profit", f"₦{summary['total_profit']:,.2f} ({summary['return_percent']:+.2f}%)"),
+        ("Target hit rate", f"{summary['target_hit_rate']:.1%} ({summary['target_days']} days)"),
+        ("Max drawdown", f"{summary['max_drawdown_percent']:.2f}% at {summary['max_drawdown_at'] or '-'}"),
+    ]
+    if summary["best_day"]:
+        lines.append(("Best day", f"{summary['best_day'][0]} ₦{summary['best_day'][1]:,.2f}"))
+        lines.append(("Worst day", f"{summary['worst_day'][0]} ₦{summary['worst_day'][1]:,.2f}"))
+    return lines + _round_lines(summary)
+
+
+def _round_lines(summary: Dict[str, Any]) -> List[tuple]:
+    lines = []
+    rounds = summary.get("rounds")
+    if rounds and rounds["rounds"]:
+        hit1 = rounds["block1_wins"] / rounds["block1_bets"] if rounds["block1_bets"] else 0.0
+        hit2 = rounds["block2_wins"] / rounds["block2_bets"] if rounds["block2_bets"] else 0.0
+        lines.append(("Rounds", f"{rounds['rounds']:,} journaled, ₦{rounds['profit']:,.2f} staked P&L"))
+        lines.append(("Block hit rate", f"B1 {hit1:.1%} of {rounds['block1_bets']:,}, "
+                                        f"B2 {hit2:.1%} of {rounds['block2_bets']:,}"))
+    return lines
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    return "\n".join(f"{label:<16} {value}" for label, value in _summary_lines(summary))
+
+
+def format_summary_html(summary: Dict[str, Any]) -> str:
+    rows = "".join(f"<tr><th>{html.escape(label)}</th><td>{html.escape(value)}</td></tr>"
+                   for label, value in _summary_lines(summary))
+    links = " | ".join(f'<a href="{name}.csv">{name}</a>' for name in ("daily", "weekly", "monthly", "capital_curve"))
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>OSENAABO! P&amp;L</title>"
+            "<style>body{font-family:sans-serif}th{text-align:left;padding-right:1em}</style></head>"
+            f"<body><h2>OSENAABO! P&amp;L report</h2><table>{rows}</table><p>{links}</p></body></html>\n")
+
+
+def generate_report(sessions_dir: str, out_dir: str, since: Optional[date] = None,
+                    until: Optional[date] = None) -> Dict[str, Any]:
+    report = PnLReport(out_dir)
+    for record in iter_records(sessions_dir, since, until):
+        report.add(record)
+    report.rounds = journal_summary(sessions_dir, since, until)
+    return report.finish()
+
+
+def main(argv=None):
+    import osenaabo_core as core
+
+    parser = argparse.ArgumentParser(description="Daily/weekly/monthly P&L report from OSENAABO! session history")
+    parser.add_argument("--sessions", default=core.get_data_path("sessions"), help="sessions directory")
+    parser.add_argument("--out", default=core.get_data_path("reports"), help="report output directory")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="first day (YYYY-MM-DD)")
+    parser.add_argument("--until", type=date.fromisoformat, default=None, help="last day (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    summary = generate_report(args.sessions, args.out, args.since, args.until)
+    print(format_summary(summary))
+    print(f"Report written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
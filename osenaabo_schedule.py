@@ -0,0 +1,149 @@
+# osenaabo_schedule.py
+"""
+Weekly betting-hours schedule for OSENAABO!.
+
+The weekly hours ("09:00-12:00 | 14:00-17:00" per weekday) are parsed once
+into a sorted table of [start, end) offsets in seconds since Monday 00:00.
+"Open now?" is a bisect over that table, and the time until the next
+open/close lets the engine sleep until the window changes instead of polling.
+"""
+
+import re
+import bisect
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pytz
+    PYTZ_AVAILABLE = True
+except ImportError:
+    pytz = None
+    PYTZ_AVAILABLE = False
+
+SECONDS_PER_DAY = 24 * 60 * 60
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+
+DEFAULT_DAY_HOURS = "09:00-12:00 | 14:00-17:00 | 19:00-22:00"
+DEFAULT_WEEKLY_HOURS = {day: DEFAULT_DAY_HOURS for day in range(7)}
+
+_RANGE_SEPARATORS = re.compile(r"\s*[|;,]\s*")
+_RANGE = re.compile(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$")
+
+
+def parse_day_hours(hours_str: str) -> List[Tuple[int, int]]:
+    """Parse '09:00-12:00 | 14:00-17:00' (also ',' or ';' separated) into (start, end) seconds of day"""
+    ranges = []
+    for part in _RANGE_SEPARATORS.split((hours_str or "").strip()):
+        match = _RANGE.match(part.strip())
+        if not match:
+            continue
+        h1, m1, h2, m2 = (int(g) for g in match.groups())
+        start = h1 * 3600 + m1 * 60
+        end = h2 * 3600 + m2 * 60
+        if end <= start:
+            end += SECONDS_PER_DAY  # runs past midnight
+        ranges.append((start, end))
+    return ranges
+
+
+def format_clock(seconds_of_day: int) -> str:
+    seconds_of_day %= SECONDS_PER_DAY
+    return f"{seconds_of_day // 3600:02d}:{(seconds_of_day % 3600) // 60:02d}"
+
+
+class BettingSchedule:
+    """Sorted weekly interval table with O(log n) open/close queries"""
+
+    def __init__(self, weekly_hours: Optional[Dict[int, str]] = None, timezone: Optional[str] = None):
+        self.weekly_hours = {int(k): v for k, v in (weekly_hours or DEFAULT_WEEKLY_HOURS).items()}
+        self.tz = pytz.timezone(timezone) if (timezone and PYTZ_AVAILABLE) else None
+        self.day_ranges = {day: parse_day_hours(self.weekly_hours.get(day, "")) for day in range(7)}
+        self.starts, self.ends = self._compile()
+
+    def _compile(self) -> Tuple[List[int], List[int]]:
+        intervals = []
+        for day, ranges in self.day_ranges.items():
+            for start, end in ranges:
+                start += day * SECONDS_PER_DAY
+                end += day * SECONDS_PER_DAY
+                if end > SECONDS_PER_WEEK:  # Sunday night into Monday
+                    intervals.append((start, SECONDS_PER_WEEK))
+                    intervals.append((0, end - SECONDS_PER_WEEK))
+                else:
+                    intervals.append((start, end))
+        intervals.sort()
+
+        merged = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [s for s, _ in merged], [e for _, e in merged]
+
+    def now(self) -> datetime:
+        return datetime.now(self.tz) if self.tz else datetime.now()
+
+    def _week_offset(self, now: Optional[datetime] = None) -> int:
+        now = now or self.now()
+        if self.tz and now.tzinfo is not None:
+            now = now.astimezone(self.tz)
+        return now.weekday() * SECONDS_PER_DAY + now.hour * 3600 + now.minute * 60 + now.second
+
+    def _interval_at(self, offset: int) -> int:
+        """Index of the interval containing offset, or -1"""
+        i = bisect.bisect_right(self.starts, offset) - 1
+        if i >= 0 and offset < self.ends[i]:
+            return i
+        return -1
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        if not self.starts:
+            return False
+        return self._interval_at(self._week_offset(now)) >= 0
+
+    def seconds_until_open(self, now: Optional[datetime] = None) -> Optional[float]:
+        """0 if open now, None if the schedule never opens"""
+        if not self.starts:
+            return None
+        offset = self._week_offset(now)
+        if self._interval_at(offset) >= 0:
+            return 0.0
+        i = bisect.bisect_right(self.starts, offset)
+        if i < len(self.starts):
+            return float(self.starts[i] - offset)
+        return float(SECONDS_PER_WEEK - offset + self.starts[0])
+
+    def seconds_until_close(self, now: Optional[datetime] = None) -> Optional[float]:
+        """0 if closed now, None if open around the clock"""
+        if not self.starts:
+            return 0.0
+        if self.starts[0] == 0 and self.ends[-1] == SECONDS_PER_WEEK and len(self.starts) == 1:
+            return None
+        offset = self._week_offset(now)
+        i = self._interval_at(offset)
+        if i < 0:
+            return 0.0
+        end = self.ends[i]
+        if end == SECONDS_PER_WEEK and self.starts[0] == 0:
+            end += self.ends[0]  # continues into Monday
+        return float(end - offset)
+
+    def next_transition(self, now: Optional[datetime] = None) -> Tuple[bool, Optional[float]]:
+        """(open_now, seconds until that changes)"""
+        if self.is_open(now):
+            return True, self.seconds_until_close(now)
+        return False, self.seconds_until_open(now)
+
+    def hours_for_day(self, weekday: Optional[int] = None) -> str:
+        """Normalized 'HH:MM-HH:MM | ...' string for a weekday (default today)"""
+        if weekday is None:
+            weekday = self.now().weekday()
+        ranges = sorted(self.day_ranges.get(weekday, []))
+        return " | ".join(f"{format_clock(s)}-{format_clock(e)}" for s, e in ranges)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "never"
+    return str(timedelta(seconds=int(seconds)))
@@ -0,0 +1,173 @@
+# osenaabo_simulator.py
+"""
+Monte Carlo risk simulator for OSENAABO! GUI.
+
+Draws synthetic crash-multiplier days from a configurable distribution (or
+resamples recorded multipliers), runs them through the backtester's staking
+kernel in batches, then chains the simulated days into multi-day paths to
+estimate risk of ruin and how many days it takes to reach the daily target.
+"""
+
+import sys
+import argparse
+from typing import Dict, Any, Optional, Sequence
+
+import numpy as np
+
+from osenaabo_backtest import (
+    simulate_days, make_grid, load_multiplier_days,
+    BASE_BET_FRACTION, DAILY_TARGET_PERCENT, DEFAULT_STOP_LOSS, DEFAULT_CASHOUT,
+)
+
+DEFAULT_HOUSE_EDGE = 0.03
+DEFAULT_CASHOUT2 = 3.0
+MIN_EMPIRICAL_SAMPLE = 200  # fewer recorded rounds than this fall back to the crash model
+MAX_MULTIPLIER = 10000.0
+
+DEFAULT_SIM_DAYS = 20000
+DEFAULT_ROUNDS_PER_DAY = 500
+DEFAULT_HORIZON_DAYS = 30
+DEFAULT_RUIN_LEVEL = 0.5  # path is ruined once capital falls to half
+BATCH_ELEMENTS = 2_000_000
+
+
+def draw_multipliers(rng, shape, distribution: str = "crash", house_edge: float = DEFAULT_HOUSE_EDGE,
+                     sigma: float = 1.0, sample: Optional[Sequence[float]] = None):
+    """
+    Draw crash multipliers.
+
+    crash:     provably-fair style, P(m >= x) = (1 - house_edge) / x, floored to 0.01
+    lognormal: 1 + lognormal(0, sigma)
+    empirical: resample from an observed sample (e.g. MultiplierRing values)
+    """
+    if distribution == "crash":
+        u = rng.random(shape)
+        m = np.floor(100.0 * (1.0 - house_edge) / np.maximum(u, 1e-12)) / 100.0
+        return np.clip(m, 1.0, MAX_MULTIPLIER)
+    if distribution == "lognormal":
+        return np.minimum(1.0 + rng.lognormal(0.0, sigma, shape), MAX_MULTIPLIER)
+    if distribution == "empirical":
+        observed = np.asarray(sample if sample is not None else [], dtype=np.float64)
+        if not len(observed):
+            raise ValueError("empirical distribution needs a non-empty sample")
+        return rng.choice(observed, size=shape)
+    raise ValueError(f"unknown distribution: {distribution}")
+
+
+def strategy_from_config(config: Optional[Dict[str, Any]], block2_enabled: bool = True) -> Dict[str, float]:
+    """
+    cashout, cashout2 and base_fraction as configured in config.json
+    ("cashout", "cashout2", "base_fraction"); cashout2 is 0 with Block 2 off
+    """
+    config = config or {}
+    return {
+        "cashout": float(config.get("cashout", DEFAULT_CASHOUT)),
+        "cashout2": float(config.get("cashout2", DEFAULT_CASHOUT2)) if block2_enabled else 0.0,
+        "base_fraction": float(config.get("base_fraction", BASE_BET_FRACTION)),
+    }
+
+
+def run_simulation(n_days: int = DEFAULT_SIM_DAYS, rounds_per_day: int = DEFAULT_ROUNDS_PER_DAY,
+                   cashout: float = DEFAULT_CASHOUT, cashout2: float = 0.0,
+                   base_fraction: float = BASE_BET_FRACTION, stop_loss: float = DEFAULT_STOP_LOSS,
+                   target: float = DAILY_TARGET_PERCENT, horizon_days: int = DEFAULT_HORIZON_DAYS,
+                   ruin_level: float = DEFAULT_RUIN_LEVEL, distribution: str = "crash",
+                   seed: Optional[int] = None, **dist_kwargs) -> Dict[str, Any]:
+    """Simulate n_days trading days and summarize risk over horizon_days paths"""
+    rng = np.random.default_rng(seed)
+    params = make_grid([cashout], [cashout2], [base_fraction], [stop_loss], [target])
+    batch_days = max(1, BATCH_ELEMENTS // max(rounds_per_day, 1))
+
+    returns, stop_hit, target_hit, target_rounds = [], [], [], []
+    for start in range(0, n_days, batch_days):
+        size = min(batch_days, n_days - start)
+        days = draw_multipliers(rng, (size, rounds_per_day), distribution, **dist_kwargs)
+        result = simulate_days(days, params)
+        returns.append(result["day_return"][0])
+        stop_hit.append(result["stop_hit"][0])
+        target_hit.append(result["target_hit"][0])
+        target_rounds.append(result["rounds"][0][result["target_hit"][0]])
+    returns = np.concatenate(returns)
+    stop_hit = np.concatenate(stop_hit)
+    target_hit = np.concatenate(target_hit)
+    target_rounds = np.concatenate(target_rounds)
+
+    # Chain days into paths of horizon_days
+    n_paths = max(1, n_days // horizon_days)
+    usable = n_paths * horizon_days
+    if usable > len(returns):
+        n_paths, usable = 1, len(returns)
+        horizon_days = usable
+    path_returns = returns[:usable].reshape(n_paths, horizon_days)
+    path_targets = target_hit[:usable].reshape(n_paths, horizon_days)
+    equity = np.cumprod(1.0 + path_returns, axis=1)
+    ruined = (equity <= ruin_level).any(axis=1)
+
+    reached = path_targets.any(axis=1)
+    days_to_target = np.where(reached, path_targets.argmax(axis=1) + 1, -1)
+    reached_days = days_to_target[reached]
+    histogram = np.bincount(reached_days, minlength=horizon_days + 1)[1:] if len(reached_days) else np.zeros(horizon_days, dtype=np.int64)
+
+    return {
+        "days": int(len(returns)),
+        "paths": int(n_paths),
+        "horizon_days": int(horizon_days),
+        "risk_of_ruin": float(ruined.mean()),
+        "stop_loss_day_rate": float(stop_hit.mean()),
+        "target_day_rate": float(target_hit.mean()),
+        "mean_daily_return_pct": float(returns.mean() * 100.0),
+        "final_capital_median": float(np.median(equity[:, -1])),
+        "target_reached_rate": float(reached.mean()),
+        "days_to_target_median": float(np.median(reached_days)) if len(reached_days) else None,
+        "days_to_target_p90": float(np.percentile(reached_days, 90)) if len(reached_days) else None,
+        "days_to_target_histogram": histogram,
+        "rounds_to_target_median": float(np.median(target_rounds)) if len(target_rounds) else None,
+    }
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    """One-line summary for the config panel"""
+    median = result["days_to_target_median"]
+    to_target = f"{median:.0f} day(s) median" if median is not None else "not reached"
+    return (f"Risk of ruin ({result['horizon_days']}d): {result['risk_of_ruin']:.1%} | "
+            f"Stop-loss days: {result['stop_loss_day_rate']:.1%} | "
+            f"Target days: {result['target_day_rate']:.1%} | To target: {to_target}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo risk simulation for OSENAABO! settings")
+    parser.add_argument("--days", type=int, default=DEFAULT_SIM_DAYS)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS_PER_DAY, help="rounds per day")
+    parser.add_argument("--cashout", type=float, default=DEFAULT_CASHOUT)
+    parser.add_argument("--cashout2", type=float, default=0.0)
+    parser.add_argument("--base-fraction", type=float, default=BASE_BET_FRACTION)
+    parser.add_argument("--stop-loss", type=float, default=DEFAULT_STOP_LOSS)
+    parser.add_argument("--target", type=float, default=DAILY_TARGET_PERCENT)
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON_DAYS)
+    parser.add_argument("--distribution", choices=["crash", "lognormal", "empirical"], default="crash")
+    parser.add_argument("--house-edge", type=float, default=DEFAULT_HOUSE_EDGE)
+    parser.add_argument("--sample", nargs="+", default=[],
+                        help="recorded multipliers for --distribution empirical (.npz snapshots, .osj journals, text)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    dist_kwargs = {"house_edge": args.house_edge} if args.distribution == "crash" else {}
+    if args.distribution == "empirical":
+        days = load_multiplier_days(args.sample)
+        sample = np.concatenate(days) if days else np.zeros(0)
+        if not len(sample):
+            parser.error("--distribution empirical needs --sample files with recorded multipliers")
+        print(f"Resampling {len(sample):,} recorded multipliers")
+        dist_kwargs = {"sample": sample}
+    result = run_simulation(args.days, args.rounds, args.cashout, args.cashout2, args.base_fraction,
+                            args.stop_loss, args.target, args.horizon, distribution=args.distribution,
+                            seed=args.seed, **dist_kwargs)
+    print(format_summary(result))
+    for key, value in result.items():
+        if key != "days_to_target_histogram":
+            print(f"  {key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+# osenaabo_telegram.py
+"""
+Telegram notification service for OSENAABO! GUI.
+
+Messages are queued on a bounded outbound queue and delivered by a worker
+thread over a pooled requests.Session, so neither the Tk thread nor the bot
+thread ever waits on the network. Delivery is rate limited per chat and
+retried with exponential backoff on 429, 5xx and connection errors.
+Pass api_base to point the notifier at a local stub server for testing.
+"""
+
+import time
+import queue
+import threading
+from typing import Optional, Callable, Dict, Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+TELEGRAM_API_BASE = "https://api.telegram.org"
+DEFAULT_MAX_QUEUE = 100
+DEFAULT_MESSAGES_PER_SECOND = 1.0  # Telegram allows about one message per second per chat
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_TIMEOUT = 10
+POOL_SIZE = 4
+
+# callback(success, description)
+DeliveryCallback = Callable[[bool, str], None]
+
+
+class TelegramNotifier:
+    """Queued, pooled, rate-limited sender for Telegram sendMessage"""
+
+    def __init__(self, bot_token: str = "", chat_id: str = "", api_base: str = TELEGRAM_API_BASE,
+                 max_queue: int = DEFAULT_MAX_QUEUE, messages_per_second: float = DEFAULT_MESSAGES_PER_SECOND,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.bot_token = bot_token
+        self.chat_id = chat_id
+        self.api_base = api_base.rstrip("/")
+        self.min_interval = 1.0 / messages_per_second if messages_per_second > 0 else 0.0
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._queue = queue.Queue(max_queue)
+        self._next_allowed: Dict[str, float] = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._metrics = {
+            "queued": 0,
+            "sent": 0,
+            "failed": 0,
+            "retried": 0,
+            "dropped": 0,
+            "rate_limited": 0,
+            "total_latency": 0.0,
+        }
+
+    def update_credentials(self, bot_token: str, chat_id: str):
+        self.bot_token = bot_token
+        self.chat_id = chat_id
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._worker, name="osenaabo-telegram", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self.session.close()
+
+    def send(self, text: str, chat_id: Optional[str] = None, parse_mode: str = "HTML",
+             callback: Optional[DeliveryCallback] = None) -> bool:
+        """Queue a message; returns False if the outbound queue is full"""
+        item = {
+            "chat_id": chat_id or self.chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+            "callback": callback,
+            "queued_at": time.monotonic(),
+        }
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._count("dropped")
+            if callback:
+                callback(False, "Notification queue full")
+            return False
+        self._count("queued")
+        if not self._thread or not self._thread.is_alive():
+            self.start()
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        delivered = metrics["sent"]
+        metrics["avg_latency"] = metrics.pop("total_latency") / delivered if delivered else 0.0
+        metrics["depth"] = self._queue.qsize()
+        return metrics
+
+    def _count(self, key: str, amount=1):
+        with self._lock:
+            self._metrics[key] += amount
+
+    def _worker(self):
+        while not self._stop_event.is_set():
+            item = self._queue.get()
+            if item is None:
+                break
+            success, description = self._deliver(item)
+            if success:
+                self._count("sent")
+                self._count("total_latency", time.monotonic() - item["queued_at"])
+            else:
+                self._count("failed")
+            callback = item.get("callback")
+            if callback:
+                try:
+                    callback(success, description)
+                except Exception as e:
+                    print(f"Telegram callback error: {e}")
+
+    def _wait_for_slot(self, chat_id: str) -> bool:
+        """Sleep until this chat may send again; False if stopping"""
+        delay = self._next_allowed.get(chat_id, 0.0) - time.monotonic()
+        if delay > 0:
+            self._count("rate_limited")
+            if self._stop_event.wait(delay):
+                return False
+        self._next_allowed[chat_id] = time.monotonic() + self.min_interval
+        return True
+
+    def _deliver(self, item) -> Tuple[bool, str]:
+        if not self.bot_token or not item["chat_id"]:
+            return False, "Missing Bot Token or Chat ID"
+        url = f"{self.api_base}/bot{self.bot_token}/sendMessage"
+        payload = {"chat_id": item["chat_id"], "text": item["text"], "parse_mode": item["parse_mode"]}
+        description = "Unknown error"
+
+        for attempt in range(self.max_retries + 1):
+            if not self._wait_for_slot(item["chat_id"]):
+                return False, "Notifier stopped"
+            retry_delay = self.backoff * (2 ** attempt)
+            try:
+                response = self.session.post(url, data=payload, timeout=self.timeout)
+                if response.status_code == 200:
+                    return True, "Sent"
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = {}
+                description = body.get("description", f"HTTP {response.status_code}")
+                if response.status_code == 429:
+                    retry_delay = max(retry_delay, body.get("parameters", {}).get("retry_after", 0))
+                elif response.status_code < 500:
+                    return False, description  # bad token/chat id, retrying won't help
+            except requests.RequestException as e:
+                description = str(e)
+
+            if attempt < self.max_retries:
+                self._count("retried")
+                if self._stop_event.wait(retry_delay):
+                    return False, "Notifier stopped"
+        return False, description
+
+
+DEFAULT_DIGEST_WINDOW = 300  # seconds
+
+
+class TelegramDigest:
+    """
+    Aggregates round events into one summary message per window.
+
+    send is called with the formatted text (e.g. OsenaaboApp.notify). Urgent
+    events such as stop-loss or target reached bypass the window. With
+    enabled=False every round event is sent on its own.
+    """
+
+    def __init__(self, send: Callable[[str], None], window: float = DEFAULT_DIGEST_WINDOW, enabled: bool = True):
+        self.send = send
+        self.window = max(1.0, float(window))
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._reset()
+
+    def _reset(self):
+        self.started_at = time.time()
+        self.wins = 0
+        self.losses = 0
+        self.profit = 0.0
+        self.best_round = None
+        self.worst_round = None
+        self.sessions = []
+
+    def configure(self, enabled: bool, window: float):
+        self.enabled = enabled
+        self.window = max(1.0, float(window))
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="osenaabo-digest", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the timer and send whatever has accumulated"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+        self.flush()
+
+    def record_round(self, won: bool, profit_delta: float):
+        if not self.enabled:
+            self.send(f"{'✅ Win' if won else '❌ Loss'}: ₦{profit_delta:+,.2f}")
+            return
+        with self._lock:
+            if won:
+                self.wins += 1
+            else:
+                self.losses += 1
+            self.profit += profit_delta
+            if self.best_round is None or profit_delta > self.best_round:
+                self.best_round = profit_delta
+            if self.worst_round is None or profit_delta < self.worst_round:
+                self.worst_round = profit_delta
+
+    def record_session(self, session_record: Dict[str, Any]):
+        """Record an add_session_record() entry"""
+        if not self.enabled:
+            self.send(self._format_session(session_record))
+            return
+        with self._lock:
+            self.sessions.append(session_record)
+
+    def urgent(self, text: str):
+        """Send immediately, outside the digest window"""
+        self.send(f"🚨 {text}")
+
+    def flush(self) -> bool:
+        """Send the accumulated summary now; returns False if there was nothing to send"""
+        with self._lock:
+            if not (self.wins or self.losses or self.sessions):
+                self.started_at = time.time()
+                return False
+            text = self.format_summary()
+            self._reset()
+        self.send(text)
+        return True
+
+    def format_summary(self) -> str:
+        minutes = max(1, int(round((time.time() - self.started_at) / 60)))
+        rounds = self.wins + self.losses
+        lines = [f"📊 OSENAABO! digest (last {minutes} min)"]
+        if rounds:
+            lines.append(f"Rounds: {rounds} | Wins: {self.wins} | Losses: {self.losses} "
+                         f"({self.wins / rounds:.0%} win rate)")
+            lines.append(f"Profit: ₦{self.profit:+,.2f}")
+            lines.append(f"Best: ₦{self.best_round:+,.2f} | Worst: ₦{self.worst_round:+,.2f}")
+        for record in self.sessions:
+            lines.append(self._format_session(record))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_session(record: Dict[str, Any]) -> str:
+        flag = " 🎯 target reached" if record.get("target_reached") else ""
+        return (f"Session saved: profit ₦{record.get('profit', 0):+,.2f}, "
+                f"capital ₦{record.get('capital_after', 0):,.2f}{flag}")
+
+    def _run(self):
+        while not self._stop_event.wait(self.window):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Telegram digest error: {e}")
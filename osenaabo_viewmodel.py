@@ -0,0 +1,89 @@
+# osenaabo_viewmodel.py
+"""
+Status view-model for OSENAABO! GUI.
+
+The engine and input handlers publish status values by key from any thread;
+the Tk thread applies only the latest value per widget at a capped frame
+rate, skipping values that were superseded or are already on screen.
+"""
+
+import threading
+from typing import Any, Callable, Dict
+
+DEFAULT_MAX_FPS = 20
+
+
+class StatusViewModel:
+    """Latest-value store for status widgets, rendered at most max_fps times a second"""
+
+    def __init__(self, max_fps: int = DEFAULT_MAX_FPS):
+        self.max_fps = max(1, int(max_fps))
+        self._pending: Dict[str, Any] = {}
+        self._rendered: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+        self.applied = 0
+        self.superseded = 0  # overwritten before the next frame
+        self.unchanged = 0   # identical to what is already rendered
+        self.failed = 0      # renderer raised; the other keys still render
+
+    @property
+    def interval_ms(self) -> int:
+        return max(1, 1000 // self.max_fps)
+
+    def publish(self, key: str, value: Any):
+        """Record the newest value for a widget (safe from any thread)"""
+        with self._lock:
+            self.published += 1
+            if key in self._pending:
+                self.superseded += 1
+            self._pending[key] = value
+
+    def get(self, key: str, default=None):
+        """Latest value for a key, pending or rendered"""
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            return self._rendered.get(key, default)
+
+    def apply(self, renderers: Dict[str, Callable[[Any], None]]) -> int:
+        """Render dirty keys on the Tk thread; returns how many widgets changed"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        changed = 0
+        for key, value in pending.items():
+            if key in self._rendered and self._rendered[key] == value:
+                with self._lock:
+                    self.unchanged += 1
+                continue
+            renderer = renderers.get(key)
+            if renderer is None:
+                continue
+            try:
+                renderer(value)
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                print(f"Status render error for {key}: {e}")
+                continue
+            self._rendered[key] = value
+            changed += 1
+        if changed:
+            with self._lock:
+                self.applied += changed
+        return changed
+
+    @property
+    def skipped(self) -> int:
+        return self.superseded + self.unchanged
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "published": self.published,
+                "applied": self.applied,
+                "superseded": self.superseded,
+                "unchanged": self.unchanged,
+                "failed": self.failed,
+                "skipped": self.superseded + self.unchanged,
+            }
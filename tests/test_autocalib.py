@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+import osenaabo_autocalib as autocalib
+
+STATIC = {
+    "Block1_AutoToggle": {"x": 40, "y": 300, "width": 60, "height": 30},
+    "Block1_AutoCashToggle": {"x": 40, "y": 360, "width": 60, "height": 30},
+    "Block1_BetButton": {"x": 260, "y": 300, "width": 120, "height": 80},
+    "Block2_AutoToggle": {"x": 440, "y": 300, "width": 60, "height": 30},
+    "Block2_AutoCashToggle": {"x": 440, "y": 360, "width": 60, "height": 30},
+    "Block2_BetButton": {"x": 660, "y": 300, "width": 120, "height": 80},
+}
+DYNAMIC = {
+    "Block1_History": {"x": 40, "y": 40, "width": 700, "height": 24},
+    "Block1_StakeInput": {"x": 120, "y": 300, "width": 100, "height": 30},
+    "Block1_AutoCashInput": {"x": 120, "y": 360, "width": 100, "height": 30},
+    "Block2_StakeInput": {"x": 520, "y": 300, "width": 100, "height": 30},
+    "Block2_AutoCashInput": {"x": 520, "y": 360, "width": 100, "height": 30},
+}
+
+
+def _screen(shift=(0, 0), seed=0):
+    """Flat background with a distinct texture in every static region"""
+    rng = np.random.default_rng(1)
+    screen = np.full((480, 900), 40, dtype=np.uint8)
+    dx, dy = shift
+    for box in STATIC.values():
+        patch = rng.integers(0, 255, (box["height"], box["width"]), dtype=np.uint8)
+        screen[box["y"] + dy:box["y"] + dy + box["height"], box["x"] + dx:box["x"] + dx + box["width"]] = patch
+    # Dynamic regions hold different content on every capture
+    noise = np.random.default_rng(seed)
+    for box in DYNAMIC.values():
+        screen[box["y"] + dy:box["y"] + dy + box["height"], box["x"] + dx:box["x"] + dx + box["width"]] = \
+            noise.integers(0, 255, (box["height"], box["width"]), dtype=np.uint8)
+    return screen
+
+
+def test_dynamic_regions_are_placed_from_saved_offsets(tmp_path):
+    coords = dict(STATIC, **DYNAMIC)
+    template_dir = str(tmp_path / "SportyBetNg")
+    autocalib.save_region_templates(_screen(), coords, template_dir)
+
+    proposals = autocalib.locate_regions(_screen(shift=(30, 20), seed=7), autocalib.load_templates(template_dir),
+                                         scales=(1.0,), offsets=autocalib.load_offsets(template_dir))
+
+    assert set(proposals) == set(coords)
+    for name, box in DYNAMIC.items():
+        placed = autocalib.proposals_to_coords(proposals)[name]
+        assert placed == {"x": box["x"] + 30, "y": box["y"] + 20, "width": box["width"], "height": box["height"]}
+    assert proposals["Block1_StakeInput"]["anchor"] == "Block1_BetButton"
+
+
+def test_dynamic_region_falls_back_to_next_anchor():
+    offsets = {"Block2_StakeInput": [{"anchor": "Block2_BetButton", "dx": -140, "dy": 0, "width": 100, "height": 30},
+                                     {"anchor": "Block2_AutoToggle", "dx": 80, "dy": 0, "width": 100, "height": 30}]}
+    found = {"Block2_AutoToggle": {"x": 100, "y": 50, "width": 60, "height": 30, "score": 0.95, "scale": 1.1}}
+
+    placed = autocalib.place_dynamic_regions(found, offsets)
+
+    assert placed["Block2_StakeInput"]["anchor"] == "Block2_AutoToggle"
+    assert (placed["Block2_StakeInput"]["x"], placed["Block2_StakeInput"]["width"]) == (188, 110)
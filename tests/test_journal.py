@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pytest
+
+from osenaabo_journal import (RoundJournal, read_journal, get_journal_file, summarize, HEADER, RECORD,
+                              BLOCK1_BET, BLOCK1_WIN, BLOCK2_BET, BLOCK2_WIN)
+
+
+def test_rounds_round_trip(tmp_path):
+    path = get_journal_file(str(tmp_path), "SportyBetNg")
+    journal = RoundJournal(path)
+    journal.append(2.5, block1_stake=1000.0, cashout1=2.0, block2_stake=1000.0, cashout2=3.0, timestamp=100.0)
+    journal.append(1.2, block1_stake=1000.0, cashout1=2.0, timestamp=101.0)
+    journal.append(4.0, timestamp=102.0)
+    journal.close()
+
+    rounds = read_journal(path)
+
+    assert os.path.basename(path) == "rounds_SportyBetNg.osj"
+    assert list(rounds["timestamp"]) == [100.0, 101.0, 102.0]
+    assert np.allclose(rounds["multiplier"], [2.5, 1.2, 4.0])
+    assert list(rounds["block1_stake"]) == [1000.0, 1000.0, 0.0]
+    assert list(rounds["block2_stake"]) == [1000.0, 0.0, 0.0]
+    assert np.allclose(rounds["cashout1"], [2.0, 2.0, 0.0])
+    assert np.allclose(rounds["cashout2"], [3.0, 0.0, 0.0])
+    assert list(rounds["outcome"]) == [BLOCK1_BET | BLOCK1_WIN | BLOCK2_BET, BLOCK1_BET, 0]
+    assert list(rounds["profit"]) == [0.0, -1000.0, 0.0]
+    assert summarize(rounds)["block1_wins"] == 1
+
+
+def test_torn_record_is_trimmed_on_reopen(tmp_path):
+    path = str(tmp_path / "rounds.osj")
+    journal = RoundJournal(path)
+    journal.append(1.5, timestamp=1.0)
+    journal.close()
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD.size // 2))
+
+    assert len(read_journal(path)) == 1
+    journal = RoundJournal(path)
+    journal.append(3.0, block2_stake=10.0, cashout2=2.0, timestamp=2.0)
+    journal.close()
+
+    rounds = read_journal(path)
+    assert os.path.getsize(path) == HEADER.size + 2 * RECORD.size
+    assert list(rounds["outcome"]) == [0, BLOCK2_BET | BLOCK2_WIN]
+    assert list(rounds["profit"]) == [0.0, 10.0]
+
+
+def test_engine_journals_the_stakes_it_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    from osenaabo_engine import BotEngine
+
+    engine = BotEngine(100000.0, 20.0, coords={}, log=lambda msg: None,
+                       strategy={"cashout": 2.0, "cashout2": 3.0, "base_fraction": 0.001})
+    engine.settle_round(2.4)
+    engine.settle_round(1.1)
+    engine.journal.close()
+
+    rounds = read_journal(engine.journal.path)
+    assert engine.journal.path == str(tmp_path / "Osenaabo" / "sessions" / "rounds.osj")
+    assert list(rounds["block1_stake"]) == [100.0, 100.0]
+    assert list(rounds["block2_stake"]) == [100.0, 100.0]
+    assert np.allclose(rounds["cashout1"], [2.0, 2.0])
+    assert np.allclose(rounds["cashout2"], [3.0, 3.0])
+    assert list(rounds["profit"]) == [0.0, -200.0]
+    assert engine.capital == pytest.approx(99800.0)
+    assert engine.status()["profit"] == pytest.approx(-200.0)
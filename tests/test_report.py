@@ -0,0 +1,57 @@
+import csv
+import json
+import os
+
+import pytest
+
+from osenaabo_report import generate_report
+
+
+def _write_day(sessions_dir, day, sessions):
+    path = os.path.join(sessions_dir, f"session_{day}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"date": day, "sessions": sessions}, f)
+
+
+def _rows(out_dir, name):
+    with open(os.path.join(out_dir, f"{name}.csv"), newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_weekly_drawdown_spans_losing_days(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    capital = 1000.0
+    # Monday to Wednesday of one ISO week, each day losing 10%
+    for day in ("2026-03-02", "2026-03-03", "2026-03-04"):
+        loss = capital * 0.1
+        capital -= loss
+        _write_day(str(sessions_dir), day, [{"timestamp": f"{day}T12:00:00", "profit": -loss,
+                                             "capital_after": capital, "target_reached": False}])
+
+    summary = generate_report(str(sessions_dir), str(tmp_path / "reports"))
+
+    expected = (1 - 0.9 ** 3) * 100.0  # 27.1%
+    assert summary["max_drawdown_percent"] == pytest.approx(expected)
+    weekly = _rows(str(tmp_path / "reports"), "weekly")
+    monthly = _rows(str(tmp_path / "reports"), "monthly")
+    assert len(weekly) == 1
+    assert float(weekly[0]["max_drawdown_percent"]) == pytest.approx(expected, abs=1e-3)
+    assert float(monthly[0]["max_drawdown_percent"]) == pytest.approx(expected, abs=1e-3)
+    for row in _rows(str(tmp_path / "reports"), "daily"):
+        assert float(row["max_drawdown_percent"]) == pytest.approx(10.0, abs=1e-3)
+
+
+def test_weekly_drawdown_resets_after_new_peak(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    # 1000 -> 900 -> 1200 -> 1080: the worst fall is 10% from either peak
+    for day, profit, capital in (("2026-03-02", -100.0, 900.0), ("2026-03-03", 300.0, 1200.0),
+                                 ("2026-03-04", -120.0, 1080.0)):
+        _write_day(str(sessions_dir), day, [{"timestamp": f"{day}T12:00:00", "profit": profit,
+                                             "capital_after": capital, "target_reached": profit > 0}])
+
+    generate_report(str(sessions_dir), str(tmp_path / "reports"))
+
+    weekly = _rows(str(tmp_path / "reports"), "weekly")
+    assert float(weekly[0]["max_drawdown_percent"]) == pytest.approx(10.0, abs=1e-3)
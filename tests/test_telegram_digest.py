@@ -0,0 +1,63 @@
+import osenaabo_core as core
+from osenaabo_telegram import TelegramDigest
+
+
+def test_digest_collects_rounds_and_sessions_until_flush():
+    sent = []
+    digest = TelegramDigest(sent.append, window=300)
+
+    digest.record_round(True, 1000.0)
+    digest.record_round(True, 500.0)
+    digest.record_round(False, -2000.0)
+    digest.record_session({"profit": -500.0, "capital_after": 99500.0, "target_reached": False})
+    assert sent == []
+
+    assert digest.flush()
+    assert len(sent) == 1
+    summary = sent[0]
+    assert "Rounds: 3 | Wins: 2 | Losses: 1" in summary
+    assert "Profit: ₦-500.00" in summary
+    assert "Best: ₦+1,000.00 | Worst: ₦-2,000.00" in summary
+    assert "Session saved: profit ₦-500.00, capital ₦99,500.00" in summary
+    assert not digest.flush()
+
+
+def test_urgent_is_sent_immediately():
+    sent = []
+    digest = TelegramDigest(sent.append, window=300)
+    digest.record_round(False, -100.0)
+
+    digest.urgent("Stop loss hit (20.00%). Capital: ₦80,000.00")
+
+    assert sent == ["🚨 Stop loss hit (20.00%). Capital: ₦80,000.00"]
+
+
+def test_engine_events_reach_the_digest(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    from osenaabo_engine import BotEngine
+
+    sent = []
+    digest = TelegramDigest(sent.append, window=300)
+    engine = BotEngine(100000.0, 1.0, coords={}, log=lambda msg: None,
+                       strategy={"cashout": 2.0, "cashout2": 0.0, "base_fraction": 0.004})
+    # Wired the way OsenaaboApp wires its record_round_result/record_session/notify_stop_loss
+    engine.on_round = digest.record_round
+    engine.on_session = digest.record_session
+    engine.on_stop_loss = lambda capital, loss: digest.urgent(f"Stop loss hit ({loss:.2f}%)")
+
+    engine.settle_round(3.0)   # +400
+    engine.settle_round(1.2)   # -400
+    engine.settle_round(1.1)   # -400
+    assert sent == []
+    engine.settle_round(1.0)   # -400 -> 0.8% down
+    engine.settle_round(1.5)   # -400 -> 1.2% down: stop loss
+    engine.journal.close()
+
+    assert engine.finished
+    assert sent == ["🚨 Stop loss hit (1.20%)"]
+    session = core.load_today_session()
+    assert session["sessions"][-1]["capital_after"] == 98800.0
+
+    digest.flush()
+    assert "Rounds: 5 | Wins: 1 | Losses: 4" in sent[-1]
+    assert "Session saved: profit ₦-1,200.00, capital ₦98,800.00" in sent[-1]